@@ -9,6 +9,8 @@ from .base import (
     BaseVectorStore,
     BaseVectorStoreParams,
     Document,
+    IngestionProgress,
+    ingest,
 )
 
 __all__ = [
@@ -20,5 +22,7 @@ __all__ = [
     "BaseVectorStore",
     "BaseVectorStoreParams",
     "Document",
+    "IngestionProgress",
     "TextChunker",
+    "ingest",
 ]
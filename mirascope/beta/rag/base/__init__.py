@@ -5,6 +5,7 @@ from .document import Document
 from .embedders import BaseEmbedder
 from .embedding_params import BaseEmbeddingParams
 from .embedding_response import BaseEmbeddingResponse
+from .ingestion import IngestionProgress, ingest
 from .query_results import BaseQueryResults
 from .vectorstore_params import BaseVectorStoreParams
 from .vectorstores import BaseVectorStore
@@ -18,5 +19,7 @@ __all__ = [
     "BaseVectorStore",
     "BaseVectorStoreParams",
     "Document",
+    "IngestionProgress",
     "TextChunker",
+    "ingest",
 ]
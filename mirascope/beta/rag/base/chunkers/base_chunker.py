@@ -1,6 +1,8 @@
 """Chunkers for the RAG module."""
 
+import os
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 
 from pydantic import BaseModel
 
@@ -35,3 +37,13 @@ class BaseChunker(BaseModel, ABC):
     def chunk(self, text: str) -> list[Document]:
         """Returns a Document that contains an id, text, and optionally metadata."""
         ...
+
+    def chunk_file(self, path: str | os.PathLike[str]) -> Iterator[Document]:
+        """Lazily chunks a (UTF-8) text file.
+
+        By default, this reads the whole file and chunks it with `chunk`, so memory use
+        is bounded by the size of the file. Chunkers that can split text incrementally
+        override it to read the file in pieces.
+        """
+        with open(path, encoding="utf-8") as file:
+            yield from self.chunk(file.read())
@@ -1,6 +1,8 @@
 """Text chunker for the RAG module"""
 
+import os
 import uuid
+from collections.abc import Iterator
 
 from ..document import Document
 from .base_chunker import BaseChunker
@@ -31,3 +33,22 @@ class TextChunker(BaseChunker):
             chunks.append(Document(text=text[start:end], id=str(uuid.uuid4())))
             start += self.chunk_size - self.chunk_overlap
         return chunks
+
+    def chunk_file(self, path: str | os.PathLike[str]) -> Iterator[Document]:
+        """Lazily chunks a (UTF-8) text file, reading it in pieces.
+
+        The chunks are the same as those of `chunk` on the whole text, but only the
+        current piece and the overlap are kept in memory.
+        """
+        step = self.chunk_size - self.chunk_overlap
+        buffer = ""
+        with open(path, encoding="utf-8") as file:
+            while piece := file.read(max(self.chunk_size, 1 << 16)):
+                buffer += piece
+                start = 0
+                while len(buffer) - start >= self.chunk_size:
+                    end = start + self.chunk_size
+                    yield Document(text=buffer[start:end], id=str(uuid.uuid4()))
+                    start += step
+                buffer = buffer[start:]
+        yield from self.chunk(buffer)
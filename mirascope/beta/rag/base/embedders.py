@@ -1,19 +1,33 @@
 """Embedders for the RAG module."""
 
+import asyncio
+import os
+import threading
+import weakref
 from abc import ABC, abstractmethod
-from typing import ClassVar, Generic, TypeVar
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import ClassVar, Generic, Literal, TypeVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 from .config import BaseConfig
 from .embedding_params import BaseEmbeddingParams
 from .embedding_response import BaseEmbeddingResponse
 
 BaseEmbeddingT = TypeVar("BaseEmbeddingT", bound=BaseEmbeddingResponse)
+_ResultT = TypeVar("_ResultT")
 
 
 class BaseEmbedder(BaseModel, Generic[BaseEmbeddingT], ABC):
-    """The base class abstract interface for interacting with LLM embeddings."""
+    """The base class abstract interface for interacting with LLM embeddings.
+
+    Embedders split their inputs into batches of `embed_batch_size` and embed at most
+    `max_workers` batches concurrently. Each embedder owns a single thread pool (and an
+    `asyncio.Semaphore` per event loop) that bounds all of its calls, so ingesting many
+    inputs never opens more than `max_workers` connections at once. Call `close()` to
+    release the thread pool and clients once the embedder is no longer needed.
+    """
 
     api_key: ClassVar[str | None] = None
     base_url: ClassVar[str | None] = None
@@ -21,9 +35,17 @@ class BaseEmbedder(BaseModel, Generic[BaseEmbeddingT], ABC):
         model="text-embedding-ada-002"
     )
     dimensions: int | None = None
+    embed_batch_size: int | None = None
+    max_workers: int | None = 64
     configuration: ClassVar[BaseConfig] = BaseConfig(llm_ops=[], client_wrappers=[])
     _provider: ClassVar[str] = "base"
 
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _executor: ThreadPoolExecutor | None = PrivateAttr(None)
+    _semaphores: weakref.WeakKeyDictionary[
+        asyncio.AbstractEventLoop, asyncio.Semaphore
+    ] = PrivateAttr(default_factory=weakref.WeakKeyDictionary)
+
     @abstractmethod
     def embed(self, input: list[str]) -> BaseEmbeddingT:
         """A call to the embedder with a single input"""
@@ -33,3 +55,66 @@ class BaseEmbedder(BaseModel, Generic[BaseEmbeddingT], ABC):
     async def embed_async(self, input: list[str]) -> BaseEmbeddingT:
         """Asynchronously call the embedder with a single input"""
         ...
+
+    @property
+    def embedding_type(self) -> Literal["float", "int8", "uint8", "binary", "ubinary"]:
+        """The type of the embeddings, which vectorstores use to decide how to store them.
+
+        Embedders that can return quantized embeddings (e.g. Cohere) override this.
+        """
+        return "float"
+
+    def close(self) -> None:
+        """Shuts down the embedder's thread pool. It is recreated if needed again."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _batches(self, inputs: list[str]) -> list[list[str]]:
+        """Returns the inputs split into batches of `embed_batch_size`."""
+        if self.embed_batch_size is None:
+            return [inputs]
+        return [
+            inputs[i : i + self.embed_batch_size]
+            for i in range(0, len(inputs), self.embed_batch_size)
+        ]
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    self.max_workers,
+                    thread_name_prefix=f"mirascope-{self._provider}-embedder",
+                )
+            return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if (semaphore := self._semaphores.get(loop)) is None:
+                # Matches the default number of workers of `ThreadPoolExecutor`
+                max_workers = self.max_workers or min(32, (os.cpu_count() or 1) + 4)
+                semaphore = self._semaphores[loop] = asyncio.Semaphore(max_workers)
+            return semaphore
+
+    def _map_batches(
+        self, embed: Callable[[list[str]], _ResultT], inputs: list[str]
+    ) -> list[_ResultT]:
+        """Embeds each batch of `inputs` on the embedder's bounded thread pool."""
+        return list(self._get_executor().map(embed, self._batches(inputs)))
+
+    async def _map_batches_async(
+        self, embed: Callable[[list[str]], Awaitable[_ResultT]], inputs: list[str]
+    ) -> list[_ResultT]:
+        """Embeds each batch of `inputs` with at most `max_workers` in flight."""
+        semaphore = self._get_semaphore()
+
+        async def embed_bounded(batch: list[str]) -> _ResultT:
+            async with semaphore:
+                return await embed(batch)
+
+        batches = self._batches(inputs)
+        return list(await asyncio.gather(*(embed_bounded(b) for b in batches)))
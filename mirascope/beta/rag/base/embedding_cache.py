@@ -0,0 +1,295 @@
+"""A content-addressed on-disk cache of embeddings for any embedder."""
+
+import asyncio
+import datetime
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import ClassVar, Literal
+
+import numpy as np
+from pydantic import ConfigDict, SkipValidation, model_validator
+from typing_extensions import Self
+
+from .embedders import BaseEmbedder
+from .embedding_response import BaseEmbeddingResponse
+
+# Stays well below SQLite's limit on the number of variables in a single statement
+_MAX_VARIABLES = 500
+
+
+def _text_hash(text: str) -> bytes:
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+class EmbeddingCache:
+    """A compact on-disk store of embeddings addressed by the hash of their text.
+
+    Vectors are appended as rows of `float32` to one file per dimension, which is read
+    through a memory map, and a SQLite index maps each `(namespace, text hash)` to its
+    row. Writers are serialized through SQLite's write lock, so several processes can
+    share the same cache directory.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """Opens (or creates) the cache stored in the directory at `path`."""
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._arrays: dict[int, np.memmap] = {}
+        self._connection = sqlite3.connect(
+            self.path / "index.sqlite3", check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "namespace TEXT NOT NULL, text_hash BLOB NOT NULL, "
+            "dimensions INTEGER NOT NULL, row INTEGER NOT NULL, "
+            "PRIMARY KEY (namespace, text_hash)) WITHOUT ROWID"
+        )
+
+    def get(self, namespace: str, texts: list[str]) -> list[np.ndarray | None]:
+        """Returns the cached vector of each text, or `None` for each cache miss.
+
+        Args:
+            namespace: The namespace of the vectors, e.g. the provider and model.
+            texts: The texts to look up.
+        """
+        hashes = [_text_hash(text) for text in texts]
+        unique_hashes = list(dict.fromkeys(hashes))
+        rows_by_dimensions: dict[int, dict[bytes, int]] = {}
+        vectors: dict[bytes, np.ndarray] = {}
+        with self._lock:
+            for i in range(0, len(unique_hashes), _MAX_VARIABLES):
+                chunk = unique_hashes[i : i + _MAX_VARIABLES]
+                for text_hash, dimensions, row in self._connection.execute(
+                    "SELECT text_hash, dimensions, row FROM embeddings "
+                    f"WHERE namespace = ? AND text_hash IN ({','.join('?' * len(chunk))})",
+                    (namespace, *chunk),
+                ):
+                    rows_by_dimensions.setdefault(dimensions, {})[text_hash] = row
+            for dimensions, rows in rows_by_dimensions.items():
+                indices = np.fromiter(rows.values(), dtype=np.int64, count=len(rows))
+                array = self._get_array(dimensions, int(indices.max()) + 1)
+                vectors.update(zip(rows, array[indices], strict=True))
+        return [vectors.get(text_hash) for text_hash in hashes]
+
+    def put(self, namespace: str, texts: list[str], vectors: np.ndarray) -> None:
+        """Stores one vector per text, keeping any vector already cached for a text.
+
+        Args:
+            namespace: The namespace of the vectors, e.g. the provider and model.
+            texts: The texts that were embedded.
+            vectors: A `(len(texts), dimensions)` array of their embeddings.
+        """
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        if vectors.ndim != 2 or len(vectors) != len(texts):
+            raise ValueError(
+                f"Expected {len(texts)} vectors but got an array of shape "
+                f"{vectors.shape}."
+            )
+        if not texts:
+            return
+        dimensions = vectors.shape[1]
+        row_size = vectors.itemsize * dimensions
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                with open(self.path / f"vectors-{dimensions}.f32", "ab") as file:
+                    start, partial_row = divmod(file.seek(0, os.SEEK_END), row_size)
+                    if partial_row:  # left behind by an interrupted write
+                        file.truncate(start * row_size)
+                    file.write(vectors.tobytes())
+                self._connection.executemany(
+                    "INSERT OR IGNORE INTO embeddings VALUES (?, ?, ?, ?)",
+                    (
+                        (namespace, _text_hash(text), dimensions, start + i)
+                        for i, text in enumerate(texts)
+                    ),
+                )
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+    def close(self) -> None:
+        """Closes the index and releases the memory maps."""
+        with self._lock:
+            self._arrays.clear()
+            self._connection.close()
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _get_array(self, dimensions: int, rows: int) -> np.memmap:
+        """Returns the vectors of `dimensions`, remapped if it has fewer than `rows`."""
+        array = self._arrays.get(dimensions)
+        if array is None or len(array) < rows:
+            path = self.path / f"vectors-{dimensions}.f32"
+            count = path.stat().st_size // (np.dtype(np.float32).itemsize * dimensions)
+            array = self._arrays[dimensions] = np.memmap(
+                path, dtype=np.float32, mode="r", shape=(count, dimensions)
+            )
+        return array
+
+
+class CachedEmbeddingResponse(
+    BaseEmbeddingResponse[SkipValidation[BaseEmbeddingResponse | None]]
+):
+    """An embedding response whose embeddings were (partly) read from a cache.
+
+    Attributes:
+        response: The response of the wrapped embedder for the cache misses, if any.
+        vectors: The `(len(inputs), dimensions)` array of embeddings.
+        cache_hits: The number of inputs whose embedding was read from the cache.
+    """
+
+    vectors: SkipValidation[np.ndarray]
+    cache_hits: int
+
+    @property
+    def embeddings(self) -> list[list[float]]:
+        """Returns the embeddings in the order of the inputs."""
+        return self.vectors.tolist()
+
+    @property
+    def embeddings_array(self) -> np.ndarray:
+        """Returns the embeddings as a `(len(inputs), dimensions)` float32 array."""
+        return self.vectors
+
+
+class CachedEmbedder(BaseEmbedder[CachedEmbeddingResponse]):
+    """An embedder that only embeds the inputs missing from an `EmbeddingCache`.
+
+    Embeddings are cached by the hash of their text within a namespace of the wrapped
+    embedder's provider, model, dimensions, embedding type, and embedding parameters
+    (e.g. Cohere's `input_type`), so any number of embedders can share a single cache. All inputs are looked up at once, and only the unique misses are sent
+    to the wrapped embedder in a single call.
+
+    Example:
+
+    ```python
+    from mirascope.beta.rag.base.embedding_cache import CachedEmbedder, EmbeddingCache
+    from mirascope.beta.rag.openai import OpenAIEmbedder
+
+    embedder = CachedEmbedder(
+        embedder=OpenAIEmbedder(), cache=EmbeddingCache(".embeddings")
+    )
+    response = embedder.embed(["your text to embed"])
+    print(response.cache_hits)
+    ```
+    """
+
+    embedder: BaseEmbedder
+    cache: SkipValidation[EmbeddingCache]
+    _provider: ClassVar[str] = "cached"
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    @model_validator(mode="after")
+    def _use_embedder_dimensions(self) -> Self:
+        if self.dimensions is None:
+            self.dimensions = self.embedder.dimensions
+        return self
+
+    @property
+    def namespace(self) -> str:
+        """The namespace of the wrapped embedder's vectors in the cache.
+
+        Any parameter can change the vectors, so the namespace ends with a stable hash
+        of all of them.
+        """
+        embedder = self.embedder
+        params = json.dumps(
+            embedder.embedding_params.kwargs(), sort_keys=True, default=str
+        )
+        return ":".join(
+            (
+                embedder._provider,
+                str(embedder.embedding_params.model),
+                str(embedder.dimensions),
+                embedder.embedding_type,
+                hashlib.sha256(params.encode("utf-8")).hexdigest()[:16],
+            )
+        )
+
+    @property
+    def embedding_type(self) -> Literal["float", "int8", "uint8", "binary", "ubinary"]:
+        """The type of the embeddings of the wrapped embedder."""
+        return self.embedder.embedding_type
+
+    def embed(self, inputs: list[str]) -> CachedEmbeddingResponse:
+        """Call the wrapped embedder with the inputs missing from the cache"""
+        start_time = datetime.datetime.now().timestamp() * 1000
+        cached = self.cache.get(self.namespace, inputs)
+        misses = self._misses(inputs, cached)
+        response = self.embedder.embed(misses) if misses else None
+        return self._response(inputs, cached, misses, response, start_time)
+
+    async def embed_async(self, inputs: list[str]) -> CachedEmbeddingResponse:
+        """Asynchronously call the wrapped embedder with the inputs missing from the cache
+
+        The cache is read and written in worker threads so it doesn't block the event
+        loop.
+        """
+        start_time = datetime.datetime.now().timestamp() * 1000
+        cached = await asyncio.to_thread(self.cache.get, self.namespace, inputs)
+        misses = self._misses(inputs, cached)
+        response = await self.embedder.embed_async(misses) if misses else None
+        return await asyncio.to_thread(
+            self._response, inputs, cached, misses, response, start_time
+        )
+
+    def close(self) -> None:
+        """Closes the wrapped embedder. The cache may be shared, so it is left open."""
+        super().close()
+        self.embedder.close()
+
+    def __call__(self, input: list[str]) -> list[list[float]]:
+        """Call the embedder with a input
+
+        Chroma expects parameter to be `input`.
+        """
+        return self.embed(input).embeddings
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _misses(self, inputs: list[str], cached: list[np.ndarray | None]) -> list[str]:
+        """Returns the unique inputs that are missing from the cache."""
+        return list(
+            dict.fromkeys(
+                text
+                for text, vector in zip(inputs, cached, strict=True)
+                if vector is None
+            )
+        )
+
+    def _response(
+        self,
+        inputs: list[str],
+        cached: list[np.ndarray | None],
+        misses: list[str],
+        response: BaseEmbeddingResponse | None,
+        start_time: float,
+    ) -> CachedEmbeddingResponse:
+        """Caches the embeddings of the misses and returns all embeddings in order."""
+        embedded: dict[str, np.ndarray] = {}
+        if response is not None:
+            vectors = response.embeddings_array
+            self.cache.put(self.namespace, misses, vectors)
+            embedded = dict(zip(misses, vectors, strict=True))
+        vectors = [
+            embedded[text] if vector is None else vector
+            for text, vector in zip(inputs, cached, strict=True)
+        ]
+        return CachedEmbeddingResponse(
+            response=response,
+            start_time=start_time,
+            end_time=datetime.datetime.now().timestamp() * 1000,
+            vectors=np.stack(vectors)
+            if vectors
+            else np.empty((0, self.dimensions or 0), dtype=np.float32),
+            cache_hits=sum(vector is not None for vector in cached),
+        )
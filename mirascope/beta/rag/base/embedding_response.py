@@ -1,8 +1,20 @@
 from abc import ABC, abstractmethod
-from typing import Any, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from pydantic import BaseModel, ConfigDict
 
+if TYPE_CHECKING:
+    import numpy as np
+
+    has_numpy_module: bool
+else:
+    try:
+        import numpy as np
+
+        has_numpy_module = True
+    except ImportError:  # pragma: no cover
+        has_numpy_module = False
+
 ResponseT = TypeVar("ResponseT", bound=Any)
 
 
@@ -28,3 +40,17 @@ class BaseEmbeddingResponse(BaseModel, Generic[ResponseT], ABC):
         choice and return it's embedding.
         """
         ...
+
+    @property
+    def embeddings_array(self) -> "np.ndarray":
+        """Returns the embeddings as a contiguous `(num_inputs, dimensions)` float32 array.
+
+        Requires `numpy`. Responses that receive the embeddings as raw bytes (e.g.
+        OpenAI) decode them directly into the array without creating Python floats.
+        """
+        if not has_numpy_module:
+            raise ImportError("`embeddings_array` requires `numpy` to be installed.")
+        embeddings = self.embeddings
+        if embeddings is None:
+            raise ValueError("Embedding is None")
+        return np.asarray(embeddings, dtype=np.float32)
@@ -0,0 +1,185 @@
+"""A streaming ingestion pipeline for vectorstores with bounded memory."""
+
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, TypeVar
+
+from pydantic import BaseModel
+
+from .document import Document
+from .embedding_response import BaseEmbeddingResponse
+
+if TYPE_CHECKING:
+    from .vectorstores import BaseVectorStore
+
+_R = TypeVar("_R")
+
+
+class IngestionProgress(BaseModel):
+    """The progress of an ingestion, reported after each batch is upserted.
+
+    Attributes:
+        sources: The number of sources read so far.
+        chunks: The number of chunks (documents) created so far.
+        embedded: The number of chunks embedded so far.
+        upserted: The number of chunks upserted so far.
+        batches: The number of batches upserted so far.
+        retries: The number of failed attempts that were retried.
+    """
+
+    sources: int = 0
+    chunks: int = 0
+    embedded: int = 0
+    upserted: int = 0
+    batches: int = 0
+    retries: int = 0
+
+
+def _retry(
+    fn: Callable[[], _R],
+    catch: type[Exception] | tuple[type[Exception], ...],
+    max_retries: int,
+    backoff: float,
+    progress: IngestionProgress,
+    lock: threading.Lock,
+) -> _R:
+    """Calls `fn`, retrying it with exponential backoff when it raises `catch`."""
+    for attempt in range(max_retries):
+        try:
+            return fn()
+        except catch:
+            with lock:
+                progress.retries += 1
+            time.sleep(backoff * 2**attempt)
+    return fn()
+
+
+def _batches(
+    store: "BaseVectorStore",
+    sources: Iterable[str | Document | os.PathLike[str]],
+    batch_size: int,
+    progress: IngestionProgress,
+    lock: threading.Lock,
+) -> Iterator[list[Document]]:
+    """Lazily chunks the sources into batches of `batch_size` documents."""
+    batch: list[Document] = []
+    for source in sources:
+        documents: Iterable[Document]
+        if isinstance(source, Document):
+            documents = [source]
+        elif isinstance(source, os.PathLike):
+            documents = store.chunker.chunk_file(source)
+        else:
+            documents = store.chunker.chunk(source)
+        for document in documents:
+            batch.append(document)
+            with lock:
+                progress.chunks += 1
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        with lock:
+            progress.sources += 1
+    if batch:
+        yield batch
+
+
+def ingest(
+    store: "BaseVectorStore",
+    sources: Iterable[str | Document | os.PathLike[str]],
+    batch_size: int = 256,
+    max_pending_batches: int = 2,
+    max_retries: int = 3,
+    backoff: float = 0.5,
+    catch: type[Exception] | tuple[type[Exception], ...] = OSError,
+    on_progress: Callable[[IngestionProgress], None] | None = None,
+) -> IngestionProgress:
+    """Chunks, embeds, and upserts the sources into the store in overlapping batches.
+
+    Sources are read and chunked lazily, so they can be a generator over an arbitrarily
+    large corpus. While one batch is being chunked, the previous batch is embedded and
+    the one before it upserted. At most `max_pending_batches` batches wait to be
+    embedded or upserted, and chunking blocks until one of them is upserted, so memory
+    use stays flat regardless of the size of the corpus. Files are chunked with the
+    chunker's `chunk_file`, which `TextChunker` implements by reading them in pieces;
+    other chunkers read each file whole, so memory is then bounded by the largest file.
+
+    Args:
+        store: The vectorstore to add the sources to.
+        sources: Texts to chunk, paths of (UTF-8) text files to chunk, or documents
+            to add as they are.
+        batch_size: The number of chunks embedded and upserted at once.
+        max_pending_batches: The number of batches that may be in flight at once.
+        max_retries: The number of times a failed embedding or upsert is retried.
+        backoff: The seconds to wait before the first retry, doubled on each retry.
+        catch: The transient error(s) to retry on. `OSError` covers connection errors,
+            timeouts, and I/O errors; pass your provider's transient errors (e.g.
+            `openai.APIConnectionError` and `openai.RateLimitError`) to retry them too.
+            Any other error is raised immediately.
+        on_progress: Called with the progress after each batch is upserted (from the
+            upserting thread).
+
+    Returns:
+        The final progress of the ingestion.
+
+    Raises:
+        Exception: The error of the first embedding or upsert that failed without being
+            retried or after all of its retries, after which no further batches are
+            read.
+    """
+    progress, lock = IngestionProgress(), threading.Lock()
+
+    def embed(documents: list[Document]) -> BaseEmbeddingResponse | None:
+        if not store._embeds_before_upsert:
+            return None
+        texts = [document.text for document in documents]
+        embedding_response = _retry(
+            lambda: store.embedder.embed(texts),
+            catch,
+            max_retries,
+            backoff,
+            progress,
+            lock,
+        )
+        with lock:
+            progress.embedded += len(documents)
+        return embedding_response
+
+    def upsert(
+        documents: list[Document], embedded: Future[BaseEmbeddingResponse | None]
+    ) -> None:
+        embedding_response = embedded.result()
+        _retry(
+            lambda: store._upsert(documents, embedding_response),
+            catch,
+            max_retries,
+            backoff,
+            progress,
+            lock,
+        )
+        with lock:
+            progress.upserted += len(documents)
+            progress.batches += 1
+            snapshot = progress.model_copy()
+        if on_progress is not None:
+            on_progress(snapshot)
+
+    embed_executor = ThreadPoolExecutor(1, thread_name_prefix="mirascope-embed")
+    upsert_executor = ThreadPoolExecutor(1, thread_name_prefix="mirascope-upsert")
+    pending: deque[Future[None]] = deque()
+    try:
+        for batch in _batches(store, sources, batch_size, progress, lock):
+            embedded = embed_executor.submit(embed, batch)
+            pending.append(upsert_executor.submit(upsert, batch, embedded))
+            while len(pending) > max_pending_batches:
+                pending.popleft().result()
+        while pending:
+            pending.popleft().result()
+    finally:
+        embed_executor.shutdown(cancel_futures=True)
+        upsert_executor.shutdown(cancel_futures=True)
+    return progress
@@ -1,6 +1,10 @@
 """Vectorstores for the RAG module."""
 
+import asyncio
+import os
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, ClassVar, Generic, TypeVar
 
 from pydantic import BaseModel
@@ -9,11 +13,16 @@ from .chunkers import BaseChunker, TextChunker
 from .config import BaseConfig
 from .document import Document
 from .embedders import BaseEmbedder
+from .embedding_response import BaseEmbeddingResponse
+from .ingestion import IngestionProgress, ingest
 from .query_results import BaseQueryResults
 from .vectorstore_params import BaseVectorStoreParams
 
 BaseQueryResultsT = TypeVar("BaseQueryResultsT", bound=BaseQueryResults)
 
+MAX_QUERY_WORKERS = 8
+"""The most worker threads `retrieve_many` runs queries in concurrently."""
+
 
 class BaseVectorStore(BaseModel, Generic[BaseQueryResultsT], ABC):
     """The base class abstract interface for interacting with vectorstores."""
@@ -25,6 +34,7 @@ class BaseVectorStore(BaseModel, Generic[BaseQueryResultsT], ABC):
     vectorstore_params: ClassVar[BaseVectorStoreParams] = BaseVectorStoreParams()
     configuration: ClassVar[BaseConfig] = BaseConfig()
     _provider: ClassVar[str] = "base"
+    _embeds_before_upsert: ClassVar[bool] = False
 
     @abstractmethod
     def retrieve(self, text: str, **kwargs: Any) -> BaseQueryResultsT:  # noqa: ANN401
@@ -35,3 +45,95 @@ class BaseVectorStore(BaseModel, Generic[BaseQueryResultsT], ABC):
     def add(self, text: str | list[Document], **kwargs: Any) -> None:  # noqa: ANN401
         """Takes unstructured data and upserts into vectorstore"""
         ...
+
+    def retrieve_many(
+        self,
+        texts: list[str],
+        top_k: int | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> list[BaseQueryResultsT]:
+        """Queries the vectorstore for the closest matches of each text
+
+        By default, this runs `retrieve` for each text concurrently in up to
+        `MAX_QUERY_WORKERS` worker threads.
+        Stores override it to embed all texts in a single call and batch the queries.
+
+        Args:
+            texts: The texts to query.
+            top_k: The number of results per text, the store's default if `None`.
+            **kwargs: Additional keyword arguments passed to each query.
+
+        Returns:
+            The results of each text, in the same order as `texts`.
+        """
+        if top_k is not None:
+            kwargs["top_k"] = top_k
+        if len(texts) < 2:
+            return [self.retrieve(text, **kwargs) for text in texts]
+        with ThreadPoolExecutor(min(len(texts), MAX_QUERY_WORKERS)) as executor:
+            return list(executor.map(lambda text: self.retrieve(text, **kwargs), texts))
+
+    async def retrieve_async(self, text: str, **kwargs: Any) -> BaseQueryResultsT:  # noqa: ANN401
+        """Asynchronously queries the vectorstore for closest match
+
+        By default, this runs `retrieve` in a worker thread so it doesn't block the event
+        loop. Stores with asynchronous clients override it to query them natively.
+        """
+        return await asyncio.to_thread(self.retrieve, text, **kwargs)
+
+    async def add_async(self, text: str | list[Document], **kwargs: Any) -> None:  # noqa: ANN401
+        """Asynchronously takes unstructured data and upserts into vectorstore
+
+        By default, this runs `add` in a worker thread so it doesn't block the event
+        loop. Stores with asynchronous clients override it to upsert natively.
+        """
+        return await asyncio.to_thread(self.add, text, **kwargs)
+
+    def add_stream(
+        self,
+        sources: Iterable[str | Document | os.PathLike[str]],
+        batch_size: int = 256,
+        max_pending_batches: int = 2,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        catch: type[Exception] | tuple[type[Exception], ...] = OSError,
+        on_progress: Callable[[IngestionProgress], None] | None = None,
+    ) -> IngestionProgress:
+        """Chunks, embeds, and upserts sources in overlapping batches of bounded memory.
+
+        See `ingest` for details.
+
+        Example:
+
+        ```python
+        from pathlib import Path
+
+        my_store.add_stream(
+            Path("docs").glob("**/*.md"),
+            on_progress=lambda progress: print(progress.upserted),
+        )
+        ```
+        """
+        return ingest(
+            self,
+            sources,
+            batch_size=batch_size,
+            max_pending_batches=max_pending_batches,
+            max_retries=max_retries,
+            backoff=backoff,
+            catch=catch,
+            on_progress=on_progress,
+        )
+
+    def _upsert(
+        self,
+        documents: list[Document],
+        embedding_response: BaseEmbeddingResponse | None,
+    ) -> None:
+        """Upserts chunked documents with their embeddings.
+
+        The embeddings are only computed beforehand for stores that set
+        `_embeds_before_upsert`, which override this method to use them. Other stores
+        (e.g. those that embed on the server) simply add the documents.
+        """
+        self.add(documents)
@@ -1,12 +1,26 @@
 """A module for calling Chroma's Client and Collection."""
 
+import asyncio
+import threading
+import weakref
 from functools import cached_property
 from typing import Any, ClassVar, cast
 
-from chromadb import Collection, EphemeralClient, HttpClient, Metadata, PersistentClient
-from chromadb.api import ClientAPI
+from chromadb import (
+    AsyncHttpClient,
+    Collection,
+    EphemeralClient,
+    HttpClient,
+    Metadata,
+    PersistentClient,
+)
+from chromadb.api import AsyncClientAPI, ClientAPI
+from chromadb.api.models.AsyncCollection import AsyncCollection
+from chromadb.api.types import Embeddings
+from pydantic import PrivateAttr
 
 from ..base.document import Document
+from ..base.embedding_response import BaseEmbeddingResponse
 from ..base.vectorstores import BaseVectorStore
 from .types import ChromaParams, ChromaQueryResult, ChromaSettings
 
@@ -40,6 +54,15 @@ class ChromaVectorStore(BaseVectorStore):
     vectorstore_params = ChromaParams(get_or_create=True)
     client_settings: ClassVar[ChromaSettings] = ChromaSettings(mode="persistent")
     _provider: ClassVar[str] = "chroma"
+    _embeds_before_upsert: ClassVar[bool] = True
+
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _async_locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = (
+        PrivateAttr(default_factory=weakref.WeakKeyDictionary)
+    )
+    _async_indexes: weakref.WeakKeyDictionary[
+        asyncio.AbstractEventLoop, AsyncCollection
+    ] = PrivateAttr(default_factory=weakref.WeakKeyDictionary)
 
     def retrieve(
         self,
@@ -72,6 +95,124 @@ class ChromaVectorStore(BaseVectorStore):
             **kwargs,
         )
 
+    def retrieve_many(
+        self,
+        texts: list[str],
+        top_k: int | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> list[ChromaQueryResult]:
+        """Queries the vectorstore for the closest matches of each text
+
+        The texts are embedded in a single call and queried as one batch.
+        """
+        if not texts:
+            return []
+        if top_k is not None:
+            kwargs["n_results"] = top_k
+        query_result = self._index.query(query_texts=texts, **kwargs)
+        return [
+            ChromaQueryResult.model_validate(
+                {
+                    key: None if value is None else [value[i]]
+                    for key, value in query_result.items()
+                    if key != "included"
+                }
+            )
+            for i in range(len(texts))
+        ]
+
+    async def retrieve_async(
+        self,
+        text: str | list[str] | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> ChromaQueryResult:
+        """Asynchronously queries the vectorstore for closest match
+
+        In `http` mode, the text is embedded with `embed_async` and queried with Chroma's
+        async HTTP client. Other modes run `retrieve` in a worker thread.
+        """
+        if self.client_settings.mode != "http":
+            return await super().retrieve_async(text, **kwargs)
+        index = await self._get_async_index()
+        if text:
+            if isinstance(text, str):
+                text = [text]
+            embedding_response = await self.embedder.embed_async(text)
+            query_result = await index.query(
+                query_embeddings=cast(Embeddings, embedding_response.embeddings),
+                **kwargs,
+            )
+        else:
+            query_result = await index.query(**kwargs)
+
+        return ChromaQueryResult.model_validate(query_result)
+
+    async def add_async(self, text: str | list[Document], **kwargs: Any) -> None:  # noqa: ANN401
+        """Asynchronously takes unstructured data and upserts into vectorstore
+
+        In `http` mode, the documents are embedded with `embed_async` and upserted with
+        Chroma's async HTTP client. Other modes run `add` in a worker thread.
+        """
+        if self.client_settings.mode != "http":
+            return await super().add_async(text, **kwargs)
+        documents: list[Document]
+        if isinstance(text, str):
+            chunk = self.chunker.chunk
+            documents = chunk(text)
+        else:
+            documents = text
+
+        embedding_response = await self.embedder.embed_async(
+            [document.text for document in documents]
+        )
+        index = await self._get_async_index()
+        return await index.upsert(
+            ids=[document.id for document in documents],
+            embeddings=cast(Embeddings, embedding_response.embeddings),
+            documents=[document.text for document in documents],
+            metadatas=[cast(Metadata, document.metadata) for document in documents],
+            **kwargs,
+        )
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _upsert(
+        self,
+        documents: list[Document],
+        embedding_response: BaseEmbeddingResponse | None,
+    ) -> None:
+        """Upserts the documents with their precomputed embeddings into the collection"""
+        if embedding_response is None or embedding_response.embeddings is None:
+            raise ValueError("Embedding is None")
+        self._index.upsert(
+            ids=[document.id for document in documents],
+            embeddings=cast(Embeddings, embedding_response.embeddings),
+            documents=[document.text for document in documents],
+            metadatas=[cast(Metadata, document.metadata) for document in documents],
+        )
+
+    async def _get_async_index(self) -> AsyncCollection:
+        # Async clients hold connections bound to the loop they were created in, and
+        # concurrent first calls would otherwise each create (and leak) a client
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            lock = self._async_locks.setdefault(loop, asyncio.Lock())
+        async with lock:
+            if (index := self._async_indexes.get(loop)) is None:
+                client: AsyncClientAPI = await AsyncHttpClient(
+                    **self.client_settings.kwargs()
+                )
+                index = self._async_indexes[loop] = await client.create_collection(
+                    **self._vectorstore_params().kwargs(),
+                    embedding_function=self.embedder,
+                )
+            return index
+
+    def _vectorstore_params(self) -> ChromaParams:
+        if self.index_name:
+            return self.vectorstore_params.model_copy(update={"name": self.index_name})
+        return self.vectorstore_params
+
     ############################# PRIVATE PROPERTIES #################################
 
     @cached_property
@@ -85,13 +226,7 @@ class ChromaVectorStore(BaseVectorStore):
 
     @cached_property
     def _index(self) -> Collection:
-        vectorstore_params = self.vectorstore_params
-        if self.index_name:
-            vectorstore_params = self.vectorstore_params.model_copy(
-                update={"name": self.index_name}
-            )
-
         return self._client.create_collection(
-            **vectorstore_params.kwargs(),
+            **self._vectorstore_params().kwargs(),
             embedding_function=self.embedder,
         )
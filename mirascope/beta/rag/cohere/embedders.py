@@ -1,9 +1,14 @@
 """A module for calling OpenAI's Embeddings models."""
 
+import asyncio
 import datetime
-from typing import ClassVar
+import weakref
+from typing import Any, ClassVar, Literal
 
 from cohere import AsyncClient, Client
+from cohere.types import EmbedResponse
+from cohere.utils import merge_embed_responses
+from pydantic import PrivateAttr
 
 from ..base.embedders import BaseEmbedder
 from .embedding_params import CohereEmbeddingParams
@@ -37,45 +42,40 @@ class CohereEmbedder(BaseEmbedder[CohereEmbeddingResponse]):
     """
 
     dimensions: int | None = 1024
+    embed_batch_size: int | None = 96
     embedding_params: ClassVar[CohereEmbeddingParams] = CohereEmbeddingParams(
         model="embed-english-v3.0"
     )
     _provider: ClassVar[str] = "cohere"
 
+    _client: Client | None = PrivateAttr(None)
+    _async_clients: weakref.WeakKeyDictionary[
+        asyncio.AbstractEventLoop, AsyncClient
+    ] = PrivateAttr(default_factory=weakref.WeakKeyDictionary)
+
     def embed(self, inputs: list[str]) -> CohereEmbeddingResponse:
         """Call the embedder with multiple inputs"""
-
-        co = Client(api_key=self.api_key, base_url=self.base_url)
-        embedding_type = (
-            self.embedding_params.embedding_types[0]
-            if self.embedding_params.embedding_types
-            else None
-        )
         start_time = datetime.datetime.now().timestamp() * 1000
-        response = co.embed(texts=inputs, **self.embedding_params.kwargs())
-        return CohereEmbeddingResponse(
-            response=response,
-            start_time=start_time,
-            end_time=datetime.datetime.now().timestamp() * 1000,
-            embedding_type=embedding_type,
-        )
+        responses = self._map_batches(self._embed, inputs)
+        return self._response(responses, start_time)
 
     async def embed_async(self, inputs: list[str]) -> CohereEmbeddingResponse:
         """Asynchronously call the embedder with multiple inputs"""
-        co = AsyncClient(api_key=self.api_key, base_url=self.base_url)
-        embedding_type = (
-            self.embedding_params.embedding_types[0]
-            if self.embedding_params.embedding_types
-            else None
-        )
         start_time = datetime.datetime.now().timestamp() * 1000
-        response = await co.embed(texts=inputs, **self.embedding_params.kwargs())
-        return CohereEmbeddingResponse(
-            response=response,
-            start_time=start_time,
-            end_time=datetime.datetime.now().timestamp() * 1000,
-            embedding_type=embedding_type,
-        )
+        responses = await self._map_batches_async(self._embed_async, inputs)
+        return self._response(responses, start_time)
+
+    @property
+    def embedding_type(self) -> Literal["float", "int8", "uint8", "binary", "ubinary"]:
+        """The first of the requested `embedding_types`, which `embeddings` returns."""
+        embedding_types = self.embedding_params.embedding_types
+        return embedding_types[0] if embedding_types else "float"
+
+    def close(self) -> None:
+        """Shuts down the embedder's thread pool."""
+        super().close()
+        with self._lock:
+            self._client = None
 
     def __call__(self, input: list[str]) -> list[list[float]] | list[list[int]] | None:
         """Call the embedder with a input
@@ -85,3 +85,52 @@ class CohereEmbedder(BaseEmbedder[CohereEmbeddingResponse]):
         response = self.embed(input)
         embeddings = response.embeddings
         return embeddings
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _get_client(self) -> Client:
+        with self._lock:
+            if self._client is None:
+                self._client = Client(api_key=self.api_key, base_url=self.base_url)
+            return self._client
+
+    def _get_async_client(self) -> AsyncClient:
+        # Async clients hold connections bound to the loop they were created in
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if (client := self._async_clients.get(loop)) is None:
+                client = self._async_clients[loop] = AsyncClient(
+                    api_key=self.api_key, base_url=self.base_url
+                )
+            return client
+
+    def _kwargs(self) -> dict[str, Any]:
+        kwargs = self.embedding_params.kwargs()
+        if self.embed_batch_size is not None:
+            kwargs["batching"] = False
+        return kwargs
+
+    def _embed(self, inputs: list[str]) -> EmbedResponse:
+        """Call the embedder with a single batch"""
+        return self._get_client().embed(texts=inputs, **self._kwargs())
+
+    async def _embed_async(self, inputs: list[str]) -> EmbedResponse:
+        """Asynchronously call the embedder with a single batch"""
+        return await self._get_async_client().embed(texts=inputs, **self._kwargs())
+
+    def _response(
+        self, responses: list[EmbedResponse], start_time: float
+    ) -> CohereEmbeddingResponse:
+        embedding_type = (
+            self.embedding_params.embedding_types[0]
+            if self.embedding_params.embedding_types
+            else None
+        )
+        return CohereEmbeddingResponse(
+            response=responses[0]
+            if len(responses) == 1
+            else merge_embed_responses(responses),
+            start_time=start_time,
+            end_time=datetime.datetime.now().timestamp() * 1000,
+            embedding_type=embedding_type,
+        )
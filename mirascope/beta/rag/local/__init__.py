@@ -0,0 +1,22 @@
+"""A module for interacting with local vectorstores."""
+
+from .index import BaseIndex, FlatIndex
+from .ivf import IVFIndex
+from .quantization import Quantization
+from .segments import Segment, SegmentedIndex
+from .types import IVFBenchmarkResult, LocalParams, LocalQueryResult, LocalSettings
+from .vectorstores import LocalVectorStore
+
+__all__ = [
+    "BaseIndex",
+    "FlatIndex",
+    "IVFBenchmarkResult",
+    "IVFIndex",
+    "LocalParams",
+    "LocalQueryResult",
+    "LocalSettings",
+    "LocalVectorStore",
+    "Quantization",
+    "Segment",
+    "SegmentedIndex",
+]
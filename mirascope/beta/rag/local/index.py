@@ -0,0 +1,272 @@
+"""Indexes of vectors for local vectorstores."""
+
+from abc import ABC, abstractmethod
+from typing import Any, Literal
+
+import numpy as np
+
+from .types import LocalQueryResult
+
+# Bounds the `(queries, vectors)` score matrix computed at once to 64MB of float32
+_MAX_SCORES = 1 << 24
+
+
+def normalize(vectors: np.ndarray) -> np.ndarray:
+    """Returns the vectors scaled to unit length, leaving zero vectors unchanged."""
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Returns the indices of the `k` highest scores of each row, best first.
+
+    Only the `k` candidates found by `argpartition` are sorted, so this takes linear
+    time in the number of scores rather than sorting every row.
+    """
+    k = min(k, scores.shape[1])
+    if k < scores.shape[1]:
+        candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    else:
+        candidates = np.broadcast_to(np.arange(k), scores.shape)
+    order = np.argsort(-np.take_along_axis(scores, candidates, axis=1), axis=1)
+    return np.take_along_axis(candidates, order, axis=1)
+
+
+def search_vectors(
+    queries: np.ndarray, vectors: np.ndarray, k: int, mask: np.ndarray | None = None
+) -> list[tuple[np.ndarray, np.ndarray]]:
+    """Returns the rows and scores of the `k` best vectors for each query, best first.
+
+    Args:
+        queries: A `(num_queries, dimensions)` array of query vectors.
+        vectors: A `(num_vectors, dimensions)` array (or memory map) of vectors.
+        k: The maximum number of matches per query.
+        mask: Which vectors may match, all of them if `None`.
+    """
+    rows = None
+    if mask is not None and mask.sum() <= len(mask) // 2:
+        # Scoring only the few selected rows is cheaper than masking the scores
+        rows = np.flatnonzero(mask)
+        vectors, mask = vectors[rows], None
+    if not len(vectors):
+        empty = np.empty(0, dtype=np.int64)
+        return [(empty, empty.astype(np.float32)) for _ in queries]
+    results: list[tuple[np.ndarray, np.ndarray]] = []
+    step = max(1, _MAX_SCORES // len(vectors))
+    for start in range(0, len(queries), step):
+        scores = queries[start : start + step] @ vectors.T
+        if mask is not None:
+            scores[:, ~mask] = -np.inf
+        best = top_k(scores, k)
+        best_scores = np.take_along_axis(scores, best, axis=1)
+        if rows is not None:
+            best = rows[best]
+        for query_rows, query_scores in zip(best, best_scores, strict=True):
+            found = np.isfinite(query_scores)
+            results.append((query_rows[found], query_scores[found]))
+    return results
+
+
+def check_vectors(
+    ids: list[str],
+    vectors: np.ndarray,
+    documents: list[str],
+    metadatas: list[dict[str, Any] | None],
+    dimensions: int | None,
+) -> np.ndarray:
+    """Returns the vectors as float32 after checking they can be added to an index.
+
+    Args:
+        ids: The id of each vector.
+        vectors: The vectors to add.
+        documents: The document of each vector.
+        metadatas: The metadata of each vector.
+        dimensions: The dimensions of the vectors already in the index, if any.
+
+    Raises:
+        ValueError: If there isn't one vector, document, and metadata per id, or if the
+            vectors don't have the dimensions of those already in the index.
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if vectors.ndim != 2 or not (
+        len(ids) == len(vectors) == len(documents) == len(metadatas)
+    ):
+        raise ValueError(
+            f"Expected {len(ids)} vectors, documents, and metadatas but got an array "
+            f"of shape {vectors.shape}, {len(documents)} documents, and "
+            f"{len(metadatas)} metadatas."
+        )
+    if dimensions is not None and dimensions != vectors.shape[1]:
+        raise ValueError(
+            f"Expected vectors with {dimensions} dimensions but got {vectors.shape[1]}."
+        )
+    return vectors
+
+
+def matches(metadata: dict[str, Any] | None, where: dict[str, Any]) -> bool:
+    """Returns whether the metadata has every key-value pair of `where`."""
+    if metadata is None:
+        return not where
+    return all(
+        key in metadata and metadata[key] == value for key, value in where.items()
+    )
+
+
+class BaseIndex(ABC):
+    """The base class abstract interface of the indexes of local vectorstores."""
+
+    metric: Literal["cosine", "dot"]
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Returns the number of vectors in the index."""
+        ...
+
+    @abstractmethod
+    def add(
+        self,
+        ids: list[str],
+        vectors: np.ndarray,
+        documents: list[str],
+        metadatas: list[dict[str, Any] | None],
+    ) -> None:
+        """Adds the vectors, replacing those of ids already in the index."""
+        ...
+
+    @abstractmethod
+    def search(
+        self,
+        queries: np.ndarray,
+        k: int,
+        where: dict[str, Any] | None = None,
+        include_embeddings: bool = False,
+        nprobe: int | None = None,
+    ) -> list[LocalQueryResult]:
+        """Returns the `k` best matches of each query.
+
+        Args:
+            queries: A `(num_queries, dimensions)` array of query vectors.
+            k: The maximum number of matches per query.
+            where: Only documents whose metadata has all of these key-value pairs match.
+            include_embeddings: Whether to return the (normalized) embeddings.
+            nprobe: The number of clusters an approximate index searches, trading
+                recall for latency. Exact indexes ignore it.
+        """
+        ...
+
+    def prepare(self, vectors: np.ndarray) -> np.ndarray:
+        """Returns the vectors as float32, normalized for the `cosine` metric."""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        return normalize(vectors) if self.metric == "cosine" else vectors
+
+
+class FlatIndex(BaseIndex):
+    """Vectors stored as rows of a contiguous float32 matrix and searched exhaustively.
+
+    Adding a vector with an existing id replaces it. The matrix grows geometrically, so
+    adding vectors one batch at a time takes amortized linear time.
+    """
+
+    def __init__(self, metric: Literal["cosine", "dot"] = "cosine") -> None:
+        """Initializes an empty index scored by `metric`."""
+        self.metric = metric
+        self.ids: list[str] = []
+        self.documents: list[str] = []
+        self.metadatas: list[dict[str, Any] | None] = []
+        self._rows: dict[str, int] = {}
+        self._matrix: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        """Returns the number of vectors in the index."""
+        return len(self.ids)
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """The `(len(self), dimensions)` matrix of vectors, normalized for `cosine`."""
+        if self._matrix is None:
+            return np.empty((0, 0), dtype=np.float32)
+        return self._matrix[: len(self)]
+
+    def add(
+        self,
+        ids: list[str],
+        vectors: np.ndarray,
+        documents: list[str],
+        metadatas: list[dict[str, Any] | None],
+    ) -> None:
+        """Adds the vectors, replacing those of ids already in the index."""
+        vectors = check_vectors(
+            ids,
+            vectors,
+            documents,
+            metadatas,
+            None if self._matrix is None else self._matrix.shape[1],
+        )
+        vectors = self.prepare(vectors)
+        rows = np.empty(len(ids), dtype=np.int64)
+        for i, (id, document, metadata) in enumerate(
+            zip(ids, documents, metadatas, strict=True)
+        ):
+            row = self._rows.get(id)
+            if row is None:
+                row = self._rows[id] = len(self.ids)
+                self.ids.append(id)
+                self.documents.append(document)
+                self.metadatas.append(metadata)
+            else:
+                self.documents[row] = document
+                self.metadatas[row] = metadata
+            rows[i] = row
+        self._reserve(len(self.ids), vectors.shape[1])
+        assert self._matrix is not None
+        self._matrix[rows] = vectors
+
+    def mask(self, where: dict[str, Any] | None) -> np.ndarray | None:
+        """Returns which rows match the `where` metadata filter, if there is one."""
+        if where is None:
+            return None
+        return np.fromiter(
+            (matches(metadata, where) for metadata in self.metadatas),
+            dtype=bool,
+            count=len(self),
+        )
+
+    def search(
+        self,
+        queries: np.ndarray,
+        k: int,
+        where: dict[str, Any] | None = None,
+        include_embeddings: bool = False,
+        nprobe: int | None = None,
+    ) -> list[LocalQueryResult]:
+        """Returns the `k` best matches of each query by scoring every vector."""
+        return [
+            self._result(rows, scores, include_embeddings)
+            for rows, scores in search_vectors(
+                self.prepare(queries), self.vectors, k, self.mask(where)
+            )
+        ]
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _result(
+        self, rows: np.ndarray, scores: np.ndarray, include_embeddings: bool
+    ) -> LocalQueryResult:
+        return LocalQueryResult(
+            ids=[self.ids[row] for row in rows],
+            documents=[self.documents[row] for row in rows],
+            metadatas=[self.metadatas[row] for row in rows],
+            scores=scores.tolist(),
+            embeddings=self.vectors[rows].tolist() if include_embeddings else None,
+        )
+
+    def _reserve(self, rows: int, dimensions: int) -> None:
+        """Grows the matrix to hold at least `rows` vectors."""
+        if self._matrix is None:
+            self._matrix = np.empty((max(rows, 16), dimensions), dtype=np.float32)
+        elif len(self._matrix) < rows:
+            matrix = np.empty(
+                (max(rows, 2 * len(self._matrix)), dimensions), np.float32
+            )
+            matrix[: len(self._matrix)] = self._matrix
+            self._matrix = matrix
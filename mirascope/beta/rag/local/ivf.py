@@ -0,0 +1,211 @@
+"""An approximate nearest neighbor index for local vectorstores."""
+
+import time
+from typing import Any, Literal
+
+import numpy as np
+
+from .index import FlatIndex, top_k
+from .types import IVFBenchmarkResult, LocalQueryResult
+
+# Bounds the `(vectors, centroids)` distance matrix computed at once
+_MAX_DISTANCES = 1 << 24
+
+
+def nearest_centroids(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Returns the index of the centroid closest to each vector (in L2 distance)."""
+    squared_norms = (centroids * centroids).sum(axis=1)
+    step = max(1, _MAX_DISTANCES // len(centroids))
+    return np.concatenate(
+        [
+            np.argmin(squared_norms - 2 * vectors[i : i + step] @ centroids.T, axis=1)
+            for i in range(0, len(vectors), step)
+        ]
+        or [np.empty(0, dtype=np.int64)]
+    )
+
+
+def kmeans(
+    vectors: np.ndarray, k: int, iterations: int = 10, seed: int = 0
+) -> np.ndarray:
+    """Returns `k` centroids of the vectors found by Lloyd's algorithm.
+
+    Clusters that end up empty are restarted at a random vector.
+    """
+    rng = np.random.default_rng(seed)
+    centroids = vectors[rng.choice(len(vectors), k, replace=False)].astype(np.float32)
+    for _ in range(iterations):
+        assignments = nearest_centroids(vectors, centroids)
+        order = np.argsort(assignments, kind="stable")
+        clusters, starts, counts = np.unique(
+            assignments[order], return_index=True, return_counts=True
+        )
+        sums = np.add.reduceat(vectors[order], starts, axis=0)
+        centroids[clusters] = sums / counts[:, None]
+        empty = np.setdiff1d(np.arange(k), clusters)
+        centroids[empty] = vectors[rng.choice(len(vectors), len(empty))]
+    return centroids
+
+
+class IVFIndex(FlatIndex):
+    """An inverted file index that only scores the vectors of the closest clusters.
+
+    Once the index holds `train_size` vectors, it clusters them into `nlist` clusters
+    with k-means and keeps the rows of each cluster in an inverted list. A query then
+    scores the centroids, and only the vectors in its `nprobe` closest clusters, so
+    higher values of `nprobe` trade latency for recall. Vectors added later are assigned
+    to their closest centroid without retraining. Until it is trained, or if `nprobe`
+    is at least `nlist`, the index is searched exhaustively.
+    """
+
+    def __init__(
+        self,
+        metric: Literal["cosine", "dot"] = "cosine",
+        nlist: int = 256,
+        nprobe: int = 8,
+        train_size: int | None = None,
+        seed: int = 0,
+    ) -> None:
+        """Initializes an empty index.
+
+        Args:
+            metric: `cosine` or `dot`.
+            nlist: The number of clusters.
+            nprobe: The default number of clusters searched by each query.
+            train_size: The number of vectors at which the index is trained, by default
+                `39 * nlist`, the fewest for which k-means gives stable clusters.
+            seed: The seed of the random sampling of k-means.
+        """
+        super().__init__(metric)
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.train_size = 39 * nlist if train_size is None else train_size
+        self.seed = seed
+        self.centroids: np.ndarray | None = None
+        self._assignments = np.empty(0, dtype=np.int64)
+        self._lists: list[list[np.ndarray]] = []
+
+    def add(
+        self,
+        ids: list[str],
+        vectors: np.ndarray,
+        documents: list[str],
+        metadatas: list[dict[str, Any] | None],
+    ) -> None:
+        """Adds the vectors to the index and to the inverted list of their cluster."""
+        super().add(ids, vectors, documents, metadatas)
+        if self.centroids is not None:
+            self._assign(np.fromiter((self._rows[id] for id in ids), dtype=np.int64))
+        elif len(self) >= self.train_size:
+            self.train()
+
+    def train(self, sample_size: int | None = None) -> None:
+        """Clusters (a sample of) the vectors and assigns every vector to a cluster.
+
+        Args:
+            sample_size: The number of vectors k-means runs on, `256 * nlist` by default.
+        """
+        vectors = self.vectors
+        rng = np.random.default_rng(self.seed)
+        sample_size = min(len(vectors), sample_size or 256 * self.nlist)
+        sample = vectors[np.sort(rng.choice(len(vectors), sample_size, replace=False))]
+        self.centroids = kmeans(sample, min(self.nlist, sample_size), seed=self.seed)
+        self._assignments = np.empty(0, dtype=np.int64)
+        self._lists = [[] for _ in self.centroids]
+        self._assign(np.arange(len(vectors)))
+
+    def search(
+        self,
+        queries: np.ndarray,
+        k: int,
+        where: dict[str, Any] | None = None,
+        include_embeddings: bool = False,
+        nprobe: int | None = None,
+    ) -> list[LocalQueryResult]:
+        """Returns the `k` best matches of each query among its `nprobe` clusters."""
+        nprobe = self.nprobe if nprobe is None else nprobe
+        if self.centroids is None or nprobe >= len(self.centroids):
+            return super().search(queries, k, where, include_embeddings)
+        queries, vectors, mask = self.prepare(queries), self.vectors, self.mask(where)
+        # The closest centroids in L2 distance, as vectors were assigned to clusters
+        closeness = queries @ self.centroids.T - (self.centroids**2).sum(axis=1) / 2
+        results: list[LocalQueryResult] = []
+        for query, probes in zip(queries, top_k(closeness, nprobe), strict=True):
+            rows = np.concatenate([self._list(cluster) for cluster in probes])
+            if mask is not None:
+                rows = rows[mask[rows]]
+            scores = vectors[rows] @ query
+            best = top_k(scores[None], k)[0] if len(rows) else rows
+            results.append(self._result(rows[best], scores[best], include_embeddings))
+        return results
+
+    def benchmark(
+        self,
+        queries: np.ndarray,
+        k: int = 10,
+        nprobes: tuple[int, ...] = (1, 2, 4, 8, 16, 32, 64),
+    ) -> list[IVFBenchmarkResult]:
+        """Measures the recall and latency of each `nprobe` against exhaustive search.
+
+        Args:
+            queries: A `(num_queries, dimensions)` array of query vectors.
+            k: The number of matches per query.
+            nprobes: The values of `nprobe` to measure.
+
+        Returns:
+            The recall at `k` and mean latency per query of each `nprobe`.
+        """
+        start = time.perf_counter()
+        exact = FlatIndex.search(self, queries, k)
+        exact_latency = (time.perf_counter() - start) * 1000 / len(queries)
+        benchmarks: list[IVFBenchmarkResult] = []
+        for nprobe in nprobes:
+            start = time.perf_counter()
+            approximate = self.search(queries, k, nprobe=nprobe)
+            latency = (time.perf_counter() - start) * 1000 / len(queries)
+            recall = np.mean(
+                [
+                    len(set(found.ids) & set(truth.ids)) / max(1, len(truth.ids))
+                    for found, truth in zip(approximate, exact, strict=True)
+                ]
+            )
+            benchmarks.append(
+                IVFBenchmarkResult(
+                    nprobe=nprobe,
+                    recall=float(recall),
+                    latency_ms=latency,
+                    exact_latency_ms=exact_latency,
+                )
+            )
+        return benchmarks
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _assign(self, rows: np.ndarray) -> None:
+        """Appends the rows to the inverted lists of their closest centroids."""
+        assert self.centroids is not None
+        # A re-added row leaves a stale entry in its old list, which `_list` drops
+        for cluster in np.unique(
+            self._assignments[rows[rows < len(self._assignments)]]
+        ):
+            self._lists[cluster].append(np.empty(0, dtype=np.int64))
+        if len(self._assignments) < len(self):
+            assignments = np.empty(len(self), dtype=np.int64)
+            assignments[: len(self._assignments)] = self._assignments
+            self._assignments = assignments
+        clusters = nearest_centroids(self.vectors[rows], self.centroids)
+        self._assignments[rows] = clusters
+        order = np.argsort(clusters, kind="stable")
+        unique, starts = np.unique(clusters[order], return_index=True)
+        for cluster, cluster_rows in zip(
+            unique, np.split(rows[order], starts[1:]), strict=True
+        ):
+            self._lists[cluster].append(cluster_rows)
+
+    def _list(self, cluster: int) -> np.ndarray:
+        """Returns the rows of a cluster, merging the chunks appended since last time."""
+        chunks = self._lists[cluster]
+        if len(chunks) != 1:
+            rows = np.unique(np.concatenate(chunks or [np.empty(0, dtype=np.int64)]))
+            chunks[:] = [rows[self._assignments[rows] == cluster]]
+        return chunks[0]
@@ -0,0 +1,62 @@
+"""Scalar and binary quantization of vectors for local vectorstores."""
+
+from typing import Literal, TypeAlias
+
+import numpy as np
+
+Quantization: TypeAlias = Literal["int8", "binary"]
+
+# Bounds the codes decoded to float32 at once to 16MB
+_MAX_ELEMENTS = 1 << 22
+
+
+def quantize(
+    vectors: np.ndarray, quantization: Quantization
+) -> tuple[np.ndarray, np.ndarray | None]:
+    """Returns the codes of the vectors and, for `int8`, the scale of each vector.
+
+    - `int8` maps each vector to integers in `[-127, 127]` scaled by its largest
+      absolute value, using 4x less memory than float32.
+    - `binary` keeps the sign bit of each dimension, packed 8 per byte, using 32x
+      less memory than float32.
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if quantization == "binary":
+        return np.packbits(vectors > 0, axis=-1), None
+    scales = np.abs(vectors).max(axis=-1) / 127
+    scales[scales == 0] = 1
+    codes = np.rint(vectors / scales[..., None]).astype(np.int8)
+    return codes, scales.astype(np.float32)
+
+
+def approximate_scores(
+    queries: np.ndarray,
+    codes: np.ndarray,
+    scales: np.ndarray | None,
+    quantization: Quantization,
+) -> np.ndarray:
+    """Returns the approximate `(num_queries, num_codes)` scores of the queries.
+
+    The queries stay at full precision: `int8` scores approximate the dot product of
+    the original vectors, and `binary` scores are the dot product with the `+1`/`-1`
+    signs of the original vectors, which is more accurate than the Hamming distance
+    between binarized queries and codes.
+    """
+    if quantization == "binary":
+        # Pad the queries to the packed bits, so padding bits don't affect scores
+        padded = np.zeros((len(queries), codes.shape[1] * 8), dtype=np.float32)
+        padded[:, : queries.shape[1]] = queries
+        queries = padded
+    scores = np.empty((len(queries), len(codes)), dtype=np.float32)
+    step = max(1, _MAX_ELEMENTS // queries.shape[1])
+    for start in range(0, len(codes), step):
+        if quantization == "binary":
+            bits = np.unpackbits(codes[start : start + step], axis=1)
+            chunk = bits.astype(np.float32) * 2 - 1
+        else:
+            chunk = codes[start : start + step].astype(np.float32)
+        chunk_scores = queries @ chunk.T
+        if scales is not None:
+            chunk_scores *= scales[start : start + step]
+        scores[:, start : start + len(chunk)] = chunk_scores
+    return scores
@@ -0,0 +1,466 @@
+"""A persistent index of memory-mapped, append-only segments for local vectorstores."""
+
+import json
+import logging
+import mmap
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Literal
+
+import numpy as np
+
+from .index import BaseIndex, check_vectors, matches, search_vectors, top_k
+from .quantization import Quantization, approximate_scores, quantize
+from .types import LocalQueryResult
+
+_MANIFEST = "manifest.json"
+_SEGMENT_NAME = re.compile(r"[0-9a-f]{32}")
+_SEGMENT_FILE = re.compile(
+    r"(vectors|offsets|(codes|scales)-\w+)\.npy|ids\.json|records\.jsonl"
+)
+# Orphans modified more recently may still be written or listed by another writer
+_ORPHAN_AGE = 60.0
+
+logger = logging.getLogger(__name__)
+
+
+class Segment:
+    """An immutable directory of vectors, ids, and records, opened lazily.
+
+    - `vectors.npy` holds the `(rows, dimensions)` float32 vectors, memory-mapped.
+    - `ids.json` holds the id of each row.
+    - `records.jsonl` holds the document and metadata of each row, one per line.
+    - `offsets.npy` holds the byte offset of each line in `records.jsonl`, so a record
+      is read without parsing the records before it.
+    - `codes-{quantization}.npy` (and `scales-int8.npy`) optionally hold the quantized
+      vectors, memory-mapped.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initializes the segment stored in the directory at `path`."""
+        self.path = path
+        self._codes: dict[Quantization, tuple[np.ndarray, np.ndarray | None]] = {}
+
+    @classmethod
+    def write(
+        cls,
+        path: Path,
+        ids: list[str],
+        vectors: np.ndarray,
+        documents: list[str],
+        metadatas: list[dict[str, Any] | None],
+        quantization: Quantization | None = None,
+    ) -> "Segment":
+        """Writes a new segment to the directory at `path` and returns it."""
+        path.mkdir(parents=True)
+        np.save(path / "vectors.npy", np.ascontiguousarray(vectors, dtype=np.float32))
+        if quantization is not None:
+            codes, scales = quantize(vectors, quantization)
+            np.save(path / f"codes-{quantization}.npy", codes)
+            if scales is not None:
+                np.save(path / f"scales-{quantization}.npy", scales)
+        (path / "ids.json").write_text(json.dumps(ids))
+        offsets = np.zeros(len(ids) + 1, dtype=np.int64)
+        with open(path / "records.jsonl", "wb") as file:
+            for i, (document, metadata) in enumerate(
+                zip(documents, metadatas, strict=True)
+            ):
+                line = json.dumps([document, metadata]).encode("utf-8") + b"\n"
+                offsets[i + 1] = offsets[i] + file.write(line)
+        np.save(path / "offsets.npy", offsets)
+        return cls(path)
+
+    def __len__(self) -> int:
+        """Returns the number of rows in the segment."""
+        return len(self.ids)
+
+    @cached_property
+    def vectors(self) -> np.ndarray:
+        """The memory-mapped vectors of the segment."""
+        return np.load(self.path / "vectors.npy", mmap_mode="r")
+
+    @cached_property
+    def ids(self) -> list[str]:
+        """The id of each row of the segment."""
+        return json.loads((self.path / "ids.json").read_text())
+
+    @cached_property
+    def metadatas(self) -> list[dict[str, Any] | None]:
+        """The metadata of each row of the segment, read when first filtering."""
+        return [metadata for _, metadata in self.records(range(len(self)))]
+
+    def codes(self, quantization: Quantization) -> tuple[np.ndarray, np.ndarray | None]:
+        """Returns the quantized vectors of the segment and their scales.
+
+        Segments written without these codes are quantized in memory when first used.
+        """
+        if quantization not in self._codes:
+            try:
+                codes = np.load(self.path / f"codes-{quantization}.npy", mmap_mode="r")
+                scales = (
+                    np.load(self.path / f"scales-{quantization}.npy", mmap_mode="r")
+                    if quantization == "int8"
+                    else None
+                )
+                self._codes[quantization] = (codes, scales)
+            except FileNotFoundError:
+                self._codes[quantization] = quantize(self.vectors, quantization)
+        return self._codes[quantization]
+
+    def records(self, rows: Any) -> list[tuple[str, dict[str, Any] | None]]:  # noqa: ANN401
+        """Returns the document and metadata of each of the given rows."""
+        offsets, records = self._offsets, self._records
+        return [
+            tuple(json.loads(records[offsets[row] : offsets[row + 1]])) for row in rows
+        ]
+
+    ############################# PRIVATE PROPERTIES #################################
+
+    @cached_property
+    def _offsets(self) -> np.ndarray:
+        return np.load(self.path / "offsets.npy", mmap_mode="r")
+
+    @cached_property
+    def _records(self) -> mmap.mmap:
+        with open(self.path / "records.jsonl", "rb") as file:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class SegmentedIndex(BaseIndex):
+    """A persistent index that appends a new immutable segment on every `add`.
+
+    The segments of the index are listed in a manifest that is replaced atomically, and
+    each segment is memory-mapped only when first searched, so opening an index is
+    instant and its vectors live in the OS page cache rather than the process heap.
+    Several processes can therefore share one index, with a single writer and any
+    number of `read_only` readers that pick up new segments as they are written.
+
+    Adding an id that is already in the index shadows its older row. Once there are
+    more than `max_segments` segments, they are merged into one in a background thread,
+    dropping shadowed rows. Segments left behind by an interrupted `add` or compaction
+    are never listed in the manifest, and are removed when a writer next opens the index
+    (see `_remove_orphans`).
+
+    With a `quantization`, queries scan the 4x (`int8`) or 32x (`binary`) smaller
+    quantized vectors and only rescore the best `rescore * k` candidates with the
+    full-precision vectors, which then stay on disk except for the rows rescored.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        metric: Literal["cosine", "dot"] = "cosine",
+        max_segments: int = 8,
+        read_only: bool = False,
+        quantization: Quantization | None = None,
+        rescore: int = 4,
+    ) -> None:
+        """Opens (or creates) the index stored in the directory at `path`."""
+        self.path = Path(path)
+        self.metric = metric
+        self.max_segments = max_segments
+        self.read_only = read_only
+        self.quantization = quantization
+        self.rescore = rescore
+        self._lock = threading.RLock()
+        self._compaction_lock = threading.Lock()
+        self._manifest_stat: tuple[int, int, int] | None = None
+        self._segments: list[Segment] = []
+        self._live: dict[str, np.ndarray] | None = None
+        self._locations: dict[str, tuple[Segment, int]] = {}
+        if not read_only:
+            self.path.mkdir(parents=True, exist_ok=True)
+            self._remove_orphans()
+
+    def __len__(self) -> int:
+        """Returns the number of (unshadowed) vectors in the index."""
+        with self._lock:
+            self._refresh()
+            self._get_live()
+            return len(self._locations)
+
+    @property
+    def segments(self) -> list[Segment]:
+        """The current segments of the index, oldest first."""
+        with self._lock:
+            self._refresh()
+            return list(self._segments)
+
+    def add(
+        self,
+        ids: list[str],
+        vectors: np.ndarray,
+        documents: list[str],
+        metadatas: list[dict[str, Any] | None],
+    ) -> None:
+        """Writes the vectors to a new segment, shadowing ids already in the index."""
+        if self.read_only:
+            raise ValueError("Cannot add to a read-only index.")
+        if not ids:
+            return
+        with self._lock:
+            self._refresh()
+            dimensions = self._segments[-1].vectors.shape[1] if self._segments else None
+        vectors = check_vectors(ids, vectors, documents, metadatas, dimensions)
+        # Within a batch, the last occurrence of an id wins
+        last = list({id: i for i, id in enumerate(ids)}.values())
+        vectors = self.prepare(vectors)[last]
+        segment = Segment.write(
+            self.path / uuid.uuid4().hex,
+            [ids[i] for i in last],
+            vectors,
+            [documents[i] for i in last],
+            [metadatas[i] for i in last],
+            self.quantization,
+        )
+        with self._lock:
+            self._refresh()
+            live = self._live
+            self._write_manifest([*self._segments, segment])
+            if live is not None:
+                self._live = self._shadow(live, segment)
+            if (
+                len(self._segments) > self.max_segments
+                and not self._compaction_lock.locked()
+            ):
+                threading.Thread(
+                    target=self._compact_in_background, daemon=True
+                ).start()
+
+    def compact(self) -> None:
+        """Merges the current segments into one, dropping shadowed rows.
+
+        Segments added while compacting are kept as they are, so `add` and `search`
+        are only blocked while the manifest is swapped.
+        """
+        if self.read_only:
+            raise ValueError("Cannot compact a read-only index.")
+        with self._compaction_lock:
+            with self._lock:
+                self._refresh()
+                segments, live = list(self._segments), self._get_live()
+            if len(segments) < 2:
+                return
+            ids, vectors, documents, metadatas = [], [], [], []
+            for segment in segments:
+                rows = np.flatnonzero(live[segment.path.name])
+                ids.extend(segment.ids[row] for row in rows)
+                vectors.append(segment.vectors[rows])
+                for document, metadata in segment.records(rows):
+                    documents.append(document)
+                    metadatas.append(metadata)
+            merged = (
+                [
+                    Segment.write(
+                        self.path / uuid.uuid4().hex,
+                        ids,
+                        np.concatenate(vectors),
+                        documents,
+                        metadatas,
+                        self.quantization,
+                    )
+                ]
+                if ids
+                else []
+            )
+            with self._lock:
+                self._refresh()
+                self._write_manifest([*merged, *self._segments[len(segments) :]])
+            for segment in segments:
+                shutil.rmtree(segment.path, ignore_errors=True)
+
+    def search(
+        self,
+        queries: np.ndarray,
+        k: int,
+        where: dict[str, Any] | None = None,
+        include_embeddings: bool = False,
+        nprobe: int | None = None,
+    ) -> list[LocalQueryResult]:
+        """Returns the `k` best matches of each query by scoring every segment."""
+        try:
+            return self._search(self.prepare(queries), k, where, include_embeddings)
+        except FileNotFoundError:
+            # A writer compacted the segments we were about to open, so reload them
+            with self._lock:
+                self._manifest_stat = None
+            return self._search(self.prepare(queries), k, where, include_embeddings)
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _search(
+        self,
+        queries: np.ndarray,
+        k: int,
+        where: dict[str, Any] | None,
+        include_embeddings: bool,
+    ) -> list[LocalQueryResult]:
+        with self._lock:
+            self._refresh()
+            segments, live = list(self._segments), self._get_live()
+        candidates: list[list[tuple[Segment, np.ndarray, np.ndarray]]] = [
+            [] for _ in queries
+        ]
+        for segment in segments:
+            mask = live[segment.path.name]
+            if where is not None:
+                mask = mask & np.fromiter(
+                    (matches(metadata, where) for metadata in segment.metadatas),
+                    dtype=bool,
+                    count=len(segment),
+                )
+            for i, (rows, scores) in enumerate(
+                search_vectors(queries, segment.vectors, k, mask)
+                if self.quantization is None
+                else self._search_quantized(queries, segment, k, mask)
+            ):
+                candidates[i].append((segment, rows, scores))
+        return [self._result(found, k, include_embeddings) for found in candidates]
+
+    def _search_quantized(
+        self, queries: np.ndarray, segment: Segment, k: int, mask: np.ndarray
+    ) -> list[tuple[np.ndarray, np.ndarray]]:
+        """Finds candidates with the quantized vectors and rescores them exactly."""
+        assert self.quantization is not None
+        codes, scales = segment.codes(self.quantization)
+        approximate = approximate_scores(queries, codes, scales, self.quantization)
+        approximate[:, ~mask] = -np.inf
+        best = top_k(approximate, self.rescore * k)
+        results: list[tuple[np.ndarray, np.ndarray]] = []
+        for query, rows, scores in zip(
+            queries, best, np.take_along_axis(approximate, best, axis=1), strict=True
+        ):
+            # Reading the rows in order keeps the reads from disk sequential
+            rows = np.sort(rows[np.isfinite(scores)])
+            scores = segment.vectors[rows] @ query
+            exact = top_k(scores[None], k)[0]
+            results.append((rows[exact], scores[exact]))
+        return results
+
+    def _compact_in_background(self) -> None:
+        try:
+            self.compact()
+        except Exception:
+            # Nothing is lost, as the segments stay listed until they've been merged
+            logger.exception("Failed to compact the segments of %s", self.path)
+
+    def _remove_orphans(self) -> None:
+        """Removes segments and manifests not listed in the current manifest.
+
+        Only entries this index could have written are removed: temporary manifests,
+        and directories with a segment name that hold nothing but segment files. They
+        must also be older than `_ORPHAN_AGE`, so a segment another writer is still
+        writing or about to list is kept. Without a manifest, nothing is removed, as
+        the directory may hold something other than an index (e.g. other stores).
+        """
+        try:
+            names = set(json.loads((self.path / _MANIFEST).read_text())["segments"])
+        except FileNotFoundError:
+            return
+        cutoff = time.time() - _ORPHAN_AGE
+        for child in self.path.iterdir():
+            try:
+                if child.name.startswith(f"{_MANIFEST}."):
+                    if child.stat().st_mtime < cutoff:
+                        child.unlink(missing_ok=True)
+                elif (
+                    child.is_dir()
+                    and child.name not in names
+                    and _SEGMENT_NAME.fullmatch(child.name)
+                ):
+                    files = list(child.iterdir())
+                    if (
+                        files
+                        and all(_SEGMENT_FILE.fullmatch(file.name) for file in files)
+                        and max(file.stat().st_mtime for file in files) < cutoff
+                    ):
+                        shutil.rmtree(child, ignore_errors=True)
+            except FileNotFoundError:
+                # Another writer removed it first
+                continue
+
+    def _refresh(self) -> None:
+        """Reloads the manifest if it was replaced since it was last read."""
+        try:
+            stat = (self.path / _MANIFEST).stat()
+        except FileNotFoundError:
+            return
+        # The manifest is replaced rather than modified, so a new one has a new inode
+        manifest_stat = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if manifest_stat == self._manifest_stat:
+            return
+        names = json.loads((self.path / _MANIFEST).read_text())["segments"]
+        opened = {segment.path.name: segment for segment in self._segments}
+        self._segments = [
+            opened.get(name) or Segment(self.path / name) for name in names
+        ]
+        self._manifest_stat, self._live = manifest_stat, None
+
+    def _write_manifest(self, segments: list[Segment]) -> None:
+        """Atomically replaces the manifest so readers never see a partial one."""
+        temporary = self.path / f"{_MANIFEST}.{uuid.uuid4().hex}"
+        temporary.write_text(
+            json.dumps({"segments": [segment.path.name for segment in segments]})
+        )
+        os.replace(temporary, self.path / _MANIFEST)
+        stat = (self.path / _MANIFEST).stat()
+        self._segments, self._live = segments, None
+        self._manifest_stat = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _get_live(self) -> dict[str, np.ndarray]:
+        """Returns which rows of each segment are not shadowed by a newer segment."""
+        if self._live is None:
+            self._locations, live = {}, {}
+            for segment in self._segments:
+                live = self._shadow(live, segment)
+            self._live = live
+        return self._live
+
+    def _shadow(
+        self, live: dict[str, np.ndarray], segment: Segment
+    ) -> dict[str, np.ndarray]:
+        """Adds the newest `segment` to `live`, shadowing the older rows of its ids.
+
+        Searches may still be reading `live`, so its masks are copied before they're
+        changed rather than changed in place.
+        """
+        live = dict(live)
+        copied: set[str] = set()
+        for row, id in enumerate(segment.ids):
+            if (location := self._locations.get(id)) is not None:
+                name = location[0].path.name
+                if name not in copied:
+                    live[name] = live[name].copy()
+                    copied.add(name)
+                live[name][location[1]] = False
+            self._locations[id] = (segment, row)
+        live[segment.path.name] = np.ones(len(segment), dtype=bool)
+        return live
+
+    def _result(
+        self,
+        candidates: list[tuple[Segment, np.ndarray, np.ndarray]],
+        k: int,
+        include_embeddings: bool,
+    ) -> LocalQueryResult:
+        """Merges the best matches of each segment into the best matches overall."""
+        segments = [segment for segment, rows, _ in candidates for _ in rows]
+        rows = np.concatenate([rows for _, rows, _ in candidates] or [[]]).astype(int)
+        scores = np.concatenate([scores for _, _, scores in candidates] or [[]])
+        best = top_k(scores[None], k)[0] if len(scores) else []
+        records = [segments[i].records([rows[i]])[0] for i in best]
+        return LocalQueryResult(
+            ids=[segments[i].ids[rows[i]] for i in best],
+            documents=[document for document, _ in records],
+            metadatas=[metadata for _, metadata in records],
+            scores=[float(scores[i]) for i in best],
+            embeddings=[segments[i].vectors[rows[i]].tolist() for i in best]
+            if include_embeddings
+            else None,
+        )
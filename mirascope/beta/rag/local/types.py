@@ -0,0 +1,76 @@
+"""Types for interacting with local vectorstores using Mirascope."""
+
+from typing import Any, Literal
+
+from pydantic import BaseModel
+
+from ..base.vectorstore_params import BaseVectorStoreParams
+from .quantization import Quantization
+
+
+class LocalParams(BaseVectorStoreParams):
+    """The parameters for a local vectorstore
+
+    Attributes:
+        metric: `cosine` normalizes vectors when they are added, `dot` scores the raw
+            inner product.
+        top_k: The number of results to retrieve when no `top_k` is given.
+        index: `flat` scores every vector, `ivf` only those in the `nprobe` clusters
+            closest to a query (see `IVFIndex`).
+        nlist: The number of clusters of an `ivf` index.
+        nprobe: The number of clusters an `ivf` query searches when no `nprobe` is
+            given. Higher values have better recall but higher latency.
+        quantization: Whether to search `int8` or `binary` quantized vectors of a
+            persistent index, rescoring the best candidates at full precision.
+        rescore: The number of candidates rescored per result with `quantization`.
+    """
+
+    metric: Literal["cosine", "dot"] = "cosine"
+    top_k: int = 8
+    index: Literal["flat", "ivf"] = "flat"
+    nlist: int = 256
+    nprobe: int = 8
+    quantization: Quantization | None = None
+    rescore: int = 4
+
+
+class LocalSettings(BaseModel):
+    """Settings for where a local vectorstore keeps its vectors
+
+    Attributes:
+        path: The directory of a persistent `SegmentedIndex`, or `None` to keep the
+            vectors in memory. The `index_name` of the store is used as a subdirectory.
+        max_segments: The number of segments above which they are compacted.
+        read_only: Whether to open the index as a reader, e.g. in worker processes
+            that share an index written by another process.
+    """
+
+    path: str | None = None
+    max_segments: int = 8
+    read_only: bool = False
+
+
+class LocalQueryResult(BaseModel):
+    """The result of a local vectorstore query, ordered from best to worst match."""
+
+    ids: list[str]
+    documents: list[str]
+    metadatas: list[dict[str, Any] | None]
+    scores: list[float]
+    embeddings: list[list[float]] | None = None
+
+
+class IVFBenchmarkResult(BaseModel):
+    """The recall and latency of an `IVFIndex` for one value of `nprobe`
+
+    Attributes:
+        nprobe: The number of clusters searched.
+        recall: The mean fraction of the exact top-k that the index returned.
+        latency_ms: The mean latency of a query in milliseconds.
+        exact_latency_ms: The mean latency of an exhaustive query in milliseconds.
+    """
+
+    nprobe: int
+    recall: float
+    latency_ms: float
+    exact_latency_ms: float
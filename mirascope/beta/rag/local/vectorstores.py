@@ -0,0 +1,301 @@
+"""A module for an in-process vectorstore backed by NumPy."""
+
+import asyncio
+import threading
+from collections.abc import Generator
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, ClassVar
+
+import numpy as np
+from pydantic import PrivateAttr
+
+from ..base.document import Document
+from ..base.embedding_response import BaseEmbeddingResponse
+from ..base.vectorstores import BaseVectorStore
+from .index import BaseIndex, FlatIndex
+from .ivf import IVFIndex
+from .segments import SegmentedIndex
+from .types import LocalParams, LocalQueryResult, LocalSettings
+
+
+class _ReadWriteLock:
+    """A lock held by any number of readers or by a single writer.
+
+    Waiting writers block new readers, so a steady stream of searches can't starve
+    writes.
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._readers = 0
+        self._writers = 0
+        self._writing = False
+
+    @contextmanager
+    def read(self) -> Generator[None, None, None]:
+        with self._condition:
+            while self._writing or self._writers:
+                self._condition.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def write(self) -> Generator[None, None, None]:
+        with self._condition:
+            self._writers += 1
+            while self._writing or self._readers:
+                self._condition.wait()
+            self._writers -= 1
+            self._writing = True
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writing = False
+                self._condition.notify_all()
+
+
+class LocalVectorStore(BaseVectorStore):
+    """A vectorstore that runs in-process and searches its vectors with NumPy.
+
+    By default, all vectors are rows of a single in-memory float32 matrix, so a query
+    is one matrix product followed by a linear-time top-k selection. This needs no
+    external service and is fast for corpora of up to a few million vectors.
+
+    For larger corpora, `vectorstore_params.index="ivf"` only searches the `nprobe`
+    clusters of vectors closest to each query (see `IVFIndex`). With a
+    `client_settings.path`, the vectors instead persist in a memory-mapped
+    `SegmentedIndex` that opens instantly and can be shared by several processes.
+    Persistent stores can also search `int8` or `binary` quantized vectors with
+    `vectorstore_params.quantization`, which requires an embedder with float
+    embeddings so the best candidates can be rescored at full precision.
+
+    Example:
+
+    ```python
+    from mirascope.beta.rag import TextChunker
+    from mirascope.beta.rag.local import LocalParams, LocalSettings, LocalVectorStore
+    from mirascope.beta.rag.openai import OpenAIEmbedder
+
+
+    class MyStore(LocalVectorStore):
+        embedder = OpenAIEmbedder()
+        chunker = TextChunker(chunk_size=1000, chunk_overlap=200)
+        index_name = "my-store-0001"
+        vectorstore_params = LocalParams(metric="cosine", top_k=4)
+        client_settings = LocalSettings(path="./vectors")
+
+    my_store = MyStore()
+    with open(f"{PATH_TO_FILE}") as file:
+        data = file.read()
+        my_store.add(data)
+    documents = my_store.retrieve("my question").documents
+    print(documents)
+    ```
+    """
+
+    vectorstore_params: ClassVar[LocalParams] = LocalParams()
+    client_settings: ClassVar[LocalSettings] = LocalSettings()
+    _provider: ClassVar[str] = "local"
+    _embeds_before_upsert: ClassVar[bool] = True
+
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _index_lock: _ReadWriteLock = PrivateAttr(default_factory=_ReadWriteLock)
+    _index: BaseIndex | None = PrivateAttr(None)
+
+    def retrieve(
+        self,
+        text: str,
+        top_k: int | None = None,
+        where: dict[str, Any] | None = None,
+        include_embeddings: bool = False,
+        nprobe: int | None = None,
+    ) -> LocalQueryResult:
+        """Queries the vectorstore for closest match
+
+        Args:
+            text: The text to query.
+            top_k: The number of results, `vectorstore_params.top_k` by default.
+            where: Only documents whose metadata has all of these key-value pairs match.
+            include_embeddings: Whether to return the embeddings of the results.
+            nprobe: The number of clusters an `ivf` index searches, by default
+                `vectorstore_params.nprobe`.
+        """
+        return self.retrieve_many([text], top_k, where, include_embeddings, nprobe)[0]
+
+    def retrieve_many(
+        self,
+        texts: list[str],
+        top_k: int | None = None,
+        where: dict[str, Any] | None = None,
+        include_embeddings: bool = False,
+        nprobe: int | None = None,
+    ) -> list[LocalQueryResult]:
+        """Queries the vectorstore for the closest matches of each text at once
+
+        The texts are embedded in a single call and scored with a single matrix
+        product, so this is much faster than calling `retrieve` for each text.
+        """
+        if not texts:
+            return []
+        return self.query(
+            self._embed(texts),
+            top_k,
+            where,
+            include_embeddings,
+            nprobe,
+        )
+
+    async def retrieve_async(
+        self,
+        text: str,
+        top_k: int | None = None,
+        where: dict[str, Any] | None = None,
+        include_embeddings: bool = False,
+        nprobe: int | None = None,
+    ) -> LocalQueryResult:
+        """Asynchronously queries the vectorstore for closest match
+
+        The text is embedded with `embed_async`, and the search runs in a worker thread.
+        """
+        self._check_embedding_type()
+        embedding_response = await self.embedder.embed_async([text])
+        results = await asyncio.to_thread(
+            self.query,
+            embedding_response.embeddings_array,
+            top_k,
+            where,
+            include_embeddings,
+            nprobe,
+        )
+        return results[0]
+
+    def query(
+        self,
+        embeddings: np.ndarray,
+        top_k: int | None = None,
+        where: dict[str, Any] | None = None,
+        include_embeddings: bool = False,
+        nprobe: int | None = None,
+    ) -> list[LocalQueryResult]:
+        """Queries the vectorstore for the closest matches of each embedding"""
+        k = self.vectorstore_params.top_k if top_k is None else top_k
+        index = self._get_index()
+        # Searches only read the index, so any number of them run at once (NumPy
+        # releases the GIL while scoring), and only wait for adds to finish
+        with self._index_lock.read():
+            return index.search(embeddings, k, where, include_embeddings, nprobe)
+
+    def add(self, text: str | list[Document], **kwargs: Any) -> None:  # noqa: ANN401
+        """Takes unstructured data and upserts into vectorstore"""
+        documents: list[Document]
+        if isinstance(text, str):
+            chunk = self.chunker.chunk
+            documents = chunk(text)
+        else:
+            documents = text
+        if not documents:
+            return
+        self._upsert(documents, self.embedder.embed([d.text for d in documents]))
+
+    async def add_async(self, text: str | list[Document], **kwargs: Any) -> None:  # noqa: ANN401
+        """Asynchronously takes unstructured data and upserts into vectorstore
+
+        The documents are embedded with `embed_async`, and added in a worker thread.
+        """
+        documents: list[Document]
+        if isinstance(text, str):
+            chunk = self.chunker.chunk
+            documents = chunk(text)
+        else:
+            documents = text
+        if not documents:
+            return
+        self._check_embedding_type()
+        embedding_response = await self.embedder.embed_async(
+            [document.text for document in documents]
+        )
+        await asyncio.to_thread(self._upsert, documents, embedding_response)
+
+    def __len__(self) -> int:
+        """Returns the number of documents in the vectorstore."""
+        return len(self._get_index())
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _embed(self, texts: list[str]) -> np.ndarray:
+        """Embeds the texts as a float32 array, checking the embedder's output type."""
+        self._check_embedding_type()
+        return self.embedder.embed(texts).embeddings_array
+
+    def _check_embedding_type(self) -> None:
+        if self.embedder.embedding_type in ("binary", "ubinary"):
+            raise ValueError(
+                "Packed binary embeddings cannot be stored. Use float embeddings with "
+                '`LocalParams(quantization="binary")` instead.'
+            )
+
+    def _upsert(
+        self,
+        documents: list[Document],
+        embedding_response: BaseEmbeddingResponse | None,
+    ) -> None:
+        """Adds the documents with their embeddings to the index"""
+        if embedding_response is None:
+            raise ValueError("Embedding is None")
+        self._check_embedding_type()
+        index = self._get_index()
+        # A segmented index writes the new segment without blocking searches, and
+        # only locks (itself) to swap its manifest
+        with (
+            nullcontext()
+            if isinstance(index, SegmentedIndex)
+            else self._index_lock.write()
+        ):
+            index.add(
+                [document.id for document in documents],
+                embedding_response.embeddings_array,
+                [document.text for document in documents],
+                [document.metadata for document in documents],
+            )
+
+    def _get_index(self) -> BaseIndex:
+        with self._lock:
+            if self._index is None:
+                self._index = self._create_index()
+            return self._index
+
+    def _create_index(self) -> BaseIndex:
+        params, settings = self.vectorstore_params, self.client_settings
+        metric = params.metric
+        if settings.path is not None and params.index == "ivf":
+            raise ValueError("An `ivf` index cannot be persisted to a `path`.")
+        if params.quantization is not None:
+            # Rescoring reads full-precision vectors from disk, which only the
+            # persistent index keeps, and which quantized embeddings don't have
+            if settings.path is None or params.index == "ivf":
+                raise ValueError("Quantization requires a persistent `path`.")
+            if self.embedder.embedding_type != "float":
+                raise ValueError(
+                    "Quantization requires float embeddings to rescore, but the "
+                    f"embedder returns {self.embedder.embedding_type} embeddings."
+                )
+        if params.index == "ivf":
+            return IVFIndex(metric, nlist=params.nlist, nprobe=params.nprobe)
+        if settings.path is None:
+            return FlatIndex(metric)
+        return SegmentedIndex(
+            Path(settings.path, self.index_name or ""),
+            metric,
+            max_segments=settings.max_segments,
+            read_only=settings.read_only,
+            quantization=params.quantization,
+            rescore=params.rescore,
+        )
@@ -2,14 +2,16 @@
 
 import asyncio
 import datetime
-from concurrent.futures import ThreadPoolExecutor
-from typing import ClassVar
+import weakref
+from typing import Any, ClassVar
 
 from openai import AsyncOpenAI, OpenAI
 from openai.types import Embedding
 from openai.types.create_embedding_response import CreateEmbeddingResponse, Usage
+from pydantic import PrivateAttr
 
 from ..base.embedders import BaseEmbedder
+from ..base.embedding_response import has_numpy_module, np
 from .embedding_params import OpenAIEmbeddingParams
 from .embedding_response import OpenAIEmbeddingResponse
 
@@ -39,38 +41,33 @@ class OpenAIEmbedder(BaseEmbedder[OpenAIEmbeddingResponse]):
     )
     _provider: ClassVar[str] = "openai"
 
+    _client: OpenAI | None = PrivateAttr(None)
+    _async_clients: weakref.WeakKeyDictionary[
+        asyncio.AbstractEventLoop, AsyncOpenAI
+    ] = PrivateAttr(default_factory=weakref.WeakKeyDictionary)
+
     def embed(self, inputs: list[str]) -> OpenAIEmbeddingResponse:
         """Call the embedder with multiple inputs"""
+        embedding_responses = self._map_batches(self._embed, inputs)
         if self.embed_batch_size is None:
-            return self._embed(inputs)
-
-        input_batches = [
-            inputs[i : i + self.embed_batch_size]
-            for i in range(0, len(inputs), self.embed_batch_size)
-        ]
-
-        embedding_responses: list[OpenAIEmbeddingResponse] = list(
-            ThreadPoolExecutor(self.max_workers).map(
-                lambda inputs: self._embed(inputs),
-                input_batches,
-            )
-        )
+            return embedding_responses[0]
         return self._merge_batch_embeddings(embedding_responses)
 
     async def embed_async(self, inputs: list[str]) -> OpenAIEmbeddingResponse:
         """Asynchronously call the embedder with multiple inputs"""
+        embedding_responses = await self._map_batches_async(self._embed_async, inputs)
         if self.embed_batch_size is None:
-            return await self._embed_async(inputs)
-
-        input_batches = [
-            inputs[i : i + self.embed_batch_size]
-            for i in range(0, len(inputs), self.embed_batch_size)
-        ]
-        embedding_responses: list[OpenAIEmbeddingResponse] = await asyncio.gather(
-            *[self._embed_async(inputs) for inputs in input_batches]
-        )
+            return embedding_responses[0]
         return self._merge_batch_embeddings(embedding_responses)
 
+    def close(self) -> None:
+        """Shuts down the embedder's thread pool and closes its sync client."""
+        super().close()
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
     def __call__(self, input: list[str]) -> list[list[float]]:
         """Call the embedder with a input
 
@@ -82,12 +79,32 @@ class OpenAIEmbedder(BaseEmbedder[OpenAIEmbeddingResponse]):
 
     ############################## PRIVATE METHODS ###################################
 
-    def _embed(self, inputs: list[str]) -> OpenAIEmbeddingResponse:
-        """Call the embedder with a single input"""
-        client = OpenAI(api_key=self.api_key, base_url=self.base_url)
+    def _get_client(self) -> OpenAI:
+        with self._lock:
+            if self._client is None:
+                self._client = OpenAI(api_key=self.api_key, base_url=self.base_url)
+            return self._client
+
+    def _get_async_client(self) -> AsyncOpenAI:
+        # Async clients hold connections bound to the loop they were created in
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if (client := self._async_clients.get(loop)) is None:
+                client = self._async_clients[loop] = AsyncOpenAI(
+                    api_key=self.api_key, base_url=self.base_url
+                )
+            return client
+
+    def _kwargs(self) -> dict[str, Any]:
         kwargs = self.embedding_params.kwargs()
         if self.embedding_params.model != "text-embedding-ada-002":
             kwargs["dimensions"] = self.dimensions
+        return kwargs
+
+    def _embed(self, inputs: list[str]) -> OpenAIEmbeddingResponse:
+        """Call the embedder with a single input"""
+        client = self._get_client()
+        kwargs = self._kwargs()
         start_time = datetime.datetime.now().timestamp() * 1000
         embeddings = client.embeddings.create(input=inputs, **kwargs)
         return OpenAIEmbeddingResponse(
@@ -98,10 +115,8 @@ class OpenAIEmbedder(BaseEmbedder[OpenAIEmbeddingResponse]):
 
     async def _embed_async(self, inputs: list[str]) -> OpenAIEmbeddingResponse:
         """Asynchronously call the embedder with a single input"""
-        client = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
-        kwargs = self.embedding_params.kwargs()
-        if self.embedding_params.model != "text-embedding-ada-002":
-            kwargs["dimensions"] = self.dimensions
+        client = self._get_async_client()
+        kwargs = self._kwargs()
         start_time = datetime.datetime.now().timestamp() * 1000
         embeddings = await client.embeddings.create(input=inputs, **kwargs)
         return OpenAIEmbeddingResponse(
@@ -137,8 +152,13 @@ class OpenAIEmbedder(BaseEmbedder[OpenAIEmbeddingResponse]):
             object=openai_embeddings[0].response.object,
             usage=usage,
         )
-        return OpenAIEmbeddingResponse(
+        embedding_response = OpenAIEmbeddingResponse(
             response=create_embedding_response,
             start_time=start_time,
             end_time=end_time,
         )
+        if has_numpy_module and embeddings and isinstance(embeddings[0].embedding, str):
+            embedding_response._embeddings_array = np.concatenate(
+                [response.embeddings_array for response in openai_embeddings]
+            )
+        return embedding_response
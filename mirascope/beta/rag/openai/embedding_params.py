@@ -8,6 +8,7 @@ from ..base.embedding_params import BaseEmbeddingParams
 
 class OpenAIEmbeddingParams(BaseEmbeddingParams):
     model: str = "text-embedding-3-small"
+    # "base64" transfers float32 bytes instead of JSON floats, see `embeddings_array`
     encoding_format: Literal["float", "base64"] | None = None
     user: str | None = None
     # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
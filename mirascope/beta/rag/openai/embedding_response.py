@@ -1,14 +1,52 @@
+import base64
+from array import array
+from typing import Any
+
 from openai.types import Embedding
 from openai.types.create_embedding_response import CreateEmbeddingResponse
+from pydantic import PrivateAttr
 
-from ..base.embedding_response import BaseEmbeddingResponse
+from ..base.embedding_response import BaseEmbeddingResponse, has_numpy_module, np
 
 
 class OpenAIEmbeddingResponse(BaseEmbeddingResponse[CreateEmbeddingResponse]):
-    """A convenience wrapper around the OpenAI `CreateEmbeddingResponse` response."""
+    """A convenience wrapper around the OpenAI `CreateEmbeddingResponse` response.
+
+    With `encoding_format="base64"` in the embedding params, the raw `response.data`
+    embeddings are base64 encoded float32 bytes instead of lists of floats, which
+    `embeddings_array` decodes without parsing floats (and `embeddings` decodes into
+    lists). By default, the embeddings are requested as floats.
+    """
+
+    _embeddings_array: Any = PrivateAttr(None)
 
     @property
     def embeddings(self) -> list[list[float]]:
         """Returns the raw embeddings."""
         embeddings_model: list[Embedding] = list(self.response.data)
+        if embeddings_model and isinstance(embeddings_model[0].embedding, str):
+            if has_numpy_module:
+                return self.embeddings_array.tolist()
+            return [
+                array("f", base64.b64decode(embedding.embedding)).tolist()
+                for embedding in embeddings_model
+            ]
         return [embedding.embedding for embedding in embeddings_model]
+
+    @property
+    def embeddings_array(self) -> "np.ndarray":
+        """Returns the embeddings as a contiguous `(num_inputs, dimensions)` float32 array."""
+        if self._embeddings_array is None:
+            data = self.response.data
+            if (
+                not has_numpy_module
+                or not data
+                or not isinstance(data[0].embedding, str)
+            ):
+                return super().embeddings_array
+            buffer = bytearray().join(
+                base64.b64decode(embedding.embedding) for embedding in data
+            )
+            embeddings = np.frombuffer(buffer, dtype=np.float32)
+            self._embeddings_array = embeddings.reshape(len(data), -1)
+        return self._embeddings_array
@@ -1,6 +1,8 @@
 """A module for calling Chroma's Client and Collection."""
 
+import asyncio
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property
 from typing import Any, ClassVar
 
@@ -8,7 +10,7 @@ from pinecone import Index, Pinecone, QueryResponse
 
 from ..base.document import Document
 from ..base.embedding_response import BaseEmbeddingResponse
-from ..base.vectorstores import BaseVectorStore
+from ..base.vectorstores import MAX_QUERY_WORKERS, BaseVectorStore
 from .types import (
     PineconePodParams,
     PineconeQueryResult,
@@ -60,17 +62,102 @@ class PineconeVectorStore(BaseVectorStore):
     )
     client_settings: ClassVar[PineconeSettings] = PineconeSettings()
     _provider: ClassVar[str] = "pinecone"
+    _embeds_before_upsert: ClassVar[bool] = True
 
     def retrieve(self, text: str, **kwargs: Any) -> PineconeQueryResult:  # noqa: ANN401
         """Queries the vectorstore for closest match"""
         embed = self.embedder.embed
         text_embedding: BaseEmbeddingResponse = embed([text])
-        if "top_k" not in kwargs:
-            kwargs["top_k"] = 8
         if text_embedding.embeddings is None:
             raise ValueError("Embedding is None")
+        return self._query(text_embedding.embeddings[0], **kwargs)
+
+    def retrieve_many(
+        self,
+        texts: list[str],
+        top_k: int | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> list[PineconeQueryResult]:
+        """Queries the vectorstore for the closest matches of each text
+
+        The texts are embedded in a single call, and the queries run concurrently.
+        """
+        if not texts:
+            return []
+        if top_k is not None:
+            kwargs["top_k"] = top_k
+        embed = self.embedder.embed
+        text_embeddings: BaseEmbeddingResponse = embed(texts)
+        if text_embeddings.embeddings is None:
+            raise ValueError("Embedding is None")
+        if len(texts) == 1:
+            return [self._query(text_embeddings.embeddings[0], **kwargs)]
+        with ThreadPoolExecutor(min(len(texts), MAX_QUERY_WORKERS)) as executor:
+            return list(
+                executor.map(
+                    lambda vector: self._query(vector, **kwargs),
+                    text_embeddings.embeddings,
+                )
+            )
+
+    async def retrieve_async(self, text: str, **kwargs: Any) -> PineconeQueryResult:  # noqa: ANN401
+        """Asynchronously queries the vectorstore for closest match
+
+        The text is embedded with `embed_async`, and the query runs in a worker thread.
+        """
+        text_embedding = await self.embedder.embed_async([text])
+        if text_embedding.embeddings is None:
+            raise ValueError("Embedding is None")
+        return await asyncio.to_thread(
+            self._query, text_embedding.embeddings[0], **kwargs
+        )
+
+    def add(
+        self,
+        text: str | list[Document],
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Takes unstructured data and upserts into vectorstore"""
+        documents: list[Document]
+        if isinstance(text, str):
+            chunk = self.chunker.chunk
+            documents = chunk(text)
+        else:
+            documents = text
+        inputs = [document.text for document in documents]
+        embed = self.embedder.embed
+        embedding_repsonse: BaseEmbeddingResponse = embed(inputs)
+        return self._upsert(documents, embedding_repsonse, **kwargs)
+
+    async def add_async(
+        self,
+        text: str | list[Document],
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Asynchronously takes unstructured data and upserts into vectorstore
+
+        The documents are embedded with `embed_async`, and upserted in a worker thread.
+        """
+        documents: list[Document]
+        if isinstance(text, str):
+            chunk = self.chunker.chunk
+            documents = chunk(text)
+        else:
+            documents = text
+        inputs = [document.text for document in documents]
+        embedding_response = await self.embedder.embed_async(inputs)
+        return await asyncio.to_thread(
+            self._upsert, documents, embedding_response, **kwargs
+        )
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _query(self, vector: list[float], **kwargs: Any) -> PineconeQueryResult:  # noqa: ANN401
+        """Queries the index for the closest matches of the vector"""
+        if "top_k" not in kwargs:
+            kwargs["top_k"] = 8
         query_result: QueryResponse = self._index.query(
-            vector=text_embedding.embeddings[0],
+            vector=vector,
             **{"include_metadata": True, "include_values": True, **kwargs},
         )
         ids: list[str] = []
@@ -94,27 +181,19 @@ class PineconeVectorStore(BaseVectorStore):
             embeddings=embeddings,
         )
 
-    def add(
+    def _upsert(
         self,
-        text: str | list[Document],
+        documents: list[Document],
+        embedding_response: BaseEmbeddingResponse | None,
         **kwargs: Any,  # noqa: ANN401
     ) -> None:
-        """Takes unstructured data and upserts into vectorstore"""
-        documents: list[Document]
-        if isinstance(text, str):
-            chunk = self.chunker.chunk
-            documents = chunk(text)
-        else:
-            documents = text
-        inputs = [document.text for document in documents]
-        embed = self.embedder.embed
-        embedding_repsonse: BaseEmbeddingResponse = embed(inputs)
+        """Upserts the documents with their embeddings into the index"""
         if self.handle_add_text:
             self.handle_add_text(documents)
-        if embedding_repsonse.embeddings is None:
+        if embedding_response is None or embedding_response.embeddings is None:
             raise ValueError("Embedding is None")
         vectors = []
-        for i, embedding in enumerate(embedding_repsonse.embeddings):
+        for i, embedding in enumerate(embedding_response.embeddings):
             if documents[i] is not None:
                 metadata = documents[i].metadata or {}
                 metadata_text = (
@@ -72,7 +72,7 @@ class WeaviateParams(BaseVectorStoreParams):
 
 
 class WeaviateQueryResult(BaseModel):
-    id: wt.UUID
+    id: wt.UUID | None
     documents: list[Document] | None
     metadata: dict[str, Any]
     collection: str | None = None
@@ -90,3 +90,22 @@ class WeaviateQueryResult(BaseModel):
         model_dict["collection"] = response_object.collection
 
         return WeaviateQueryResult.model_validate(model_dict)
+
+    def from_objects(response_objects: list) -> WeaviateQueryResult:
+        """Builds a result holding every matched object, closest first.
+
+        `id`, `metadata`, and `collection` are those of the closest match, and each
+        document carries the metadata of its own object.
+        """
+        if not response_objects:
+            return WeaviateQueryResult(id=None, documents=[], metadata={})
+        result = WeaviateQueryResult.from_response(response_objects[0])
+        result.documents = [
+            Document(
+                id=str(response_object.uuid),
+                text=response_object.properties["text"],
+                metadata=response_object.metadata.__dict__,
+            )
+            for response_object in response_objects
+        ]
+        return result
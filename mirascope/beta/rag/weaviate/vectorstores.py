@@ -1,13 +1,18 @@
+import asyncio
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property
 from typing import Any, ClassVar
 
 import weaviate
 import weaviate.classes as wvc
-from weaviate import WeaviateClient
-from weaviate.collections.collection import Collection
+from pydantic import PrivateAttr
+from weaviate import WeaviateAsyncClient, WeaviateClient
+from weaviate.collections.collection import Collection, CollectionAsync
 
 from ..base.document import Document
-from ..base.vectorstores import BaseVectorStore
+from ..base.vectorstores import MAX_QUERY_WORKERS, BaseVectorStore
 from .types import (
     WeaviateParams,
     WeaviateQueryResult,
@@ -43,6 +48,17 @@ class WeaviateVectorStore(BaseVectorStore):
     vectorstore_params = WeaviateParams()
     client_settings: ClassVar[WeaviateSettings] = WeaviateSettings()
 
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _async_locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = (
+        PrivateAttr(default_factory=weakref.WeakKeyDictionary)
+    )
+    _async_clients: weakref.WeakKeyDictionary[
+        asyncio.AbstractEventLoop, WeaviateAsyncClient
+    ] = PrivateAttr(default_factory=weakref.WeakKeyDictionary)
+    _async_indexes: weakref.WeakKeyDictionary[
+        asyncio.AbstractEventLoop, CollectionAsync
+    ] = PrivateAttr(default_factory=weakref.WeakKeyDictionary)
+
     def add(self, text: str | list[Document], **kwargs: Any) -> None:  # noqa: ANN401
         """Takes unstructured data and inserts into vectorstore"""
         documents: list[Document]
@@ -67,15 +83,119 @@ class WeaviateVectorStore(BaseVectorStore):
         return self._index.data.insert_many(data_objects)
 
     def retrieve(self, text: str, **kwargs: Any) -> WeaviateQueryResult:  # noqa: ANN401
-        """Queries the vectorstore for closest match"""
+        """Queries the vectorstore for the closest matches
+
+        The documents hold every matched object, closest first.
+        """
         query_result = self._index.query.near_text(query=text, **kwargs)
-        result = query_result.objects[0]
+        return WeaviateQueryResult.from_objects(query_result.objects)
+
+    def retrieve_many(
+        self,
+        texts: list[str],
+        top_k: int | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> list[WeaviateQueryResult]:
+        """Queries the vectorstore for the closest matches of each text concurrently"""
+        if top_k is not None:
+            kwargs["limit"] = top_k
+        index = self._index
+
+        def near_text(text: str) -> WeaviateQueryResult:
+            query_result = index.query.near_text(query=text, **kwargs)
+            return WeaviateQueryResult.from_objects(query_result.objects)
+
+        if len(texts) < 2:
+            return [near_text(text) for text in texts]
+        with ThreadPoolExecutor(min(len(texts), MAX_QUERY_WORKERS)) as executor:
+            return list(executor.map(near_text, texts))
+
+    async def add_async(self, text: str | list[Document], **kwargs: Any) -> None:  # noqa: ANN401
+        """Asynchronously takes unstructured data and inserts into vectorstore"""
+        documents: list[Document]
+        if isinstance(text, str):
+            chunk = self.chunker.chunk
+            documents = chunk(text)
+        else:
+            documents = text
+
+        index = await self._get_async_index()
+        if len(documents) < 2:
+            return await index.data.insert(
+                properties={"text": documents[0].text}, uuid=documents[0].id, **kwargs
+            )
+
+        data_objects = []
+        for document in documents:
+            data_object = wvc.data.DataObject(
+                properties={"text": document.text}, uuid=document.id
+            )
+            data_objects.append(data_object)
+
+        return await index.data.insert_many(data_objects)
 
-        return WeaviateQueryResult.from_response(result)
+    async def retrieve_async(self, text: str, **kwargs: Any) -> WeaviateQueryResult:  # noqa: ANN401
+        """Asynchronously queries the vectorstore for the closest matches"""
+        index = await self._get_async_index()
+        query_result = await index.query.near_text(query=text, **kwargs)
+        return WeaviateQueryResult.from_objects(query_result.objects)
 
     def close_connection(self) -> None:
         self._client.close()
 
+    async def close_connection_async(self) -> None:
+        """Closes the asynchronous client of the running event loop.
+
+        Each event loop gets its own client, and those of other loops are dropped with
+        their loop.
+        """
+        loop = asyncio.get_running_loop()
+        async with self._get_async_lock(loop):
+            self._async_indexes.pop(loop, None)
+            if (client := self._async_clients.pop(loop, None)) is not None:
+                await client.close()
+
+    ############################## PRIVATE METHODS ###################################
+
+    def _get_async_lock(self, loop: asyncio.AbstractEventLoop) -> asyncio.Lock:
+        with self._lock:
+            return self._async_locks.setdefault(loop, asyncio.Lock())
+
+    async def _get_async_index(self) -> CollectionAsync:
+        # Async clients hold connections bound to the loop they were created in, and
+        # concurrent first calls would otherwise each connect (and leak) a client
+        loop = asyncio.get_running_loop()
+        async with self._get_async_lock(loop):
+            if (index := self._async_indexes.get(loop)) is None:
+                if (client := self._async_clients.get(loop)) is None:
+                    client = await self._connect_async_client()
+                    self._async_clients[loop] = client
+                collections = client.collections
+                if not await collections.exists(self.index_name):
+                    vectorstore_params = self.vectorstore_params
+                    if self.index_name:
+                        vectorstore_params = self.vectorstore_params.model_copy(
+                            update={"name": self.index_name}
+                        )
+                    await collections.create(**vectorstore_params.kwargs())
+                index = self._async_indexes[loop] = collections.get(self.index_name)
+            return index
+
+    async def _connect_async_client(self) -> WeaviateAsyncClient:
+        kwargs = self.client_settings.kwargs()
+        if self.client_settings.mode == "local":
+            client = weaviate.use_async_with_local(**kwargs)
+        elif self.client_settings.mode == "embedded":
+            client = weaviate.use_async_with_embedded(**kwargs)
+        elif self.client_settings.mode == "cloud":
+            client = weaviate.use_async_with_weaviate_cloud(**kwargs)
+        elif self.client_settings.mode == "custom":
+            client = weaviate.use_async_with_custom(**kwargs)
+        else:
+            raise ValueError(f"Unknown Weaviate mode '{self.client_settings.mode}'.")
+        await client.connect()
+        return client
+
     ############################# PRIVATE PROPERTIES #################################
 
     @cached_property
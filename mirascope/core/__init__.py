@@ -22,6 +22,7 @@ from .base import (
     ResponseModelConfigDict,
     TextPart,
     ToolCallPart,
+    ToolExecutor,
     ToolResultPart,
     merge_decorators,
     metadata,
@@ -79,6 +80,7 @@ __all__ = [
     "ResponseModelConfigDict",
     "TextPart",
     "ToolCallPart",
+    "ToolExecutor",
     "ToolResultPart",
     "anthropic",
     "azure",
@@ -11,6 +11,7 @@ from .call_params import AnthropicCallParams
 from .call_response import AnthropicCallResponse
 from .call_response_chunk import AnthropicCallResponseChunk
 from .dynamic_config import AnthropicDynamicConfig, AsyncAnthropicDynamicConfig
+from .prompt_cache import AnthropicPromptCache, PromptCacheStats, prompt_cache
 from .stream import AnthropicStream
 from .tool import AnthropicTool, AnthropicToolConfig
 
@@ -22,10 +23,13 @@ __all__ = [
     "AnthropicCallResponseChunk",
     "AnthropicDynamicConfig",
     "AnthropicMessageParam",
+    "AnthropicPromptCache",
     "AnthropicStream",
     "AnthropicTool",
     "AnthropicToolConfig",
     "AsyncAnthropicDynamicConfig",
+    "PromptCacheStats",
     "anthropic_call",
     "call",
+    "prompt_cache",
 ]
@@ -1,5 +1,142 @@
 """Calculate the cost of a completion using the Anthropic API."""
 
+from ...base.pricing import pricing_registry
+
+_PRICING = {
+    # Anthropic models
+    "claude-3-5-haiku": {
+        "prompt": 0.000_000_8,
+        "completion": 0.000_004,
+        "cached": 0.000_000_08,
+    },
+    "claude-3-5-haiku-20241022": {
+        "prompt": 0.000_000_8,
+        "completion": 0.000_004,
+        "cached": 0.000_000_08,
+    },
+    "claude-3-5-sonnet": {
+        "prompt": 0.000_003,
+        "completion": 0.000_015,
+        "cached": 0.000_000_3,
+    },
+    "claude-3-5-sonnet-20241022": {
+        "prompt": 0.000_003,
+        "completion": 0.000_015,
+        "cached": 0.000_000_3,
+    },
+    "claude-3-5-sonnet-20240620": {
+        "prompt": 0.000_003,
+        "completion": 0.000_015,
+        "cached": 0.000_000_3,
+    },
+    "claude-3-haiku": {
+        "prompt": 0.000_000_8,
+        "completion": 0.000_004,
+        "cached": 0.000_000_08,
+    },
+    "claude-3-haiku-20240307": {
+        "prompt": 0.000_000_8,
+        "completion": 0.000_004,
+        "cached": 0.000_000_08,
+    },
+    "claude-3-sonnet": {
+        "prompt": 0.000_003,
+        "completion": 0.000_015,
+        "cached": 0.000_000_3,
+    },
+    "claude-3-sonnet-20240620": {
+        "prompt": 0.000_003,
+        "completion": 0.000_015,
+        "cached": 0.000_000_3,
+    },
+    "claude-3-opus": {
+        "prompt": 0.000_015,
+        "completion": 0.000_075,
+        "cached": 0.000_001_5,
+    },
+    "claude-3-opus-20240229": {
+        "prompt": 0.000_015,
+        "completion": 0.000_075,
+        "cached": 0.000_001_5,
+    },
+    "claude-2.1": {
+        "prompt": 0.000_008,
+        "completion": 0.000_024,
+        "cached": 0,
+    },
+    "claude-2.0": {
+        "prompt": 0.000_008,
+        "completion": 0.000_024,
+        "cached": 0,
+    },
+    "claude-instant-1.2": {
+        "prompt": 0.000_000_8,
+        "completion": 0.000_002_4,
+        "cached": 0,
+    },
+    # Bedrock models
+    "anthropic.claude-3-5-sonnet-20241022-v2:0": {
+        "prompt": 0.000_003,
+        "completion": 0.000_015,
+        "cached": 0.000_000_3,
+    },
+    "anthropic.claude-3-5-sonnet-20241022-v1:0": {
+        "prompt": 0.000_003,
+        "completion": 0.000_015,
+        "cached": 0.000_000_3,
+    },
+    "anthropic.claude-3-5-haiku-20241022-v1:0": {
+        "prompt": 0.000_000_8,
+        "completion": 0.000_004,
+        "cached": 0.000_000_08,
+    },
+    "anthropic.claude-3-sonnet-20240620-v1:0": {
+        "prompt": 0.000_003,
+        "completion": 0.000_015,
+        "cached": 0.000_000_3,
+    },
+    "anthropic.claude-3-haiku-20240307-v1:0": {
+        "prompt": 0.000_000_8,
+        "completion": 0.000_004,
+        "cached": 0.000_000_08,
+    },
+    "anthropic.claude-3-opus-20240229-v1:0": {
+        "prompt": 0.000_015,
+        "completion": 0.000_075,
+        "cached": 0.000_001_5,
+    },
+    # Vertex AI models
+    "claude-3-5-sonnet@20241022": {
+        "prompt": 0.000_003,
+        "completion": 0.000_015,
+        "cached": 0.000_000_3,
+    },
+    "claude-3-5-haiku@20241022": {
+        "prompt": 0.000_000_8,
+        "completion": 0.000_004,
+        "cached": 0.000_000_08,
+    },
+    "claude-3-sonnet@20240620": {
+        "prompt": 0.000_003,
+        "completion": 0.000_015,
+        "cached": 0.000_000_3,
+    },
+    "claude-3-haiku@20240307": {
+        "prompt": 0.000_000_8,
+        "completion": 0.000_004,
+        "cached": 0.000_000_08,
+    },
+    "claude-3-opus@20240229": {
+        "prompt": 0.000_015,
+        "completion": 0.000_075,
+        "cached": 0.000_001_5,
+    },
+}
+
+pricing_registry.register(
+    "anthropic", _PRICING, required_keys=("prompt", "cached", "completion")
+)
+
 
 def calculate_cost(
     input_tokens: int | float | None,
@@ -38,146 +175,14 @@ def calculate_cost(
     claude-3-haiku@20240307                    $0.80  / 1M tokens    $0.08  / 1M tokens    $4.00  / 1M tokens
     claude-3-opus@20240229                     $15.00 / 1M tokens    $1.50  / 1M tokens    $75.00 / 1M tokens
     """
-    pricing = {
-        # Anthropic models
-        "claude-3-5-haiku": {
-            "prompt": 0.000_000_8,
-            "completion": 0.000_004,
-            "cached": 0.000_000_08,
-        },
-        "claude-3-5-haiku-20241022": {
-            "prompt": 0.000_000_8,
-            "completion": 0.000_004,
-            "cached": 0.000_000_08,
-        },
-        "claude-3-5-sonnet": {
-            "prompt": 0.000_003,
-            "completion": 0.000_015,
-            "cached": 0.000_000_3,
-        },
-        "claude-3-5-sonnet-20241022": {
-            "prompt": 0.000_003,
-            "completion": 0.000_015,
-            "cached": 0.000_000_3,
-        },
-        "claude-3-5-sonnet-20240620": {
-            "prompt": 0.000_003,
-            "completion": 0.000_015,
-            "cached": 0.000_000_3,
-        },
-        "claude-3-haiku": {
-            "prompt": 0.000_000_8,
-            "completion": 0.000_004,
-            "cached": 0.000_000_08,
-        },
-        "claude-3-haiku-20240307": {
-            "prompt": 0.000_000_8,
-            "completion": 0.000_004,
-            "cached": 0.000_000_08,
-        },
-        "claude-3-sonnet": {
-            "prompt": 0.000_003,
-            "completion": 0.000_015,
-            "cached": 0.000_000_3,
-        },
-        "claude-3-sonnet-20240620": {
-            "prompt": 0.000_003,
-            "completion": 0.000_015,
-            "cached": 0.000_000_3,
-        },
-        "claude-3-opus": {
-            "prompt": 0.000_015,
-            "completion": 0.000_075,
-            "cached": 0.000_001_5,
-        },
-        "claude-3-opus-20240229": {
-            "prompt": 0.000_015,
-            "completion": 0.000_075,
-            "cached": 0.000_001_5,
-        },
-        "claude-2.1": {
-            "prompt": 0.000_008,
-            "completion": 0.000_024,
-            "cached": 0,
-        },
-        "claude-2.0": {
-            "prompt": 0.000_008,
-            "completion": 0.000_024,
-            "cached": 0,
-        },
-        "claude-instant-1.2": {
-            "prompt": 0.000_000_8,
-            "completion": 0.000_002_4,
-            "cached": 0,
-        },
-        # Bedrock models
-        "anthropic.claude-3-5-sonnet-20241022-v2:0": {
-            "prompt": 0.000_003,
-            "completion": 0.000_015,
-            "cached": 0.000_000_3,
-        },
-        "anthropic.claude-3-5-sonnet-20241022-v1:0": {
-            "prompt": 0.000_003,
-            "completion": 0.000_015,
-            "cached": 0.000_000_3,
-        },
-        "anthropic.claude-3-5-haiku-20241022-v1:0": {
-            "prompt": 0.000_000_8,
-            "completion": 0.000_004,
-            "cached": 0.000_000_08,
-        },
-        "anthropic.claude-3-sonnet-20240620-v1:0": {
-            "prompt": 0.000_003,
-            "completion": 0.000_015,
-            "cached": 0.000_000_3,
-        },
-        "anthropic.claude-3-haiku-20240307-v1:0": {
-            "prompt": 0.000_000_8,
-            "completion": 0.000_004,
-            "cached": 0.000_000_08,
-        },
-        "anthropic.claude-3-opus-20240229-v1:0": {
-            "prompt": 0.000_015,
-            "completion": 0.000_075,
-            "cached": 0.000_001_5,
-        },
-        # Vertex AI models
-        "claude-3-5-sonnet@20241022": {
-            "prompt": 0.000_003,
-            "completion": 0.000_015,
-            "cached": 0.000_000_3,
-        },
-        "claude-3-5-haiku@20241022": {
-            "prompt": 0.000_000_8,
-            "completion": 0.000_004,
-            "cached": 0.000_000_08,
-        },
-        "claude-3-sonnet@20240620": {
-            "prompt": 0.000_003,
-            "completion": 0.000_015,
-            "cached": 0.000_000_3,
-        },
-        "claude-3-haiku@20240307": {
-            "prompt": 0.000_000_8,
-            "completion": 0.000_004,
-            "cached": 0.000_000_08,
-        },
-        "claude-3-opus@20240229": {
-            "prompt": 0.000_015,
-            "completion": 0.000_075,
-            "cached": 0.000_001_5,
-        },
-    }
-
     if input_tokens is None or output_tokens is None:
         return None
 
     if cached_tokens is None:
         cached_tokens = 0
 
-    try:
-        model_pricing = pricing[model]
-    except KeyError:
+    model_pricing = pricing_registry.lookup("anthropic", model)
+    if model_pricing is None:
         return None
 
     prompt_cost = input_tokens * model_pricing["prompt"]
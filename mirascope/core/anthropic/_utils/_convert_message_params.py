@@ -1,16 +1,20 @@
 """Utility for converting `BaseMessageParam` to `MessageParam`"""
 
-import base64
-
 from anthropic.types import MessageParam
 
 from ...base import BaseMessageParam
-from ...base._utils._parse_content_template import _load_media, get_image_type
+from ...base._utils import encode_base64
+from ...base._utils._parse_content_template import (
+    _load_media,
+    get_image_type,
+    prefetch_media_urls,
+)
 
 
 def convert_message_params(
     message_params: list[BaseMessageParam | MessageParam],
 ) -> list[MessageParam]:
+    prefetch_media_urls(message_params, ("image_url",))
     converted_message_params = []
     for message_param in message_params:
         if not isinstance(message_param, BaseMessageParam):
@@ -40,7 +44,7 @@ def convert_message_params(
                         {
                             "type": "image",
                             "source": {
-                                "data": base64.b64encode(part.image).decode("utf-8"),
+                                "data": encode_base64(part.image),
                                 "media_type": part.media_type,
                                 "type": "base64",
                             },
@@ -52,7 +56,7 @@ def convert_message_params(
                         {
                             "type": "image",
                             "source": {
-                                "data": base64.b64encode(image).decode("utf-8"),
+                                "data": encode_base64(image),
                                 "media_type": f"image/{get_image_type(image)}",
                                 "type": "base64",
                             },
@@ -68,7 +72,7 @@ def convert_message_params(
                         {
                             "type": "document",
                             "source": {
-                                "data": base64.b64encode(part.document).decode("utf-8"),
+                                "data": encode_base64(part.document),
                                 "media_type": part.media_type,
                                 "type": "base64",
                             },
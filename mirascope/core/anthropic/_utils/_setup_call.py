@@ -21,6 +21,7 @@ from ...base.stream_config import StreamConfig
 from .._call_kwargs import AnthropicCallKwargs
 from ..call_params import AnthropicCallParams
 from ..dynamic_config import AnthropicDynamicConfig, AsyncAnthropicDynamicConfig
+from ..prompt_cache import prompt_cache
 from ..tool import AnthropicTool
 from ._convert_common_call_params import convert_common_call_params
 from ._convert_message_params import convert_message_params
@@ -131,4 +132,9 @@ def setup_call(
     if client is None:
         client = AsyncAnthropic() if inspect.iscoroutinefunction(fn) else Anthropic()
     create = client.messages.create
+    if prompt_cache.enabled:
+        prompt_cache.place_breakpoints(fn.__name__, model, cast(dict, call_kwargs))
+        create = prompt_cache.wrap_create(
+            fn.__name__, create, inspect.iscoroutinefunction(fn)
+        )
     return create, prompt_template, messages, tool_types, call_kwargs
@@ -113,7 +113,7 @@ class AnthropicCallResponse(
         return self.usage.output_tokens
 
     @computed_field
-    @property
+    @cached_property
     def cost(self) -> float | None:
         """Returns the cost of the call."""
         return calculate_cost(
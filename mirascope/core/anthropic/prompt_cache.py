@@ -0,0 +1,319 @@
+"""This module defines the automatic placement of Anthropic prompt cache breakpoints.
+
+usage docs: learn/provider_specific_features/anthropic.md#prompt-caching
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import AsyncGenerator, Awaitable, Callable, Generator
+from typing import Any, cast
+
+from anthropic.types import Message, MessageParam, MessageStreamEvent, Usage
+from pydantic import BaseModel, computed_field
+
+_MAX_BREAKPOINTS = 4
+_EPHEMERAL = {"type": "ephemeral"}
+_CHARS_PER_TOKEN = 4
+
+
+class PromptCacheStats(BaseModel):
+    """The prompt cache usage of a single function."""
+
+    calls: int = 0
+    """Number of calls with recorded usage."""
+
+    input_tokens: int = 0
+    """Total number of input tokens that were neither read from nor written to cache."""
+
+    cache_read_tokens: int = 0
+    """Total number of input tokens read from the cache."""
+
+    cache_creation_tokens: int = 0
+    """Total number of input tokens written to the cache."""
+
+    @computed_field
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of all input tokens that were read from the cache."""
+        total = self.input_tokens + self.cache_read_tokens + self.cache_creation_tokens
+        return self.cache_read_tokens / total if total else 0.0
+
+
+def _has_cache_control(value: object) -> bool:
+    return isinstance(value, dict) and "cache_control" in value
+
+
+class _Block:
+    """A cacheable block of the request: a tool, a system block or a content block."""
+
+    __slots__ = ("fingerprint", "has_breakpoint", "location", "tokens")
+
+    def __init__(self, location: tuple, value: Any, role: str = "") -> None:  # noqa: ANN401
+        if isinstance(value, str):
+            # A string is sent (and cached) the same as a single text block.
+            value = {"type": "text", "text": value}
+        self.has_breakpoint = _has_cache_control(value)
+        if self.has_breakpoint:
+            value = {k: v for k, v in value.items() if k != "cache_control"}
+        serialized = json.dumps(value, sort_keys=True, default=str)
+        self.location = location
+        self.fingerprint = hash((role, serialized))
+        self.tokens = len(serialized) // _CHARS_PER_TOKEN
+
+
+class AnthropicPromptCache:
+    """Places Anthropic `cache_control` breakpoints automatically.
+
+    Anthropic caches the prefix of a request (tools, then the system prompt, then the
+    messages) up to each `cache_control` breakpoint. When enabled, every call remembers
+    the blocks it sent for its function. The next call of the same function finds the
+    longest prefix it shares with the previous one and places breakpoints at:
+
+    - the end of the tools, if the tools are unchanged,
+    - the end of the system prompt, if it is unchanged,
+    - the end of the shared message history, and
+    - the end of the request, if the history is growing (i.e. a conversation), so the
+      next turn can read it back.
+
+    Breakpoints are only placed once the cached prefix is long enough to be cacheable
+    (1024 tokens, or 2048 for Haiku models, estimated from the request size), and never
+    beyond Anthropic's limit of 4 breakpoints including any `{:cache_control}` parts or
+    tool configs you placed yourself.
+
+    The cache read and write tokens reported in each response are recorded per function
+    so you can check the resulting hit rates with `stats()`.
+
+    Example:
+
+    ```python
+    from mirascope.core import anthropic
+    from mirascope.core.anthropic import prompt_cache
+
+    prompt_cache.enable()
+
+
+    @anthropic.call("claude-3-5-sonnet-latest")
+    def answer(question: str) -> str:
+        return f"SYSTEM: {LONG_INSTRUCTIONS} USER: {question}"
+
+
+    answer("What is the refund policy?")
+    answer("How long does shipping take?")
+    print(prompt_cache.stats()["answer"].hit_rate)
+    ```
+    """
+
+    def __init__(self) -> None:
+        """Initializes a disabled instance of `AnthropicPromptCache`."""
+        self.enabled = False
+        self._fingerprints: dict[str, list[int]] = {}
+        self._stats: dict[str, PromptCacheStats] = {}
+        self._lock = threading.Lock()
+
+    def enable(self) -> None:
+        """Starts placing breakpoints automatically."""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stops placing breakpoints. Recorded statistics are kept."""
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Forgets all previous calls and recorded statistics."""
+        with self._lock:
+            self._fingerprints.clear()
+            self._stats.clear()
+
+    def stats(self) -> dict[str, PromptCacheStats]:
+        """Returns a copy of the prompt cache usage recorded for each function."""
+        with self._lock:
+            return {
+                fn_name: stats.model_copy() for fn_name, stats in self._stats.items()
+            }
+
+    def record(self, fn_name: str, usage: Usage) -> None:
+        """Records the prompt cache usage of a single response.
+
+        Args:
+            fn_name: The name of the function that made the call.
+            usage: The usage reported in the response.
+        """
+        with self._lock:
+            stats = self._stats.setdefault(fn_name, PromptCacheStats())
+            stats.calls += 1
+            stats.input_tokens += usage.input_tokens or 0
+            stats.cache_read_tokens += getattr(usage, "cache_read_input_tokens", 0) or 0
+            stats.cache_creation_tokens += (
+                getattr(usage, "cache_creation_input_tokens", 0) or 0
+            )
+
+    @staticmethod
+    def _blocks(call_kwargs: dict[str, Any]) -> list[_Block]:
+        blocks = [
+            _Block(("tools", i), tool)
+            for i, tool in enumerate(call_kwargs.get("tools") or [])
+        ]
+        system = call_kwargs.get("system")
+        if isinstance(system, str):
+            blocks.append(_Block(("system", None), system))
+        elif system:
+            blocks += [_Block(("system", i), block) for i, block in enumerate(system)]
+        for i, message in enumerate(call_kwargs.get("messages") or []):
+            content = message["content"]
+            if isinstance(content, str):
+                blocks.append(_Block(("messages", i, None), content, message["role"]))
+            else:
+                blocks += [
+                    _Block(("messages", i, j), block, message["role"])
+                    for j, block in enumerate(content)
+                ]
+        return blocks
+
+    @staticmethod
+    def _count_breakpoints(call_kwargs: dict[str, Any]) -> int:
+        count = sum(map(_has_cache_control, call_kwargs.get("tools") or []))
+        if isinstance(system := call_kwargs.get("system"), list):
+            count += sum(map(_has_cache_control, system))
+        for message in call_kwargs.get("messages") or []:
+            if isinstance(message["content"], list):
+                count += sum(map(_has_cache_control, message["content"]))
+        return count
+
+    @staticmethod
+    def _set_breakpoint(call_kwargs: dict[str, Any], location: tuple) -> None:
+        """Adds `cache_control` to the block at `location` without mutating inputs."""
+        if location[0] == "tools":
+            tools = call_kwargs["tools"] = list(call_kwargs["tools"])
+            tools[location[1]] = {**tools[location[1]], "cache_control": _EPHEMERAL}
+        elif location[0] == "system":
+            system = call_kwargs["system"]
+            if isinstance(system, str):
+                system = [{"type": "text", "text": system}]
+            system: list[Any] = list(system)
+            call_kwargs["system"] = system
+            index = location[1] or 0
+            system[index] = {**system[index], "cache_control": _EPHEMERAL}
+        else:
+            _, i, j = location
+            # `messages` is also the list returned to the user as `response.messages`
+            messages = call_kwargs["messages"] = list(call_kwargs["messages"])
+            message = dict(messages[i])
+            content = message["content"]
+            if isinstance(content, str):
+                content, j = [{"type": "text", "text": content}], 0
+            content: list[Any] = list(content)
+            message["content"] = content
+            content[j] = {**content[j], "cache_control": _EPHEMERAL}
+            messages[i] = cast(MessageParam, message)
+
+    def place_breakpoints(
+        self, fn_name: str, model: str, call_kwargs: dict[str, Any]
+    ) -> int:
+        """Places breakpoints on the stable prefix of the call and returns its length.
+
+        Args:
+            fn_name: The name of the function that made the call.
+            model: The model of the call, which sets the minimum cacheable length.
+            call_kwargs: The Anthropic call kwargs, updated in place.
+
+        Returns:
+            The number of blocks (tools, system blocks, and content blocks) the call
+            shares with the previous call of the same function.
+        """
+        blocks = self._blocks(call_kwargs)
+        fingerprints = [block.fingerprint for block in blocks]
+        with self._lock:
+            previous = self._fingerprints.get(fn_name, [])
+            self._fingerprints[fn_name] = fingerprints
+        stable = 0
+        for current, last in zip(fingerprints, previous, strict=False):
+            if current != last:
+                break
+            stable += 1
+        if not stable:
+            return 0
+
+        candidates: list[int] = []
+        num_tools = sum(1 for block in blocks if block.location[0] == "tools")
+        num_prefix = num_tools + sum(
+            1 for block in blocks if block.location[0] == "system"
+        )
+        if num_tools and stable >= num_tools:
+            candidates.append(num_tools - 1)
+        if num_prefix > num_tools and stable >= num_prefix:
+            candidates.append(num_prefix - 1)
+        if stable > num_prefix:
+            candidates.append(stable - 1)
+            if len(blocks) > stable:
+                # The shared history is growing, so we also cache the full request for
+                # the next turn of the conversation to read.
+                candidates.append(len(blocks) - 1)
+
+        min_tokens = 2048 if "haiku" in model else 1024
+        prefix_tokens, cumulative = 0, []
+        for block in blocks:
+            prefix_tokens += block.tokens
+            cumulative.append(prefix_tokens)
+        candidates = [
+            index
+            for index in candidates
+            if cumulative[index] >= min_tokens and not blocks[index].has_breakpoint
+        ]
+        available = _MAX_BREAKPOINTS - self._count_breakpoints(call_kwargs)
+        # When we're short on breakpoints, the furthest ones cover the most content.
+        for index in sorted(set(candidates))[::-1][: max(available, 0)]:
+            self._set_breakpoint(call_kwargs, blocks[index].location)
+        return stable
+
+    def wrap_create(
+        self, fn_name: str, create: Callable[..., Any], is_async: bool
+    ) -> Callable[..., Any]:
+        """Returns `create` wrapped to record the prompt cache usage of its responses.
+
+        Args:
+            fn_name: The name of the function that made the call.
+            create: The Anthropic `messages.create` function.
+            is_async: Whether `create` is asynchronous.
+        """
+
+        def record_stream(
+            stream: Any,  # noqa: ANN401
+        ) -> Generator[MessageStreamEvent, None, None]:
+            for event in stream:
+                if event.type == "message_start":
+                    self.record(fn_name, event.message.usage)
+                yield event
+
+        async def record_stream_async(
+            stream: Any,  # noqa: ANN401
+        ) -> AsyncGenerator[MessageStreamEvent, None]:
+            async for event in stream:
+                if event.type == "message_start":
+                    self.record(fn_name, event.message.usage)
+                yield event
+
+        def record(response: Any) -> Any:  # noqa: ANN401
+            if isinstance(response, Message):
+                self.record(fn_name, response.usage)
+                return response
+            if is_async:
+                return record_stream_async(response)
+            return record_stream(response)
+
+        if is_async:
+
+            async def create_async(**kwargs: Any) -> Any:  # noqa: ANN401
+                return record(await cast(Awaitable, create(**kwargs)))
+
+            return create_async
+
+        def create_sync(**kwargs: Any) -> Any:  # noqa: ANN401
+            return record(create(**kwargs))
+
+        return create_sync
+
+
+prompt_cache = AnthropicPromptCache()
+"""The shared prompt cache that places breakpoints for all Anthropic calls."""
@@ -1,6 +1,5 @@
 """Utility for converting `BaseMessageParam` to `ChatRequestMessage`."""
 
-import base64
 import json
 from typing import cast
 
@@ -14,6 +13,7 @@ from azure.ai.inference.models import (
 )
 
 from ...base import BaseMessageParam
+from ...base._utils import encode_base64
 
 
 def convert_message_params(
@@ -41,7 +41,7 @@ def convert_message_params(
                             f"Unsupported image media type: {part.media_type}. Azure"
                             " currently only supports JPEG, PNG, GIF, and WebP images."
                         )
-                    data = base64.b64encode(part.image).decode("utf-8")
+                    data = encode_base64(part.image)
                     converted_content.append(
                         {
                             "type": "image_url",
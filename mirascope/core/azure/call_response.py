@@ -117,7 +117,7 @@ class AzureCallResponse(
         return self.usage.completion_tokens if self.usage else None
 
     @computed_field
-    @property
+    @cached_property
     def cost(self) -> float | None:
         """Returns the cost of the call."""
         return calculate_cost(
@@ -7,8 +7,10 @@ from .call_kwargs import BaseCallKwargs
 from .call_params import BaseCallParams, CommonCallParams
 from .call_response import BaseCallResponse, transform_tool_outputs
 from .call_response_chunk import BaseCallResponseChunk
+from .canonicalization import RequestCanonicalizer, request_canonicalizer
 from .dynamic_config import BaseDynamicConfig
 from .from_call_args import FromCallArgs
+from .media_cache import MediaCache, media_cache
 from .merge_decorators import merge_decorators
 from .message_param import (
     AudioPart,
@@ -24,13 +26,16 @@ from .message_param import (
 )
 from .messages import Messages
 from .metadata import Metadata
+from .pricing import PricingRegistry, pricing_registry
 from .prompt import BasePrompt, metadata, prompt_template
 from .response_model_config_dict import ResponseModelConfigDict
 from .stream import BaseStream
 from .structured_stream import BaseStructuredStream
 from .tool import BaseTool, GenerateJsonSchemaNoTitles, ToolConfig
+from .tool_executor import ToolExecutionConfig, ToolExecutor
 from .toolkit import BaseToolKit, toolkit_tool
 from .types import AudioSegment, JsonableType, Usage
+from .usage_tracker import UsageKey, UsageStats, UsageTracker, usage_tracker
 
 __all__ = [
     "AudioPart",
@@ -56,20 +61,32 @@ __all__ = [
     "ImagePart",
     "ImageURLPart",
     "JsonableType",
+    "MediaCache",
     "Messages",
     "Metadata",
+    "PricingRegistry",
+    "RequestCanonicalizer",
     "ResponseModelConfigDict",
     "TextPart",
     "ToolCallPart",
     "ToolConfig",
+    "ToolExecutionConfig",
+    "ToolExecutor",
     "ToolResultPart",
     "Usage",
+    "UsageKey",
+    "UsageStats",
+    "UsageTracker",
     "_partial",
     "_utils",
     "call_factory",
+    "media_cache",
     "merge_decorators",
     "metadata",
+    "pricing_registry",
     "prompt_template",
+    "request_canonicalizer",
     "toolkit_tool",
     "transform_tool_outputs",
+    "usage_tracker",
 ]
@@ -1,8 +1,9 @@
 """The `create_factory` method for generating provider specific create decorators."""
 
+import asyncio
 import datetime
 from collections.abc import Awaitable, Callable, Coroutine
-from functools import wraps
+from functools import partial, wraps
 from typing import Any, ParamSpec, TypeVar, cast, overload
 
 from pydantic import BaseModel
@@ -16,6 +17,7 @@ from ._utils import (
     get_metadata,
     get_possible_user_message_param,
     is_prompt_template,
+    requires_media_loading,
 )
 from .call_params import BaseCallParams
 from .call_response import BaseCallResponse
@@ -23,6 +25,7 @@ from .dynamic_config import BaseDynamicConfig
 from .messages import Messages
 from .prompt import prompt_template
 from .tool import BaseTool
+from .usage_tracker import usage_tracker
 
 _BaseCallResponseT = TypeVar("_BaseCallResponseT", bound=BaseCallResponse)
 _SameSyncAndAsyncClientT = TypeVar("_SameSyncAndAsyncClientT", contravariant=True)
@@ -172,9 +175,10 @@ def create_factory(  # noqa: ANN202
                 nonlocal client
                 if dynamic_config is not None:
                     client = dynamic_config.get("client", None) or client
-                create, prompt_template, messages, tool_types, call_kwargs = setup_call(  # pyright: ignore [reportCallIssue]
+                setup = partial(
+                    setup_call,
                     model=model,
-                    client=client,  # pyright: ignore [reportArgumentType]
+                    client=client,
                     fn=fn,
                     fn_args=fn_args,
                     dynamic_config=dynamic_config,
@@ -184,8 +188,21 @@ def create_factory(  # noqa: ANN202
                     response_model=response_model,
                     stream=False,
                 )
+                # Loading media can block, so we set up such calls off the event loop
+                create, prompt_template, messages, tool_types, call_kwargs = (
+                    await asyncio.to_thread(setup)
+                    if requires_media_loading(fn, dynamic_config)
+                    else setup()
+                )
                 start_time = datetime.datetime.now().timestamp() * 1000
-                response = await create(stream=False, **call_kwargs)
+                try:
+                    response = await create(stream=False, **call_kwargs)
+                except Exception:
+                    if usage_tracker.enabled:
+                        usage_tracker.record(
+                            fn.__name__, TCallResponse._provider, model, error=True
+                        )
+                    raise
                 end_time = datetime.datetime.now().timestamp() * 1000
                 output = TCallResponse(
                     metadata=get_metadata(fn, dynamic_config),
@@ -202,6 +219,8 @@ def create_factory(  # noqa: ANN202
                     end_time=end_time,
                 )
                 output._model = model
+                if usage_tracker.enabled:
+                    usage_tracker.record_call(fn.__name__, output)
                 return output if not output_parser else output_parser(output)
 
             return inner_async
@@ -229,7 +248,14 @@ def create_factory(  # noqa: ANN202
                     stream=False,
                 )
                 start_time = datetime.datetime.now().timestamp() * 1000
-                response = create(stream=False, **call_kwargs)
+                try:
+                    response = create(stream=False, **call_kwargs)
+                except Exception:
+                    if usage_tracker.enabled:
+                        usage_tracker.record(
+                            fn.__name__, TCallResponse._provider, model, error=True
+                        )
+                    raise
                 end_time = datetime.datetime.now().timestamp() * 1000
                 output = TCallResponse(
                     metadata=get_metadata(fn, dynamic_config),
@@ -246,6 +272,8 @@ def create_factory(  # noqa: ANN202
                     end_time=end_time,
                 )
                 output._model = model
+                if usage_tracker.enabled:
+                    usage_tracker.record_call(fn.__name__, output)
                 return output if not output_parser else output_parser(output)
 
             return inner
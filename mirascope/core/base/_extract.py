@@ -16,7 +16,10 @@ from ._utils import (
     fn_is_async,
     setup_extract_tool,
 )
-from ._utils._get_fields_from_call_args import get_fields_from_call_args
+from ._utils._get_fields_from_call_args import (
+    check_fields_from_call_args,
+    get_fields_from_fn_args,
+)
 from .call_params import BaseCallParams
 from .call_response import BaseCallResponse
 from .dynamic_config import BaseDynamicConfig
@@ -111,6 +114,7 @@ def extract_factory(  # noqa: ANN202
     ]:
         fn._model = model  # pyright: ignore [reportFunctionMemberAccess]
         fn.__mirascope_call__ = True  # pyright: ignore [reportFunctionMemberAccess]
+        check_fields_from_call_args(response_model, fn)
         create_decorator_kwargs = {
             "model": model,
             "tools": [setup_extract_tool(response_model, TToolType)]
@@ -124,18 +128,19 @@ def extract_factory(  # noqa: ANN202
         }
 
         if fn_is_async(fn):
+            create_fn_async = create_decorator(fn=fn, **create_decorator_kwargs)
 
             @wraps(fn)
             async def inner_async(
                 *args: _P.args, **kwargs: _P.kwargs
             ) -> _ResponseModelT:
-                fields_from_call_args = get_fields_from_call_args(
-                    response_model, fn, args, kwargs
-                )
-                call_response = await create_decorator(
-                    fn=fn, **create_decorator_kwargs
-                )(*args, **kwargs)
+                call_response = await create_fn_async(*args, **kwargs)
                 try:
+                    # The fields were checked against the signature when decorated,
+                    # and the call already bound the arguments, so we reuse them
+                    fields_from_call_args = get_fields_from_fn_args(
+                        response_model, call_response.fn_args
+                    )
                     json_output = get_json_output(call_response, json_mode)
                     output = extract_tool_return(
                         response_model, json_output, False, fields_from_call_args
@@ -149,16 +154,17 @@ def extract_factory(  # noqa: ANN202
 
             return inner_async
         else:
+            create_fn = create_decorator(fn=fn, **create_decorator_kwargs)
 
             @wraps(fn)
             def inner(*args: _P.args, **kwargs: _P.kwargs) -> _ResponseModelT:
-                fields_from_call_args = get_fields_from_call_args(
-                    response_model, fn, args, kwargs
-                )
-                call_response = create_decorator(fn=fn, **create_decorator_kwargs)(
-                    *args, **kwargs
-                )
+                call_response = create_fn(*args, **kwargs)
                 try:
+                    # The fields were checked against the signature when decorated,
+                    # and the call already bound the arguments, so we reuse them
+                    fields_from_call_args = get_fields_from_fn_args(
+                        response_model, call_response.fn_args
+                    )
                     json_output = get_json_output(call_response, json_mode)
                     output = extract_tool_return(
                         response_model, json_output, False, fields_from_call_args
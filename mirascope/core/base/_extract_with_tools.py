@@ -15,7 +15,10 @@ from ._utils import (
     extract_tool_return,
     fn_is_async,
 )
-from ._utils._get_fields_from_call_args import get_fields_from_call_args
+from ._utils._get_fields_from_call_args import (
+    check_fields_from_call_args,
+    get_fields_from_fn_args,
+)
 from .call_params import BaseCallParams
 from .call_response import BaseCallResponse
 from .dynamic_config import BaseDynamicConfig
@@ -122,6 +125,7 @@ def extract_with_tools_factory(  # noqa: ANN202
     ]:
         fn._model = model  # pyright: ignore [reportFunctionMemberAccess]
         fn.__mirascope_call__ = True  # pyright: ignore [reportFunctionMemberAccess]
+        check_fields_from_call_args(response_model, fn)
         create_decorator_kwargs = {
             "model": model,
             "tools": tools,
@@ -132,19 +136,18 @@ def extract_with_tools_factory(  # noqa: ANN202
             "call_params": call_params,
         }
         if fn_is_async(fn):
+            create_fn_async = create_decorator(fn=fn, **create_decorator_kwargs)
 
             @wraps(fn)
             async def inner_async(*args: _P.args, **kwargs: _P.kwargs) -> (
                 _ResponseModelT | _BaseCallResponseT
             ) | (_ParsedOutputT | _BaseCallResponseT):
-                call_response = await create_decorator(
-                    fn=fn, **create_decorator_kwargs
-                )(*args, **kwargs)
+                call_response = await create_fn_async(*args, **kwargs)
                 try:
                     if call_response.tools:
                         return call_response
-                    fields_from_call_args = get_fields_from_call_args(
-                        response_model, fn, args, kwargs
+                    fields_from_call_args = get_fields_from_fn_args(
+                        response_model, call_response.fn_args
                     )
                     json_output = get_json_output(call_response, True)
                     output = extract_tool_return(
@@ -159,19 +162,18 @@ def extract_with_tools_factory(  # noqa: ANN202
 
             return inner_async
         else:
+            create_fn = create_decorator(fn=fn, **create_decorator_kwargs)
 
             @wraps(fn)
             def inner(*args: _P.args, **kwargs: _P.kwargs) -> (
                 _ResponseModelT | _BaseCallResponseT
             ) | (_ParsedOutputT | _BaseCallResponseT):
-                call_response = create_decorator(fn=fn, **create_decorator_kwargs)(
-                    *args, **kwargs
-                )
+                call_response = create_fn(*args, **kwargs)
                 try:
                     if call_response.tools:
                         return call_response
-                    fields_from_call_args = get_fields_from_call_args(
-                        response_model, fn, args, kwargs
+                    fields_from_call_args = get_fields_from_fn_args(
+                        response_model, call_response.fn_args
                     )
                     json_output = get_json_output(call_response, True)
                     output = extract_tool_return(
@@ -5,6 +5,7 @@ from ._convert_base_model_to_base_tool import convert_base_model_to_base_tool
 from ._convert_base_type_to_base_tool import convert_base_type_to_base_tool
 from ._convert_function_to_base_tool import convert_function_to_base_tool
 from ._default_tool_docstring import DEFAULT_TOOL_DOCSTRING
+from ._encode_base64 import encode_base64
 from ._extract_tool_return import extract_tool_return
 from ._fn_is_async import fn_is_async
 from ._format_template import format_template
@@ -16,6 +17,7 @@ from ._get_dynamic_configuration import get_dynamic_configuration
 from ._get_fn_args import get_fn_args
 from ._get_image_type import get_image_type
 from ._get_metadata import get_metadata
+from ._get_model_json_schema import copy_json, get_model_json_schema
 from ._get_possible_user_message_param import get_possible_user_message_param
 from ._get_prompt_template import get_prompt_template
 from ._get_template_values import get_template_values
@@ -39,6 +41,7 @@ from ._protocols import (
     SameSyncAndAsyncClientSetupCall,
     SetupCall,
 )
+from ._requires_media_loading import requires_media_loading
 from ._setup_call import setup_call
 from ._setup_extract_tool import setup_extract_tool
 
@@ -58,6 +61,8 @@ __all__ = [
     "convert_base_model_to_base_tool",
     "convert_base_type_to_base_tool",
     "convert_function_to_base_tool",
+    "copy_json",
+    "encode_base64",
     "extract_tool_return",
     "fn_is_async",
     "format_template",
@@ -70,6 +75,7 @@ __all__ = [
     "get_fn_args",
     "get_image_type",
     "get_metadata",
+    "get_model_json_schema",
     "get_possible_user_message_param",
     "get_prompt_template",
     "get_template_values",
@@ -82,6 +88,7 @@ __all__ = [
     "parse_content_template",
     "parse_prompt_messages",
     "pil_image_to_bytes",
+    "requires_media_loading",
     "setup_call",
     "setup_extract_tool",
 ]
@@ -136,4 +136,8 @@ def convert_function_to_base_tool(
         model.call = call_async  # pyright: ignore [reportAttributeAccessIssue]
     else:
         model.call = call  # pyright: ignore [reportAttributeAccessIssue]
+    if not has_self:
+        # Keep a reference to the original function so that the tool can be called in
+        # another process, since the dynamically constructed model is not picklable.
+        model.__tool_fn__ = fn  # pyright: ignore [reportAttributeAccessIssue]
     return update_abstractmethods(model)
@@ -0,0 +1,40 @@
+"""This module provides a cached base64 encoder for image, audio and document bytes."""
+
+import base64
+import threading
+from collections import OrderedDict
+
+_MAX_CACHE_BYTES = 64 * 1024 * 1024
+
+_cache: OrderedDict[bytes, str] = OrderedDict()
+_cache_bytes = 0
+_lock = threading.Lock()
+
+
+def encode_base64(data: bytes | bytearray | memoryview) -> str:
+    """Returns `data` encoded as a base64 string.
+
+    Encodings are cached by content, so converting the same message history on every
+    turn of a conversation only encodes each image, audio or document once. The cache is
+    keyed by the (immutable) bytes themselves, which are usually already held by their
+    content part, and is bounded to `_MAX_CACHE_BYTES` of least recently used entries.
+    """
+    if not isinstance(data, bytes):
+        return base64.b64encode(data).decode("utf-8")
+    global _cache_bytes
+    with _lock:
+        if (encoded := _cache.get(data)) is not None:
+            _cache.move_to_end(data)
+            return encoded
+    encoded = base64.b64encode(data).decode("utf-8")
+    size = len(data) + len(encoded)
+    if size > _MAX_CACHE_BYTES:
+        return encoded
+    with _lock:
+        if data not in _cache:
+            _cache[data] = encoded
+            _cache_bytes += size
+            while _cache_bytes > _MAX_CACHE_BYTES:
+                key, value = _cache.popitem(last=False)
+                _cache_bytes -= len(key) + len(value)
+    return encoded
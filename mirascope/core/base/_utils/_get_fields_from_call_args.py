@@ -10,25 +10,57 @@ from mirascope.core.base._utils import get_fn_args
 from mirascope.core.base.from_call_args import is_from_call_args
 
 
-def get_fields_from_call_args(
-    response_model: object,
-    fn: Callable,
-    args: tuple[object, ...],
-    kwargs: dict[str, Any],
-) -> dict[str, Any]:
+def _get_call_args_fields(response_model: object) -> set[str]:
     if origin := get_origin(response_model):
         response_model = origin
     if not (inspect.isclass(response_model) and issubclass(response_model, BaseModel)):
-        return {}
-    call_args_fields = {
+        return set()
+    return {
         name
         for name, field in response_model.model_fields.items()
         if is_from_call_args(field)
     }
 
-    fn_args = get_fn_args(fn, args, kwargs)
+
+def check_fields_from_call_args(response_model: object, fn: Callable) -> None:
+    """Raises a `ValueError` if `fn` can't take every `FromCallArgs()` field.
+
+    This lets a mismatch fail when the function is decorated rather than after the call
+    has been made. Functions that take `**kwargs` can't be checked until they're called.
+    """
+    call_args_fields = _get_call_args_fields(response_model)
+    if not call_args_fields:
+        return
+    parameters = inspect.signature(fn).parameters
+    if any(p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters.values()):
+        return
+    if not call_args_fields.issubset(parameters.keys()):
+        raise ValueError(
+            f"The function arguments do not contain all the fields marked with `FromCallArgs`. fn_args={list(parameters)}, {call_args_fields=}"
+        )
+
+
+def get_fields_from_fn_args(
+    response_model: object, fn_args: dict[str, Any]
+) -> dict[str, Any]:
+    """Returns the `FromCallArgs()` fields from already bound function arguments."""
+    call_args_fields = _get_call_args_fields(response_model)
+    if not call_args_fields:
+        return {}
     if not call_args_fields.issubset(fn_args.keys()):
         raise ValueError(
             f"The function arguments do not contain all the fields marked with `FromCallArgs`. {fn_args=}, {call_args_fields=}"
         )
     return {name: fn_args[name] for name in call_args_fields}
+
+
+def get_fields_from_call_args(
+    response_model: object,
+    fn: Callable,
+    args: tuple[object, ...],
+    kwargs: dict[str, Any],
+) -> dict[str, Any]:
+    if not _get_call_args_fields(response_model):
+        # Skips binding the arguments when there are no fields to fill
+        return {}
+    return get_fields_from_fn_args(response_model, get_fn_args(fn, args, kwargs))
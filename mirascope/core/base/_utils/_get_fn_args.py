@@ -1,23 +1,109 @@
 """Function for binding `args` and `kwargs` as a dictionary to the fn's signature."""
 
 import inspect
+import weakref
 from collections.abc import Callable
 from typing import Any
 
+_VAR_POSITIONAL = inspect.Parameter.VAR_POSITIONAL
+_VAR_KEYWORD = inspect.Parameter.VAR_KEYWORD
+_POSITIONAL_KINDS = (
+    inspect.Parameter.POSITIONAL_ONLY,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+)
+_KEYWORD_KINDS = (
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    inspect.Parameter.KEYWORD_ONLY,
+)
+
+
+class _Binder:
+    """Binds arguments to a signature precomputed once per function."""
+
+    __slots__ = (
+        "defaults",
+        "keyword_names",
+        "names",
+        "parameters",
+        "positional_names",
+        "signature",
+        "var_keyword",
+        "var_positional",
+    )
+
+    def __init__(self, signature: inspect.Signature) -> None:
+        parameters = signature.parameters.values()
+        self.signature = signature
+        self.parameters = [(p.name, p.kind) for p in parameters]
+        self.names = {p.name for p in parameters}
+        self.positional_names = [
+            p.name for p in parameters if p.kind in _POSITIONAL_KINDS
+        ]
+        self.keyword_names = {p.name for p in parameters if p.kind in _KEYWORD_KINDS}
+        self.var_positional = any(p.kind == _VAR_POSITIONAL for p in parameters)
+        self.var_keyword = any(p.kind == _VAR_KEYWORD for p in parameters)
+        self.defaults = {
+            p.name: p.default for p in parameters if p.default is not p.empty
+        }
+
+    def _bind_with_signature(
+        self, args: tuple[object, ...], kwargs: dict[str, Any]
+    ) -> dict[str, Any]:
+        bound_args = self.signature.bind_partial(*args, **kwargs)
+        bound_args.apply_defaults()
+
+        fn_args = {}
+        for name, value in bound_args.arguments.items():
+            if self.signature.parameters[name].kind == _VAR_KEYWORD:
+                fn_args.update(value)
+            else:
+                fn_args[name] = value
+        return fn_args
+
+    def bind(self, args: tuple[object, ...], kwargs: dict[str, Any]) -> dict[str, Any]:
+        num_positional = len(self.positional_names)
+        if len(args) > num_positional and not self.var_positional:
+            # Too many arguments, so we let `inspect` raise the usual error
+            return self._bind_with_signature(args, kwargs)
+        bound = dict(zip(self.positional_names, args, strict=False))
+        var_kwargs = {}
+        for name, value in kwargs.items():
+            if name in self.keyword_names and name not in bound:
+                bound[name] = value
+            elif self.var_keyword and name not in self.names:
+                var_kwargs[name] = value
+            else:
+                return self._bind_with_signature(args, kwargs)
+
+        fn_args = {}
+        for name, kind in self.parameters:
+            if kind == _VAR_POSITIONAL:
+                fn_args[name] = args[num_positional:]
+            elif kind == _VAR_KEYWORD:
+                fn_args.update(var_kwargs)
+            elif name in bound:
+                fn_args[name] = bound[name]
+            elif name in self.defaults:
+                fn_args[name] = self.defaults[name]
+        return fn_args
+
+
+_binders: weakref.WeakKeyDictionary[Callable, _Binder] = weakref.WeakKeyDictionary()
+
+
+def _get_binder(fn: Callable) -> _Binder:
+    try:
+        binder = _binders.get(fn)
+    except TypeError:  # not weak referenceable or not hashable
+        return _Binder(inspect.signature(fn))
+    if binder is None:
+        binder = _Binder(inspect.signature(fn))
+        _binders[fn] = binder
+    return binder
+
 
 def get_fn_args(
     fn: Callable, args: tuple[object, ...], kwargs: dict[str, Any]
 ) -> dict[str, Any]:
     """Returns the `args` and `kwargs` as a dictionary bound by `fn`'s signature."""
-    signature = inspect.signature(fn)
-    bound_args = signature.bind_partial(*args, **kwargs)
-    bound_args.apply_defaults()
-
-    fn_args = {}
-    for name, value in bound_args.arguments.items():
-        if signature.parameters[name].kind == inspect.Parameter.VAR_KEYWORD:
-            fn_args.update(value)
-        else:
-            fn_args[name] = value
-
-    return fn_args
+    return _get_binder(fn).bind(args, kwargs)
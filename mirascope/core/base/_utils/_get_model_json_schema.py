@@ -0,0 +1,55 @@
+"""Utility for generating the JSON schema of a model once and reusing it."""
+
+import threading
+import weakref
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic.json_schema import (
+    DEFAULT_REF_TEMPLATE,
+    GenerateJsonSchema,
+    JsonSchemaMode,
+    model_json_schema,
+)
+
+_schemas: weakref.WeakKeyDictionary[type[BaseModel], dict[tuple, dict[str, Any]]] = (
+    weakref.WeakKeyDictionary()
+)
+_lock = threading.Lock()
+
+
+def copy_json(value: Any) -> Any:  # noqa: ANN401
+    """Returns a deep copy of a JSON value, which is much faster than `deepcopy`."""
+    if isinstance(value, dict):
+        return {key: copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_json(item) for item in value]
+    return value
+
+
+def get_model_json_schema(
+    model: type[BaseModel],
+    schema_generator: type[GenerateJsonSchema],
+    by_alias: bool = True,
+    ref_template: str = DEFAULT_REF_TEMPLATE,
+    mode: JsonSchemaMode = "validation",
+) -> dict[str, Any]:
+    """Returns a copy of the JSON schema of `model`, generated once per argument set.
+
+    Schemas are cached per model class (held weakly) and schema generator, so e.g. the
+    OpenAI strict schema and the default schema of a model are cached separately.
+    """
+    key = (schema_generator, by_alias, ref_template, mode)
+    with _lock:
+        schema = _schemas.get(model, {}).get(key)
+    if schema is None:
+        schema = model_json_schema(
+            model,
+            by_alias=by_alias,
+            ref_template=ref_template,
+            schema_generator=schema_generator,
+            mode=mode,
+        )
+        with _lock:
+            _schemas.setdefault(model, {})[key] = schema
+    return copy_json(schema)
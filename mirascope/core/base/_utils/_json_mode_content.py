@@ -1,17 +1,29 @@
 """A function generating content to request JSON mode from models without it."""
 
 import json
+import weakref
 
 from pydantic import BaseModel
 
+from ..canonicalization import request_canonicalizer
 from ..tool import GenerateJsonSchemaNoTitles
 
+_contents: weakref.WeakKeyDictionary[type[BaseModel], dict[bool, str]] = (
+    weakref.WeakKeyDictionary()
+)
+
 
 def json_mode_content(tool_type: type[BaseModel] | None) -> str:
     """Returns the content to request JSON mode from models without it."""
     if not tool_type:
         return "\n\nFor your final response, output ONLY a valid JSON dict that adheres to the schema"
-    return f"""
+    sort_keys = request_canonicalizer.enabled
+    if (content := _contents.get(tool_type, {}).get(sort_keys)) is not None:
+        return content
+    schema = tool_type.model_json_schema(schema_generator=GenerateJsonSchemaNoTitles)
+    content = f"""
 
 For your final response, output ONLY a valid JSON dict (NOT THE SCHEMA) from the content that adheres to this schema:
-{json.dumps(tool_type.model_json_schema(schema_generator=GenerateJsonSchemaNoTitles), indent=2)}"""
+{json.dumps(schema, indent=2, sort_keys=sort_keys)}"""
+    _contents.setdefault(tool_type, {})[sort_keys] = content
+    return content
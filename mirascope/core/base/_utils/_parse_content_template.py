@@ -2,11 +2,14 @@
 
 import re
 import urllib.request
-from functools import reduce
+from collections.abc import Callable, Collection, Sequence
+from contextlib import suppress
+from functools import lru_cache
 from typing import Any, Literal, cast
 
 from typing_extensions import TypedDict
 
+from ..media_cache import media_cache
 from ..message_param import (
     AudioPart,
     AudioURLPart,
@@ -23,6 +26,7 @@ from ._get_audio_type import get_audio_type
 from ._get_document_type import get_document_type
 from ._get_image_type import get_image_type
 from ._pil_image_to_bytes import pil_image_to_bytes
+from ._prepare_image import get_image_preparation_config, prepare_image
 
 _PartType = Literal[
     "image",
@@ -45,37 +49,34 @@ class _Part(TypedDict):
     options: dict[str, str] | None
 
 
-def _cleanup_text_preserve_newlines(text: str) -> str:
-    def clean_line(line: str) -> str:
-        # Remove '\r' to handle Windows-style line breaks
-        line = line.replace("\r", "")
-
-        # Remove zero-width spaces (common examples)
-        zero_width_spaces = ["\u200b", "\u200c", "\u200d", "\ufeff"]
-        for zw in zero_width_spaces:
-            line = line.replace(zw, "")
+# Removes '\r' to handle Windows-style line breaks, zero-width spaces (common
+# examples), and all fullwidth spaces (u3000) anywhere in a line.
+_REMOVED_CHARACTERS = str.maketrans(dict.fromkeys("\r\u200b\u200c\u200d\ufeff\u3000"))
 
-        # Remove all fullwidth spaces (u3000) anywhere in the line
-        line = line.replace("\u3000", "")
+# Static template segments are cleaned on every call, so we cache the short ones.
+# Longer segments are usually formatted content (e.g. inlined documents) that would
+# only churn the cache.
+_MAX_CACHED_TEXT_LENGTH = 4096
 
-        # Strip leading/trailing half-width spaces (but keep tabs/newlines)
-        line = line.strip(" ")
 
-        # Remove leading tabs
-        line = line.lstrip("\t")
-        # Remove trailing tabs
-        line = line.rstrip("\t")
+def _clean_line(line: str) -> str:
+    # Strip leading/trailing half-width spaces (but keep tabs/newlines), then remove
+    # leading and trailing tabs
+    return line.translate(_REMOVED_CHARACTERS).strip(" ").lstrip("\t").rstrip("\t")
 
-        return line
 
+def _cleanup_lines(text: str) -> str:
     # Split lines but preserve the newline at the end of each line
-    lines = text.splitlines(keepends=True)
+    return "".join(map(_clean_line, text.splitlines(keepends=True)))
+
 
-    # Use `map` to apply `clean_line` to each line
-    cleaned_lines = map(clean_line, lines)
+_cleanup_cached_lines = lru_cache(maxsize=1024)(_cleanup_lines)
 
-    # Use `reduce` to concatenate all lines into a single string
-    return reduce(lambda acc, x: acc + x, cleaned_lines, "")
+
+def _cleanup_text_preserve_newlines(text: str) -> str:
+    if len(text) <= _MAX_CACHED_TEXT_LENGTH:
+        return _cleanup_cached_lines(text)
+    return _cleanup_lines(text)
 
 
 def _parse_parts(template: str) -> list[_Part]:
@@ -125,7 +126,9 @@ def _load_media(source: str | bytes) -> bytes:
         # in a type hint of `str | bytearray | memoryview` for source in the else.
         if isinstance(source, bytes | bytearray | memoryview):
             data = source
-        elif source.startswith(("http://", "https://", "data:", "file://")):
+        elif source.startswith(("http://", "https://")):
+            data = media_cache.load(source)
+        elif source.startswith(("data:", "file://")):
             with urllib.request.urlopen(source) as response:
                 data = response.read()
         else:
@@ -138,13 +141,92 @@ def _load_media(source: str | bytes) -> bytes:
         ) from e  # pragma: no cover
 
 
+def _prefetch_remote_media(parts: list[_Part], attrs: dict[str, Any]) -> None:
+    """Downloads all remote media sources loaded while parsing the template concurrently.
+
+    Documents, and images that are prepared for upload, are loaded when the template is
+    parsed (unlike other image and audio URLs, which are kept as URL parts and loaded by
+    `prefetch_media_urls` when converted), so we warm the media cache with all of them
+    at once instead of downloading them one after the other.
+    """
+    sources = []
+    for part in parts:
+        loaded = part["type"] in ("document", "documents") or (
+            part["type"] in ("image", "images")
+            and get_image_preparation_config(part["options"])
+        )
+        if not loaded:
+            continue
+        source = attrs[part["template"]]
+        if part["type"].endswith("s"):
+            if isinstance(source, list):
+                sources.extend(source)
+        else:
+            sources.append(source)
+    remote = [
+        source
+        for source in sources
+        if isinstance(source, str) and source.startswith(("http://", "https://"))
+    ]
+    # Errors are raised with the failing source once each part is constructed.
+    if len(remote) > 1:
+        with suppress(Exception):
+            media_cache.load_many(remote)
+
+
+def _remote_media_urls(
+    message_params: Sequence[object],
+    part_types: Collection[str],
+    include: Callable[[str], bool] | None,
+) -> list[str]:
+    return [
+        part.url
+        for message_param in message_params
+        if isinstance(message_param, BaseMessageParam)
+        and not isinstance(message_param.content, str)
+        for part in message_param.content
+        if isinstance(part, ImageURLPart | AudioURLPart)
+        and part.type in part_types
+        and part.url.startswith(("http://", "https://"))
+        and (include is None or include(part.url))
+    ]
+
+
+def prefetch_media_urls(
+    message_params: Sequence[object],
+    part_types: Collection[str] = ("image_url", "audio_url"),
+    include: Callable[[str], bool] | None = None,
+) -> None:
+    """Downloads the remote URLs of the media parts of all messages concurrently.
+
+    Providers that send media inline load each URL part when they convert it, so they
+    call this first to warm the media cache with all of them at once instead of
+    downloading them one after the other.
+
+    Args:
+        message_params: The messages whose media parts to load.
+        part_types: The types of the parts the provider loads.
+        include: Whether the provider loads the given URL, all of them if `None`.
+    """
+    urls = _remote_media_urls(message_params, part_types, include)
+    # Errors are raised with the failing URL once each part is converted.
+    if len(urls) > 1:
+        with suppress(Exception):
+            media_cache.load_many(urls)
+
+
 def _construct_image_part(
     source: str | bytes | Image.Image, options: dict[str, str] | None
 ) -> ImagePart | ImageURLPart:
     detail = None
     if options:
         detail = options.get("detail", None)
-    if isinstance(source, str) and source.startswith(("http://", "https://", "gs://")):
+    preparation_config = get_image_preparation_config(options)
+    # Image URLs are only downloaded when the image needs to be prepared for upload.
+    if isinstance(source, str) and (
+        source.startswith("gs://")
+        or (source.startswith(("http://", "https://")) and not preparation_config)
+    ):
         return ImageURLPart(type="image_url", url=source, detail=detail)
     if isinstance(source, Image.Image):
         image = pil_image_to_bytes(source)
@@ -156,6 +238,8 @@ def _construct_image_part(
     else:
         image = _load_media(source)
         media_type = f"image/{get_image_type(image)}"
+    if preparation_config:
+        image, media_type = prepare_image(image, preparation_config)
     return ImagePart(
         type="image",
         media_type=media_type,
@@ -307,11 +391,9 @@ def parse_content_template(
     if not template:
         return None
 
-    parts = [
-        item
-        for part in _parse_parts(template.strip())
-        for item in _construct_parts(part, attrs)
-    ]
+    template_parts = _parse_parts(template.strip())
+    _prefetch_remote_media(template_parts, attrs)
+    parts = [item for part in template_parts for item in _construct_parts(part, attrs)]
 
     if not parts:
         return None
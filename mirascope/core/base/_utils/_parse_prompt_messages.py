@@ -1,6 +1,8 @@
 """This module provides a function to parse messages from a prompt template."""
 
 import re
+from collections.abc import Iterator
+from functools import lru_cache
 from typing import Any, TypeVar
 
 from pydantic import BaseModel
@@ -17,6 +19,31 @@ _CallParamsT = TypeVar("_CallParamsT", bound=BaseCallParams)
 _ClientT = TypeVar("_ClientT")
 
 
+@lru_cache(maxsize=32)
+def _role_pattern(roles: tuple[str, ...]) -> re.Pattern[str]:
+    return re.compile("|".join(f"{role.upper()}:" for role in (*roles, "messages")))
+
+
+def _tokenize_roles(roles: list[str], template: str) -> Iterator[tuple[str, str]]:
+    """Yields the `(role, content)` sections of `template` in a single linear pass.
+
+    Each section runs from its `ROLE:` keyword to the next keyword (or the end of the
+    template). A section must contain at least one character, so a keyword directly
+    following another keyword is part of the first section's content.
+    """
+    keywords = list(_role_pattern(tuple(roles)).finditer(template))
+    i = 0
+    while i < len(keywords):
+        start = keywords[i].end()
+        j = i + 1
+        while j < len(keywords) and keywords[j].start() <= start:
+            j += 1
+        end = keywords[j].start() if j < len(keywords) else len(template)
+        if end > start:
+            yield keywords[i].group()[:-1].lower(), template[start:end]
+        i = j
+
+
 def parse_prompt_messages(
     roles: list[str],
     template: str,
@@ -33,9 +60,8 @@ def parse_prompt_messages(
         if computed_fields:
             attrs |= computed_fields
     messages = []
-    re_roles = "|".join([role.upper() for role in roles] + ["MESSAGES"])
-    for match in re.finditer(rf"({re_roles}):((.|\n)+?)(?=({re_roles}):|\Z)", template):
-        role, content_template = match.group(1).lower(), match.group(2).strip()
+    for role, content_template in _tokenize_roles(roles, template):
+        content_template = content_template.strip()
         if role == "messages":
             template_variables = get_template_variables(content_template, False)
             if template_variables[0].startswith("self"):
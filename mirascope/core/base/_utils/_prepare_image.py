@@ -0,0 +1,147 @@
+"""This module provides a function to downscale and recompress images before upload."""
+
+import hashlib
+import math
+import threading
+from collections import OrderedDict
+from io import BytesIO
+
+from typing_extensions import TypedDict
+
+from ..types import Image, has_pil_module
+
+
+class ImagePreparationConfig(TypedDict, total=False):
+    """Options for downscaling and recompressing an image.
+
+    Attributes:
+        max_size: The maximum length in pixels of the longest side.
+        max_short_side: The maximum length in pixels of the shortest side.
+        max_pixels: The maximum total number of pixels.
+        quality: The JPEG/WebP quality to recompress with.
+    """
+
+    max_size: int
+    max_short_side: int
+    max_pixels: int
+    quality: int
+
+
+IMAGE_PREPARATION_PRESETS: dict[str, ImagePreparationConfig] = {
+    # Larger images are downscaled by Anthropic to fit these limits anyway.
+    "anthropic": {"max_size": 1568, "max_pixels": 1_150_000, "quality": 85},
+    "bedrock": {"max_size": 1568, "max_pixels": 1_150_000, "quality": 85},
+    # OpenAI fits high detail images within 2048x2048 and then to a 768px short side.
+    "openai": {"max_size": 2048, "max_short_side": 768, "quality": 85},
+    "azure": {"max_size": 2048, "max_short_side": 768, "quality": 85},
+    "groq": {"max_size": 2048, "max_short_side": 768, "quality": 85},
+    "mistral": {"max_size": 1024, "quality": 85},
+    # Gemini tiles images into 768x768 crops, so there's little value beyond 3072px.
+    "gemini": {"max_size": 3072, "quality": 85},
+    "google": {"max_size": 3072, "quality": 85},
+    "vertex": {"max_size": 3072, "quality": 85},
+}
+
+_MAX_CACHE_ENTRIES = 128
+_cache: OrderedDict[tuple[str, tuple], tuple[bytes, str]] = OrderedDict()
+_lock = threading.Lock()
+
+
+def _scale(width: int, height: int, config: ImagePreparationConfig) -> float:
+    scale = 1.0
+    if max_size := config.get("max_size"):
+        scale = min(scale, max_size / max(width, height))
+    if max_short_side := config.get("max_short_side"):
+        scale = min(scale, max_short_side / min(width, height))
+    if max_pixels := config.get("max_pixels"):
+        scale = min(scale, math.sqrt(max_pixels / (width * height)))
+    return scale
+
+
+def _prepare(data: bytes, config: ImagePreparationConfig) -> tuple[bytes, str]:
+    from PIL import ImageOps
+
+    with Image.open(BytesIO(data)) as original:
+        original_format = original.format
+        image = ImageOps.exif_transpose(original) or original
+        scale = _scale(image.width, image.height, config)
+        if scale < 1:
+            image = image.resize(
+                (
+                    max(1, round(image.width * scale)),
+                    max(1, round(image.height * scale)),
+                ),
+                Image.Resampling.LANCZOS,
+            )
+        has_alpha = image.mode in ("RGBA", "LA", "PA") or (
+            image.mode == "P" and "transparency" in image.info
+        )
+        output = BytesIO()
+        if has_alpha:
+            image.save(output, format="PNG", optimize=True)
+            media_type = "image/png"
+        else:
+            if image.mode != "RGB":
+                image = image.convert("RGB")
+            image.save(
+                output, format="JPEG", quality=config.get("quality", 85), optimize=True
+            )
+            media_type = "image/jpeg"
+    prepared = output.getvalue()
+    if scale >= 1 and len(prepared) >= len(data) and original_format:
+        # Recompressing didn't help, so we keep the original image as-is.
+        return data, f"image/{original_format.lower()}"
+    return prepared, media_type
+
+
+def get_image_preparation_config(
+    options: dict[str, str] | None,
+) -> ImagePreparationConfig | None:
+    """Returns the image preparation config set by the options of an image template.
+
+    The `resize` option selects a preset from `IMAGE_PREPARATION_PRESETS` (e.g.
+    `{url:image(resize=anthropic)}`) and the `max_size`, `max_short_side`, `max_pixels`
+    and `quality` options set (or override) individual limits.
+
+    Raises:
+        ValueError: If the preset is unknown.
+    """
+    if not options:
+        return None
+    config = ImagePreparationConfig()
+    if preset := options.get("resize"):
+        if preset not in IMAGE_PREPARATION_PRESETS:
+            raise ValueError(
+                f"Unknown image preparation preset: {preset}. Available presets: "
+                f"{', '.join(IMAGE_PREPARATION_PRESETS)}"
+            )
+        config.update(IMAGE_PREPARATION_PRESETS[preset])
+    for key in ImagePreparationConfig.__annotations__:
+        if key in options:
+            config[key] = int(options[key])
+    return config or None
+
+
+def prepare_image(data: bytes, config: ImagePreparationConfig) -> tuple[bytes, str]:
+    """Returns the image downscaled and recompressed along with its media type.
+
+    Images are resized (keeping their aspect ratio) to fit the configured limits and
+    recompressed as JPEG, or as PNG if they have transparency. Results are cached by the
+    SHA-256 of the image content.
+
+    Raises:
+        ValueError: If `Pillow` is not installed.
+    """
+    if not has_pil_module:  # pragma: no cover
+        raise ValueError("Preparing images requires `Pillow`: `pip install pillow`")
+    key = (hashlib.sha256(data).hexdigest(), tuple(sorted(config.items())))
+    with _lock:
+        if (prepared := _cache.get(key)) is not None:
+            _cache.move_to_end(key)
+            return prepared
+    prepared = _prepare(data, config)
+    with _lock:
+        _cache[key] = prepared
+        while len(_cache) > _MAX_CACHE_ENTRIES:
+            _cache.popitem(last=False)
+    return prepared
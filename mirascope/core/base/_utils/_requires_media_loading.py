@@ -0,0 +1,36 @@
+"""This module provides a function to check whether setting up a call loads media."""
+
+import re
+from collections.abc import Callable
+from typing import Any
+
+from ..dynamic_config import BaseDynamicConfig
+from ..message_param import BaseMessageParam
+from ._get_prompt_template import get_prompt_template
+
+_MEDIA_PART_PATTERN = re.compile(
+    r"\{[^:{}]*:(image|images|audio|audios|document|documents)(?:\([^)]*\))?\}"
+)
+_URL_PART_TYPES = {"image_url", "audio_url"}
+
+
+def requires_media_loading(
+    fn: Callable[..., Any], dynamic_config: BaseDynamicConfig
+) -> bool:
+    """Returns whether setting up a call to `fn` may read or download media.
+
+    Async calls use this to run the (synchronous) call setup off the event loop only
+    when it may block on loading images, audio, or documents.
+    """
+    if dynamic_config is not None and (messages := dynamic_config.get("messages")):
+        return any(
+            isinstance(message, BaseMessageParam)
+            and not isinstance(message.content, str)
+            and any(part.type in _URL_PART_TYPES for part in message.content)
+            for message in messages
+        )
+    try:
+        prompt_template = get_prompt_template(fn)
+    except ValueError:
+        return False
+    return _MEDIA_PART_PATTERN.search(prompt_template) is not None
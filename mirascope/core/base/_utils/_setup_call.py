@@ -10,6 +10,7 @@ from typing import Any, Protocol, TypeVar, cast
 
 from ..call_kwargs import BaseCallKwargs
 from ..call_params import BaseCallParams, CommonCallParams
+from ..canonicalization import canonicalize, request_canonicalizer
 from ..dynamic_config import BaseDynamicConfig
 from ..message_param import BaseMessageParam
 from ..tool import BaseTool
@@ -74,6 +75,15 @@ def setup_call(
             else convert_function_to_base_tool(tool, tool_type)
             for tool in tools
         ]
-        call_kwargs["tools"] = [tool_type.tool_schema() for tool_type in tool_types]
+        if request_canonicalizer.enabled:
+            call_kwargs["tools"] = [
+                canonicalize(tool_type.tool_schema())
+                for tool_type in sorted(tool_types, key=lambda t: t._name())
+            ]
+        else:
+            call_kwargs["tools"] = [tool_type.tool_schema() for tool_type in tool_types]
+
+    if request_canonicalizer.enabled:
+        request_canonicalizer.record(fn.__name__, call_kwargs.get("tools"), messages)
 
     return prompt_template, messages, tool_types, call_kwargs
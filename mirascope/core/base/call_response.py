@@ -223,7 +223,7 @@ class BaseCallResponse(
         ...
 
     @computed_field
-    @property
+    @cached_property
     @abstractmethod
     def cost(self) -> float | None:
         """Should return the cost of the response in dollars.
@@ -0,0 +1,150 @@
+"""This module defines the canonicalization of requests for provider-side prefix caching.
+
+usage docs: learn/calls.md#provider-specific-parameters
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from typing import Any
+
+from pydantic import BaseModel
+
+
+def canonicalize(value: Any) -> Any:  # noqa: ANN401
+    """Returns a copy of a JSON-like value with a stable key order.
+
+    Dictionary keys are sorted recursively and so are `required` lists of property
+    names, which have no meaningful order. All other lists (e.g. `enum` or `anyOf`) keep
+    their order since it may be meaningful.
+    """
+    if isinstance(value, dict):
+        return {
+            key: sorted(item)
+            if key == "required"
+            and isinstance(item, list)
+            and all(isinstance(name, str) for name in item)
+            else canonicalize(item)
+            for key, item in sorted(value.items())
+        }
+    if isinstance(value, list):
+        return [canonicalize(item) for item in value]
+    return value
+
+
+def _serialize_default(value: Any) -> str:  # noqa: ANN401
+    if isinstance(value, bytes | bytearray | memoryview):
+        return hashlib.sha256(value).hexdigest()
+    if isinstance(value, BaseModel):
+        return json.dumps(
+            value.model_dump(), sort_keys=True, default=_serialize_default
+        )
+    return str(value)
+
+
+def _common_prefix_length(first: str, second: str) -> int:
+    """Returns the length of the common prefix using C-level slice comparisons."""
+    low, high = 0, min(len(first), len(second))
+    while low < high:
+        mid = (low + high + 1) // 2
+        if first[:mid] == second[:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+class RequestCanonicalizer:
+    """Makes requests serialize identically across calls so providers can cache them.
+
+    Providers that cache request prefixes automatically (e.g. OpenAI) only get a hit
+    when the tools, system messages, and schemas at the start of a request are
+    byte-identical to a previous request. When enabled, every call:
+
+    - orders its tools by name,
+    - sorts the keys of each tool schema,
+    - sorts the keys of the schema in JSON mode instructions, and
+    - records how many characters of its tools and messages (in order) match the
+      previous call of the same function, available through `stable_prefix_length`.
+
+    Note that sorting the keys of a schema also sorts its properties, which changes the
+    order in which models tend to generate fields.
+
+    Example:
+
+    ```python
+    from mirascope.core import openai
+    from mirascope.core.base import request_canonicalizer
+
+    request_canonicalizer.enable()
+
+
+    @openai.call("gpt-4o-mini", tools=[...])
+    def agent(query: str) -> str:
+        return f"SYSTEM: {INSTRUCTIONS} USER: {query}"
+
+
+    agent("first query")
+    agent("second query")
+    print(request_canonicalizer.stable_prefix_length("agent"))
+    ```
+    """
+
+    def __init__(self) -> None:
+        """Initializes a disabled instance of `RequestCanonicalizer`."""
+        self.enabled = False
+        self._prefixes: dict[str, str] = {}
+        self._stable_prefix_lengths: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def enable(self) -> None:
+        """Starts canonicalizing requests."""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stops canonicalizing requests."""
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Forgets all previously recorded requests."""
+        with self._lock:
+            self._prefixes.clear()
+            self._stable_prefix_lengths.clear()
+
+    def record(self, fn_name: str, tools: list[Any] | None, messages: list[Any]) -> int:
+        """Records a request and returns the length of its stable prefix.
+
+        Args:
+            fn_name: The name of the function that made the call.
+            tools: The tool schemas of the request.
+            messages: The messages of the request.
+
+        Returns:
+            The number of characters of the serialized tools and messages shared with
+            the previous request of the same function.
+        """
+        serialized = json.dumps(
+            [tools or [], messages], sort_keys=True, default=_serialize_default
+        )
+        with self._lock:
+            previous = self._prefixes.get(fn_name, "")
+            self._prefixes[fn_name] = serialized
+            length = self._stable_prefix_lengths[fn_name] = _common_prefix_length(
+                previous, serialized
+            )
+        return length
+
+    def stable_prefix_length(self, fn_name: str) -> int | None:
+        """Returns the stable prefix length of the last request of the given function.
+
+        Args:
+            fn_name: The name of the function.
+        """
+        with self._lock:
+            return self._stable_prefix_lengths.get(fn_name)
+
+
+request_canonicalizer = RequestCanonicalizer()
+"""The shared canonicalizer applied to every call when enabled."""
@@ -0,0 +1,341 @@
+"""This module defines the shared media loader and cache used when building messages.
+
+usage docs: learn/prompts.md#multi-modal-inputs
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import tempfile
+import threading
+import urllib.request
+import weakref
+from collections import OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import httpx
+else:
+    try:
+        import httpx
+    except ImportError:  # pragma: no cover
+        httpx = None
+
+MEDIA_CACHE_DIR_ENV_VAR = "MIRASCOPE_MEDIA_CACHE_DIR"
+
+_REMOTE_PREFIXES = ("http://", "https://")
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class MediaCache:
+    """A loader for image, audio and document sources with a content-addressed cache.
+
+    Remote (`http://` and `https://`) sources are downloaded once and then served from
+    memory, so the same URL is not fetched again when the prompt is parsed and again
+    when each provider converts its messages. Downloads are stored by the SHA-256 of
+    their content, so identical media served from different URLs is only kept once.
+    Local files and `data:` URLs are always read directly since they are cheap to load.
+
+    Downloads reuse pooled connections when `httpx` is installed and fall back to
+    `urllib` otherwise. The in-memory cache is a least-recently-used cache bounded by
+    `max_memory_bytes`. Setting `cache_dir` (or the `MIRASCOPE_MEDIA_CACHE_DIR`
+    environment variable) additionally persists downloads to disk, bounded by
+    `max_disk_bytes`, so they are shared across processes and restarts.
+
+    Example:
+
+    ```python
+    from mirascope.core.base import media_cache
+
+    media_cache.configure(cache_dir="~/.cache/mirascope/media")
+    images = media_cache.load_many(
+        ["https://example.com/a.png", "https://example.com/b.png"]
+    )
+    ```
+    """
+
+    def __init__(
+        self,
+        *,
+        max_memory_bytes: int = 64 * 1024 * 1024,
+        cache_dir: str | Path | None = None,
+        max_disk_bytes: int = 512 * 1024 * 1024,
+        max_workers: int = 8,
+        timeout: float = 30,
+    ) -> None:
+        """Initializes an instance of `MediaCache`.
+
+        Args:
+            max_memory_bytes: The maximum total size of the media kept in memory.
+            cache_dir: The directory in which to persist downloads. Defaults to the
+                `MIRASCOPE_MEDIA_CACHE_DIR` environment variable if set.
+            max_disk_bytes: The maximum total size of the media persisted to disk.
+            max_workers: The maximum number of concurrent downloads in `load_many`.
+            timeout: The timeout in seconds for a single download.
+        """
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.cache_dir: Path | None = None
+        self._blobs: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_bytes = 0
+        self._sources: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._pool: ThreadPoolExecutor | None = None
+        self._client: httpx.Client | None = None
+        self._async_clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, httpx.AsyncClient
+        ] = weakref.WeakKeyDictionary()
+        self.configure(cache_dir=cache_dir or os.environ.get(MEDIA_CACHE_DIR_ENV_VAR))
+
+    def configure(
+        self,
+        *,
+        max_memory_bytes: int | None = None,
+        cache_dir: str | Path | None = None,
+        max_disk_bytes: int | None = None,
+    ) -> None:
+        """Updates the limits and disk location of the cache.
+
+        Args:
+            max_memory_bytes: The maximum total size of the media kept in memory.
+            cache_dir: The directory in which to persist downloads.
+            max_disk_bytes: The maximum total size of the media persisted to disk.
+        """
+        with self._lock:
+            if max_memory_bytes is not None:
+                self.max_memory_bytes = max_memory_bytes
+                self._evict_memory()
+            if max_disk_bytes is not None:
+                self.max_disk_bytes = max_disk_bytes
+            if cache_dir is not None:
+                self.cache_dir = Path(cache_dir).expanduser()
+                (self.cache_dir / "sources").mkdir(parents=True, exist_ok=True)
+        if max_disk_bytes is not None:
+            self._evict_disk()
+
+    def clear(self) -> None:
+        """Clears the in-memory cache. Media persisted to disk is kept."""
+        with self._lock:
+            self._blobs.clear()
+            self._sources.clear()
+            self._memory_bytes = 0
+
+    def _evict_memory(self) -> None:
+        while self._memory_bytes > self.max_memory_bytes and self._blobs:
+            _, data = self._blobs.popitem(last=False)
+            self._memory_bytes -= len(data)
+
+    def _evict_disk(self) -> None:
+        if self.cache_dir is None:
+            return
+        # In-flight writes are `.tmp` files, which are replaced once they're written
+        blobs: list[tuple[os.stat_result, Path]] = []
+        for path in self.cache_dir.iterdir():
+            with suppress(FileNotFoundError):
+                if path.suffix != ".tmp" and path.is_file():
+                    blobs.append((path.stat(), path))
+        blobs.sort(key=lambda blob: blob[0].st_mtime)
+        total = sum(stat.st_size for stat, _ in blobs)
+        evicted = 0
+        while evicted < len(blobs) and total > self.max_disk_bytes:
+            stat, path = blobs[evicted]
+            total -= stat.st_size
+            path.unlink(missing_ok=True)
+            evicted += 1
+        if not evicted:
+            return
+        # Loading a blob touches its source too, so the sources of evicted blobs are
+        # older than every remaining blob
+        oldest = blobs[evicted][0].st_mtime if evicted < len(blobs) else float("inf")
+        for path in (self.cache_dir / "sources").iterdir():
+            with suppress(FileNotFoundError):
+                if path.suffix != ".tmp" and path.stat().st_mtime < oldest:
+                    path.unlink()
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        # A unique temporary file per write, so concurrent writers never collide
+        fd, tmp_path = tempfile.mkstemp(
+            dir=path.parent, prefix=f"{path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            with suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+
+    def _source_path(self, source: str) -> Path:
+        assert self.cache_dir is not None
+        return self.cache_dir / "sources" / _digest(source.encode())
+
+    def _get(self, source: str) -> bytes | None:
+        with self._lock:
+            digest = self._sources.get(source)
+            if digest is not None and (data := self._blobs.get(digest)) is not None:
+                self._blobs.move_to_end(digest)
+                return data
+        if self.cache_dir is None:
+            return None
+        try:
+            source_path = self._source_path(source)
+            digest = source_path.read_text()
+            blob_path = self.cache_dir / digest
+            data = blob_path.read_bytes()
+            os.utime(blob_path)
+            os.utime(source_path)
+        except OSError:
+            return None
+        self._put_memory(source, digest, data)
+        return data
+
+    def _put_memory(self, source: str, digest: str, data: bytes) -> None:
+        if len(data) > self.max_memory_bytes:
+            return
+        with self._lock:
+            self._sources[source] = digest
+            if digest in self._blobs:
+                self._blobs.move_to_end(digest)
+                return
+            self._blobs[digest] = data
+            self._memory_bytes += len(data)
+            self._evict_memory()
+
+    def _put(self, source: str, data: bytes) -> None:
+        digest = _digest(data)
+        self._put_memory(source, digest, data)
+        if self.cache_dir is None or len(data) > self.max_disk_bytes:
+            return
+        blob_path = self.cache_dir / digest
+        try:
+            os.utime(blob_path)
+        except FileNotFoundError:
+            self._write_atomic(blob_path, data)
+        self._write_atomic(self._source_path(source), digest.encode())
+        self._evict_disk()
+
+    def _get_client(self) -> httpx.Client:
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(follow_redirects=True, timeout=self.timeout)
+            return self._client
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if (client := self._async_clients.get(loop)) is None:
+                client = self._async_clients[loop] = httpx.AsyncClient(
+                    follow_redirects=True, timeout=self.timeout
+                )
+            return client
+
+    def _fetch(self, source: str) -> bytes:
+        if httpx is not None and source.startswith(_REMOTE_PREFIXES):
+            response = self._get_client().get(source)
+            response.raise_for_status()
+            return response.content
+        with urllib.request.urlopen(source, timeout=self.timeout) as response:
+            return response.read()
+
+    @staticmethod
+    def _read_local(source: str | bytes | bytearray | memoryview) -> bytes | None:
+        if isinstance(source, bytes | bytearray | memoryview):
+            return bytes(source)
+        if source.startswith(_REMOTE_PREFIXES):
+            return None
+        if source.startswith(("data:", "file://")):
+            with urllib.request.urlopen(source) as response:
+                return response.read()
+        with open(source, "rb") as f:
+            return f.read()
+
+    def load(self, source: str | bytes) -> bytes:
+        """Returns the content of the given media source.
+
+        Args:
+            source: The raw bytes, a local file path, or a `data:`, `file://`, `http://`
+                or `https://` URL.
+        """
+        if (data := self._read_local(source)) is not None:
+            return data
+        assert isinstance(source, str)
+        if (data := self._get(source)) is None:
+            data = self._fetch(source)
+            self._put(source, data)
+        return data
+
+    async def load_async(self, source: str | bytes) -> bytes:
+        """Returns the content of the given media source without blocking the loop.
+
+        Args:
+            source: The raw bytes, a local file path, or a `data:`, `file://`, `http://`
+                or `https://` URL.
+        """
+        if not isinstance(source, str) or not source.startswith(_REMOTE_PREFIXES):
+            return await asyncio.to_thread(self.load, source)
+        if (data := self._get(source)) is not None:
+            return data
+        if httpx is None:  # pragma: no cover
+            return await asyncio.to_thread(self.load, source)
+        response = await self._get_async_client().get(source)
+        response.raise_for_status()
+        data = response.content
+        self._put(source, data)
+        return data
+
+    def load_many(self, sources: Iterable[str | bytes]) -> list[bytes]:
+        """Returns the contents of the given media sources, downloading concurrently.
+
+        Args:
+            sources: The media sources to load, in order.
+        """
+        sources = list(sources)
+        loaded: dict[str, bytes] = {}
+        missing: list[str] = []
+        for source in dict.fromkeys(s for s in sources if isinstance(s, str)):
+            if source.startswith(_REMOTE_PREFIXES):
+                if (data := self._get(source)) is None:
+                    missing.append(source)
+                else:
+                    loaded[source] = data
+        if len(missing) > 1:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        self.max_workers, thread_name_prefix="mirascope-media"
+                    )
+                pool = self._pool
+            # Kept from the pool rather than reloaded, as media too large for the
+            # memory cache would otherwise be downloaded twice
+            loaded.update(zip(missing, pool.map(self.load, missing), strict=True))
+        return [
+            loaded[source]
+            if isinstance(source, str) and source in loaded
+            else self.load(source)
+            for source in sources
+        ]
+
+    async def load_many_async(self, sources: Iterable[str | bytes]) -> list[bytes]:
+        """Returns the contents of the given media sources, downloading concurrently.
+
+        Args:
+            sources: The media sources to load, in order.
+        """
+        return list(await asyncio.gather(*(self.load_async(s) for s in sources)))
+
+
+media_cache = MediaCache()
+"""The shared media cache used to load media sources in prompts and messages."""
@@ -0,0 +1,157 @@
+"""This module defines the shared pricing registry used for cost calculation.
+
+usage docs: learn/calls.md#handling-responses
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import threading
+from collections.abc import Collection, Mapping
+from pathlib import Path
+
+PRICING_FILE_ENV_VAR = "MIRASCOPE_PRICING_FILE"
+
+ModelPricing = Mapping[str, float]
+"""The prices of a model keyed by price type (e.g. `"prompt"` or `"completion"`)."""
+
+# The suffixes of dated or versioned variants of a model, e.g. `-2024-08-06`, `-0613`,
+# `-20241022-v1:0`, `@20240620`, or `-latest`
+_MODEL_VERSION_SUFFIX = re.compile(
+    r"(-\d{4}-\d{2}-\d{2}|-\d{3,}|@\d+|[-@]latest|-v\d+(:\d+)?)+"
+)
+
+
+class PricingRegistry:
+    """A registry of model pricing used by each provider's `calculate_cost`.
+
+    Each provider registers its pricing table once on import. Model lookups first try
+    an exact match and then fall back to the longest registered model name of which the
+    requested model is a dated or versioned variant (e.g. `gpt-4o-2099-01-01` resolves
+    to `gpt-4o`, but `gpt-4o-mini-tts` doesn't resolve to `gpt-4o-mini`). The result of
+    each lookup is cached, so the prefix search only happens once per model.
+
+    Pricing can be overridden from a local JSON file of the form
+    `{"<provider>": {"<model>": {"prompt": 0.000_002_5, ...}}}`, either by calling
+    `load_file` or by setting the `MIRASCOPE_PRICING_FILE` environment variable.
+
+    Example:
+
+    ```python
+    from mirascope.core.base import pricing_registry
+
+    pricing_registry.register(
+        "openai",
+        {
+            "my-fine-tuned-model": {
+                "prompt": 0.000_003,
+                "cached": 0.000_001_5,
+                "completion": 0.000_012,
+            }
+        },
+    )
+    ```
+
+    Each provider's `calculate_cost` needs certain prices (e.g. OpenAI models need
+    `prompt`, `cached`, and `completion`), so registering a model that is missing any of
+    them raises a `ValueError`. Overrides of known models (including dated variants like
+    `gpt-4o-2099-01-01`) are merged over their current pricing and can be partial.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty instance of `PricingRegistry`."""
+        self._pricing: dict[str, dict[str, ModelPricing]] = {}
+        self._prefixes: dict[str, list[str]] = {}
+        self._lookups: dict[tuple[str, str], ModelPricing | None] = {}
+        self._required_keys: dict[str, frozenset[str]] = {}
+        self._lock = threading.Lock()
+        self._env_file_loaded = False
+
+    def register(
+        self,
+        provider: str,
+        pricing: Mapping[str, ModelPricing],
+        required_keys: Collection[str] | None = None,
+    ) -> None:
+        """Registers (or updates) pricing for the given provider's models.
+
+        The pricing of each model is merged over its existing pricing or, for a new
+        model, over the pricing of the registered model it resolves to by prefix, so
+        overrides only need the prices that change.
+
+        Args:
+            provider: The provider whose models are priced (e.g. `"openai"`).
+            pricing: The prices of each model keyed by model name.
+            required_keys: The price types the provider's `calculate_cost` needs, which
+                every model of the provider must have from then on.
+
+        Raises:
+            ValueError: If a model is missing any of the provider's required prices, in
+                which case nothing is registered.
+        """
+        with self._lock:
+            if required_keys is not None:
+                self._required_keys[provider] = frozenset(required_keys)
+            required = self._required_keys.get(provider, frozenset())
+            updates: dict[str, ModelPricing] = {}
+            for model, model_pricing in pricing.items():
+                merged = {**(self._match(provider, model) or {}), **model_pricing}
+                if missing := required - merged.keys():
+                    raise ValueError(
+                        f"Pricing for {provider} model '{model}' is missing the "
+                        f"required prices {sorted(missing)}."
+                    )
+                updates[model] = merged
+            provider_pricing = self._pricing.setdefault(provider, {})
+            provider_pricing.update(updates)
+            self._prefixes[provider] = sorted(provider_pricing, key=len, reverse=True)
+            self._lookups.clear()
+
+    def load_file(self, path: str | Path) -> None:
+        """Registers pricing overrides from a local JSON file.
+
+        Args:
+            path: The path to a JSON file mapping providers to model pricing.
+        """
+        overrides = json.loads(Path(path).read_text())
+        for provider, pricing in overrides.items():
+            self.register(provider, pricing)
+
+    def _load_env_file(self) -> None:
+        self._env_file_loaded = True
+        if path := os.environ.get(PRICING_FILE_ENV_VAR):
+            self.load_file(path)
+
+    def _match(self, provider: str, model: str) -> ModelPricing | None:
+        provider_pricing = self._pricing.get(provider, {})
+        if model in provider_pricing:
+            return provider_pricing[model]
+        for prefix in self._prefixes.get(provider, []):
+            if model.startswith(prefix) and _MODEL_VERSION_SUFFIX.fullmatch(
+                model, len(prefix)
+            ):
+                return provider_pricing[prefix]
+        return None
+
+    def lookup(self, provider: str, model: str) -> ModelPricing | None:
+        """Returns the pricing for the given model or `None` if it is unknown.
+
+        Args:
+            provider: The provider of the model.
+            model: The name of the model, which may be a dated or versioned variant of
+                a registered model name.
+        """
+        if not self._env_file_loaded:
+            self._load_env_file()
+        key = (provider, model)
+        try:
+            return self._lookups[key]
+        except KeyError:
+            model_pricing = self._lookups[key] = self._match(provider, model)
+            return model_pricing
+
+
+pricing_registry = PricingRegistry()
+"""The shared pricing registry used by all providers' `calculate_cost` functions."""
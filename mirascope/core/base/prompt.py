@@ -1,5 +1,7 @@
 """The `BasePrompt` class for better prompt engineering."""
 
+import threading
+from collections import OrderedDict
 from collections.abc import AsyncIterable, Awaitable, Callable, Iterable
 from functools import reduce, wraps
 from textwrap import dedent
@@ -39,6 +41,10 @@ _ResponseModelT = TypeVar("_ResponseModelT", bound=BaseModel | BaseType)
 
 SUPPORTED_MESSAGE_ROLES = ["system", "user", "assistant"]
 
+_DECORATED_FN_CACHE: OrderedDict[tuple, Callable] = OrderedDict()
+_DECORATED_FN_CACHE_LOCK = threading.Lock()
+_DECORATED_FN_CACHE_SIZE = 256
+
 
 class BasePrompt(BaseModel):
     """The base class for engineering prompts.
@@ -107,6 +113,50 @@ class BasePrompt(BaseModel):
             "inputs": self.model_dump(),
         }
 
+    def _decorated_fn(
+        self,
+        call_decorator: Callable[[Callable], Callable],
+        additional_decorators: tuple[Callable, ...],
+        is_async: bool,
+    ) -> Callable:
+        """Returns a function with the prompt's fields as arguments, fully decorated.
+
+        Generating and decorating the function is expensive, so the result is cached
+        per prompt class and decorators unless the prompt has dynamic metadata.
+        """
+        dynamic_config = self.dynamic_config()
+        template = get_prompt_template(self)
+        key = (type(self), is_async, template, call_decorator, *additional_decorators)
+        cacheable = not (dynamic_config and "metadata" in dynamic_config)
+        if cacheable:
+            try:
+                with _DECORATED_FN_CACHE_LOCK:
+                    if (decorated_fn := _DECORATED_FN_CACHE.get(key)) is not None:
+                        _DECORATED_FN_CACHE.move_to_end(key)
+                        return decorated_fn
+            except TypeError:  # unhashable decorators
+                cacheable = False
+
+        args_str = ", ".join(self.model_fields)
+        namespace, fn_name = {}, self.__class__.__name__
+        exec(f"{'async ' if is_async else ''}def {fn_name}({args_str}): ...", namespace)
+        decorated_fn = reduce(
+            lambda res, f: f(res),
+            [
+                metadata(get_metadata(self, dynamic_config)),
+                prompt_template(template),
+                call_decorator,
+                *additional_decorators,
+            ],
+            namespace[fn_name],
+        )
+        if cacheable:
+            with _DECORATED_FN_CACHE_LOCK:
+                _DECORATED_FN_CACHE[key] = decorated_fn
+                if len(_DECORATED_FN_CACHE) > _DECORATED_FN_CACHE_SIZE:
+                    _DECORATED_FN_CACHE.popitem(last=False)
+        return decorated_fn
+
     @overload
     def run(
         self,
@@ -185,18 +235,10 @@ class BasePrompt(BaseModel):
         ```
         """
         kwargs = {field: getattr(self, field) for field in self.model_fields}
-        args_str = ", ".join(kwargs.keys())
-        namespace, fn_name = {}, self.__class__.__name__
-        exec(f"def {fn_name}({args_str}): ...", namespace)
-        return reduce(
-            lambda res, f: f(res),  # pyright: ignore [reportArgumentType, reportCallIssue]
-            [
-                metadata(get_metadata(self, self.dynamic_config())),
-                prompt_template(get_prompt_template(self)),
-                call_decorator,
-                *additional_decorators,
-            ],
-            namespace[fn_name],
+        return self._decorated_fn(
+            call_decorator,  # pyright: ignore [reportArgumentType]
+            additional_decorators,
+            is_async=False,
         )(**kwargs)
 
     @overload
@@ -289,18 +331,10 @@ class BasePrompt(BaseModel):
         ```
         """
         kwargs = {field: getattr(self, field) for field in self.model_fields}
-        args_str = ", ".join(kwargs.keys())
-        namespace, fn_name = {}, self.__class__.__name__
-        exec(f"async def {fn_name}({args_str}): ...", namespace)
-        return reduce(
-            lambda res, f: f(res),  # pyright: ignore [reportArgumentType, reportCallIssue]
-            [
-                metadata(get_metadata(self, self.dynamic_config())),
-                prompt_template(get_prompt_template(self)),
-                call_decorator,
-                *additional_decorators,
-            ],
-            namespace[fn_name],
+        return self._decorated_fn(
+            call_decorator,  # pyright: ignore [reportArgumentType]
+            additional_decorators,
+            is_async=True,
         )(**kwargs)
 
 
@@ -1,9 +1,10 @@
 """This module contains the base classes for streaming responses from LLMs."""
 
+import asyncio
 import datetime
 from abc import ABC, abstractmethod
 from collections.abc import AsyncGenerator, Awaitable, Callable, Coroutine, Generator
-from functools import wraps
+from functools import partial, wraps
 from typing import (
     Any,
     ClassVar,
@@ -25,6 +26,7 @@ from ._utils import (
     get_metadata,
     get_possible_user_message_param,
     is_prompt_template,
+    requires_media_loading,
 )
 from .call_kwargs import BaseCallKwargs
 from .call_params import BaseCallParams
@@ -35,6 +37,7 @@ from .messages import Messages
 from .metadata import Metadata
 from .prompt import prompt_template
 from .tool import BaseTool
+from .usage_tracker import usage_tracker
 
 _BaseCallResponseT = TypeVar("_BaseCallResponseT", bound=BaseCallResponse)
 _BaseCallResponseChunkT = TypeVar(
@@ -100,6 +103,7 @@ class BaseStream(
     end_time: float = 0
 
     _provider: ClassVar[str] = "NO PROVIDER"
+    _cost_cache: tuple[tuple[Any, ...], float | None] | None = None
 
     def __init__(
         self,
@@ -216,6 +220,19 @@ class BaseStream(
         """Returns the cost of the stream."""
         ...
 
+    def _cached_cost(
+        self,
+        calculate_cost: Callable[
+            [int | float | None, int | float | None, int | float | None, str],
+            float | None,
+        ],
+    ) -> float | None:
+        """Returns the cost of the usage so far, only recalculating it when it changes."""
+        key = (self.input_tokens, self.cached_tokens, self.output_tokens, self.model)
+        if self._cost_cache is None or self._cost_cache[0] != key:
+            self._cost_cache = (key, calculate_cost(*key))
+        return self._cost_cache[1]
+
     @abstractmethod
     def _construct_message_param(
         self, tool_calls: list[Any] | None = None, content: str | None = None
@@ -250,6 +267,17 @@ _AsyncResponseChunkT = TypeVar("_AsyncResponseChunkT")
 _P = ParamSpec("_P")
 
 
+def _record_stream_error(fn_name: str, TStream: type[BaseStream], model: str) -> None:
+    if usage_tracker.enabled:
+        usage_tracker.record(fn_name, TStream._provider, model, error=True)
+
+
+def _record_stream_usage(fn_name: str, stream: BaseStream, start_time: float) -> None:
+    if usage_tracker.enabled:
+        end_time = datetime.datetime.now().timestamp() * 1000
+        usage_tracker.record_call(fn_name, stream, end_time - start_time)
+
+
 def stream_factory(  # noqa: ANN201
     *,
     TCallResponse: type[_BaseCallResponseT],
@@ -367,9 +395,10 @@ def stream_factory(  # noqa: ANN201
                 nonlocal client
                 if dynamic_config is not None:
                     client = dynamic_config.get("client", None) or client
-                create, prompt_template, messages, tool_types, call_kwargs = setup_call(  # pyright: ignore [reportCallIssue]
+                setup = partial(
+                    setup_call,
                     model=model,
-                    client=client,  # pyright: ignore [reportArgumentType]
+                    client=client,
                     fn=fn,
                     fn_args=fn_args,
                     dynamic_config=dynamic_config,
@@ -379,18 +408,30 @@ def stream_factory(  # noqa: ANN201
                     response_model=None,
                     stream=True,
                 )
+                # Loading media can block, so we set up such calls off the event loop
+                create, prompt_template, messages, tool_types, call_kwargs = (
+                    await asyncio.to_thread(setup)
+                    if requires_media_loading(fn, dynamic_config)
+                    else setup()
+                )
 
                 async def generator() -> AsyncGenerator[
                     tuple[_BaseCallResponseChunkT, _BaseToolT | None], None
                 ]:
-                    async for chunk, tool in handle_stream_async(
-                        await create(stream=True, **call_kwargs),
-                        tool_types,
-                        partial_tools=partial_tools,
-                    ):
-                        yield chunk, tool
-
-                return TStream(
+                    start_time = datetime.datetime.now().timestamp() * 1000
+                    try:
+                        async for chunk, tool in handle_stream_async(
+                            await create(stream=True, **call_kwargs),
+                            tool_types,
+                            partial_tools=partial_tools,
+                        ):
+                            yield chunk, tool
+                    except Exception:
+                        _record_stream_error(fn.__name__, TStream, model)
+                        raise
+                    _record_stream_usage(fn.__name__, stream, start_time)
+
+                stream = TStream(
                     stream=generator(),
                     metadata=get_metadata(fn, dynamic_config),
                     tool_types=tool_types,  # pyright: ignore [reportArgumentType]
@@ -403,6 +444,7 @@ def stream_factory(  # noqa: ANN201
                     call_params=call_params,
                     call_kwargs=call_kwargs,
                 )
+                return stream
 
             return inner_async
         else:
@@ -432,13 +474,19 @@ def stream_factory(  # noqa: ANN201
                     None,
                     None,
                 ]:
-                    yield from handle_stream(
-                        create(stream=True, **call_kwargs),
-                        tool_types,
-                        partial_tools=partial_tools,
-                    )
-
-                return TStream(
+                    start_time = datetime.datetime.now().timestamp() * 1000
+                    try:
+                        yield from handle_stream(
+                            create(stream=True, **call_kwargs),
+                            tool_types,
+                            partial_tools=partial_tools,
+                        )
+                    except Exception:
+                        _record_stream_error(fn.__name__, TStream, model)
+                        raise
+                    _record_stream_usage(fn.__name__, stream, start_time)
+
+                stream = TStream(
                     stream=generator(),
                     metadata=get_metadata(fn, dynamic_config),
                     tool_types=tool_types,  # pyright: ignore [reportArgumentType]
@@ -451,6 +499,7 @@ def stream_factory(  # noqa: ANN201
                     call_params=call_params,
                     call_kwargs=call_kwargs,
                 )
+                return stream
 
             return inner
 
@@ -176,7 +176,8 @@ class BaseTool(BaseModel, ABC):
     ) -> dict[str, Any]:
         """Returns the generated JSON schema for the class."""
         cls.warn_for_unsupported_configurations()
-        return super().model_json_schema(
+        return _utils.get_model_json_schema(
+            cls,
             by_alias=by_alias,
             ref_template=ref_template,
             schema_generator=schema_generator,
@@ -0,0 +1,362 @@
+"""This module defines the `ToolExecutor` for running tool calls off the caller's thread.
+
+usage docs: learn/tools.md
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import signal
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from contextlib import contextmanager
+from functools import partial
+from types import TracebackType
+from typing import Any, Literal
+
+from typing_extensions import TypedDict
+
+from ._utils import fn_is_async
+from .tool import BaseTool
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
+
+ExecutorType = Literal["inline", "thread", "process"]
+
+
+class ToolExecutionConfig(TypedDict, total=False):
+    """Configuration options for executing a tool.
+
+    Attributes:
+        executor: Where to run the tool's `call` method. `"inline"` runs it in the
+            caller's thread (or event loop), `"thread"` runs it in a shared thread pool,
+            and `"process"` runs it in a shared process pool.
+        timeout: The wall-clock timeout in seconds for a single tool call.
+        max_memory: The address space cap in bytes for a single tool call. Only
+            supported by the `"process"` executor.
+    """
+
+    executor: ExecutorType
+    timeout: float
+    max_memory: int
+
+
+def _timeout_error(tool_name: str, timeout: float | None) -> TimeoutError:
+    return TimeoutError(f"Tool {tool_name} exceeded its timeout of {timeout} seconds.")
+
+
+def _raise_timeout(signum: int, frame: Any) -> None:  # noqa: ANN401
+    raise TimeoutError("Tool call exceeded its timeout in the worker process.")
+
+
+@contextmanager
+def _alarm(timeout: float | None) -> Iterator[None]:
+    """Interrupts the current worker process if the call exceeds `timeout` seconds."""
+    if (
+        timeout is None
+        or not hasattr(signal, "setitimer")
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        yield
+        return
+    previous_handler = signal.signal(signal.SIGALRM, _raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+
+@contextmanager
+def _memory_limit(max_memory: int | None) -> Iterator[None]:
+    """Caps the address space of the current worker process for the call."""
+    if max_memory is None or resource is None:
+        yield
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        max_memory = min(max_memory, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (max_memory, hard))
+    try:
+        yield
+    finally:
+        resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+
+
+def _run_in_worker(
+    fn: Callable[..., Any],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    timeout: float | None,
+    max_memory: int | None,
+) -> Any:  # noqa: ANN401
+    """Runs `fn` inside a process pool worker, enforcing the configured limits."""
+    with _memory_limit(max_memory), _alarm(timeout):
+        result = fn(*args, **kwargs)
+        if inspect.iscoroutine(result):
+            result = asyncio.run(result)
+    return result
+
+
+def _call_tool(tool: BaseTool, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+    return tool.call(*args, **kwargs)
+
+
+def _process_payload(
+    tool: BaseTool, args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> tuple[Callable[..., Any], tuple[Any, ...], dict[str, Any]]:
+    """Returns the picklable callable and arguments for running `tool` in a process.
+
+    Tools converted from functions are dynamically created classes that cannot be
+    pickled, so we send the original (module-level) function and its arguments instead.
+    All other tools are pickled as-is and called in the worker.
+    """
+    fn = getattr(type(tool), "__tool_fn__", None)
+    if fn is None:
+        return _call_tool, (tool, *args), kwargs
+    fn_kwargs = {
+        str(field_info.alias or field_name): getattr(tool, field_name)
+        for field_name, field_info in tool.model_fields.items()
+        if field_name not in {"tool_call", "delta"}
+    }
+    return fn, (), fn_kwargs
+
+
+def _check_arguments(
+    tool: BaseTool, args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> None:
+    """Rejects extra arguments for function tools, whose `call` takes none.
+
+    Checking up front keeps every executor consistent, since the process executor
+    calls the original function directly rather than the tool's `call` method.
+    """
+    if (args or kwargs) and hasattr(type(tool), "__tool_fn__"):
+        raise ValueError(
+            f"Tool {tool._name()} was converted from a function and does not accept "
+            "additional arguments. Set them as the tool's arguments instead."
+        )
+
+
+class ToolExecutor:
+    """Runs tool calls inline, in a thread pool, or in a process pool.
+
+    CPU-bound tools (e.g. parsing or numeric work) block the event loop when called
+    inline and hold the GIL against other concurrent calls when run in threads. The
+    `"process"` executor runs such tools in a shared process pool instead. Tools run in
+    a process must be picklable, which means function tools must be defined at the
+    module level.
+
+    Timeouts are enforced for every executor except inline synchronous tools. Note that
+    a thread that times out cannot be interrupted and will finish in the background,
+    whereas process workers are interrupted once their timeout elapses.
+
+    Example:
+
+    ```python
+    from mirascope.core import ToolExecutor, openai
+
+
+    def count_primes(limit: int) -> int:
+        return sum(all(n % d for d in range(2, n)) for n in range(2, limit))
+
+
+    executor = ToolExecutor(
+        "thread", tool_configs={"count_primes": {"executor": "process", "timeout": 5}}
+    )
+
+
+    @openai.call("gpt-4o-mini", tools=[count_primes])
+    def answer(question: str) -> str:
+        return question
+
+
+    response = answer("How many primes are there below 100000?")
+    if tool := response.tool:
+        print(executor.call(tool))
+    ```
+    """
+
+    def __init__(
+        self,
+        executor: ExecutorType = "inline",
+        *,
+        timeout: float | None = None,
+        max_memory: int | None = None,
+        max_workers: int | None = None,
+        tool_configs: dict[str, ToolExecutionConfig] | None = None,
+    ) -> None:
+        """Initializes an instance of `ToolExecutor`.
+
+        Args:
+            executor: The default executor for tools without a specific configuration.
+            timeout: The default wall-clock timeout in seconds for a tool call.
+            max_memory: The default memory cap in bytes for a tool call.
+            max_workers: The maximum number of workers in each pool.
+            tool_configs: Configurations keyed by tool name that override the defaults.
+        """
+        self.default_config = ToolExecutionConfig(executor=executor)
+        if timeout is not None:
+            self.default_config["timeout"] = timeout
+        if max_memory is not None:
+            self.default_config["max_memory"] = max_memory
+        self.max_workers = max_workers
+        self.tool_configs: dict[str, ToolExecutionConfig] = dict(tool_configs or {})
+        self._thread_pool: ThreadPoolExecutor | None = None
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        for config in [self.default_config, *self.tool_configs.values()]:
+            self._validate_config(config)
+
+    @staticmethod
+    def _validate_config(config: ToolExecutionConfig) -> None:
+        if config.get("max_memory") is not None and config.get("executor") not in (
+            None,
+            "process",
+        ):
+            raise ValueError(
+                "`max_memory` is only supported by the `process` executor since "
+                "memory can only be capped per process."
+            )
+
+    def configure(self, tool_name: str, **config: Any) -> None:  # noqa: ANN401
+        """Sets the execution configuration for the tool with the given name.
+
+        Args:
+            tool_name: The name of the tool (i.e. `tool._name()`) to configure.
+            **config: The `ToolExecutionConfig` options for the tool.
+        """
+        tool_config = ToolExecutionConfig(**config)
+        self._validate_config(self.default_config | tool_config)
+        self.tool_configs[tool_name] = tool_config
+
+    def config_for(self, tool: BaseTool) -> ToolExecutionConfig:
+        """Returns the resolved execution configuration for the given tool."""
+        config = self.default_config | self.tool_configs.get(tool._name(), {})
+        self._validate_config(config)
+        return config
+
+    def _get_pool(self, executor: ExecutorType) -> Executor:
+        with self._lock:
+            if executor == "thread":
+                if self._thread_pool is None:
+                    self._thread_pool = ThreadPoolExecutor(
+                        self.max_workers, thread_name_prefix="mirascope-tool"
+                    )
+                return self._thread_pool
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(self.max_workers)
+            return self._process_pool
+
+    def call(self, tool: BaseTool, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        """Calls the given tool synchronously according to its configuration.
+
+        Args:
+            tool: The tool to call.
+            *args: Additional positional arguments for the tool's `call` method.
+            **kwargs: Additional keyword arguments for the tool's `call` method.
+
+        Returns:
+            The output of the tool's `call` method.
+
+        Raises:
+            ValueError: If the tool is async and not configured to run in a process, or
+                if it was converted from a function and given additional arguments.
+            TimeoutError: If the tool call exceeds its configured timeout.
+        """
+        _check_arguments(tool, args, kwargs)
+        config = self.config_for(tool)
+        executor, timeout = config.get("executor", "inline"), config.get("timeout")
+        if fn_is_async(tool.call) and executor != "process":
+            raise ValueError(
+                f"Tool {tool._name()} is async. Use `call_async` to call it with the "
+                f"`{executor}` executor."
+            )
+        if executor == "inline":
+            return tool.call(*args, **kwargs)
+        if executor == "thread":
+            future = self._get_pool("thread").submit(tool.call, *args, **kwargs)
+        else:
+            future = self._get_pool("process").submit(
+                _run_in_worker,
+                *_process_payload(tool, args, kwargs),
+                timeout,
+                config.get("max_memory"),
+            )
+        try:
+            return future.result(timeout=timeout)
+        except FuturesTimeoutError as e:
+            future.cancel()
+            raise _timeout_error(tool._name(), timeout) from e
+
+    async def call_async(self, tool: BaseTool, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        """Calls the given tool without blocking the running event loop.
+
+        Async tools configured for the `"inline"` or `"thread"` executors are awaited
+        directly on the running event loop since they do not block it.
+
+        Args:
+            tool: The tool to call.
+            *args: Additional positional arguments for the tool's `call` method.
+            **kwargs: Additional keyword arguments for the tool's `call` method.
+
+        Returns:
+            The output of the tool's `call` method.
+
+        Raises:
+            ValueError: If the tool was converted from a function and given additional
+                arguments.
+            TimeoutError: If the tool call exceeds its configured timeout.
+        """
+        _check_arguments(tool, args, kwargs)
+        config = self.config_for(tool)
+        executor, timeout = config.get("executor", "inline"), config.get("timeout")
+        if executor == "inline" and not fn_is_async(tool.call):
+            return tool.call(*args, **kwargs)
+        if fn_is_async(tool.call) and executor != "process":
+            awaitable = tool.call(*args, **kwargs)
+        elif executor == "thread":
+            awaitable = asyncio.get_running_loop().run_in_executor(
+                self._get_pool("thread"), partial(tool.call, *args, **kwargs)
+            )
+        else:
+            awaitable = asyncio.get_running_loop().run_in_executor(
+                self._get_pool("process"),
+                _run_in_worker,
+                *_process_payload(tool, args, kwargs),
+                timeout,
+                config.get("max_memory"),
+            )
+        try:
+            return await asyncio.wait_for(awaitable, timeout)
+        except asyncio.TimeoutError as e:
+            raise _timeout_error(tool._name(), timeout) from e
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shuts down any pools started by this executor.
+
+        Args:
+            wait: Whether to wait for pending tool calls to finish.
+        """
+        with self._lock:
+            for pool in (self._thread_pool, self._process_pool):
+                if pool is not None:
+                    pool.shutdown(wait=wait, cancel_futures=not wait)
+            self._thread_pool, self._process_pool = None, None
+
+    def __enter__(self) -> ToolExecutor:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.shutdown()
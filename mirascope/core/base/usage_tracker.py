@@ -0,0 +1,259 @@
+"""This module defines the in-process usage and cost aggregation for LLM calls.
+
+usage docs: learn/calls.md#handling-responses
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, NamedTuple
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from .call_response import BaseCallResponse
+    from .stream import BaseStream
+
+_CALLS, _ERRORS, _INPUT, _CACHED, _OUTPUT, _COST, _LATENCY = range(7)
+
+
+class UsageKey(NamedTuple):
+    """The key under which usage is aggregated."""
+
+    fn_name: str
+    provider: str
+    model: str
+
+
+class UsageStats(BaseModel):
+    """The aggregated usage for a single `UsageKey`."""
+
+    calls: int = 0
+    """Number of completed calls (including streams)."""
+
+    errors: int = 0
+    """Number of calls that raised an error."""
+
+    input_tokens: int | float = 0
+    """Total number of input tokens."""
+
+    cached_tokens: int | float = 0
+    """Total number of cached input tokens."""
+
+    output_tokens: int | float = 0
+    """Total number of output tokens."""
+
+    cost: float = 0
+    """Total cost in dollars of the calls with a known cost."""
+
+    latency_ms: float = 0
+    """Total latency in milliseconds of the completed calls."""
+
+
+class _Shard:
+    """A set of counters owned by a single thread (or by none, once retired)."""
+
+    __slots__ = ("counters", "lock", "thread")
+
+    def __init__(self, thread: threading.Thread | None = None) -> None:
+        self.lock = threading.Lock()
+        self.counters: dict[UsageKey, list[int | float]] = {}
+        self.thread = thread
+
+
+def _add_counters(
+    totals: dict[UsageKey, list[int | float]],
+    counters: dict[UsageKey, list[int | float]],
+) -> None:
+    for key, values in counters.items():
+        if (total := totals.get(key)) is None:
+            totals[key] = list(values)
+        else:
+            for i, value in enumerate(values):
+                total[i] += value
+
+
+class UsageTracker:
+    """An accumulator of token usage, cost, latency and errors for LLM calls.
+
+    Usage is recorded per decorated function, provider and model as each response or
+    stream completes. Every thread records into its own shard of counters, so recording
+    never contends on a global lock. Since recording never awaits, it is also safe to use
+    from any number of concurrent asyncio tasks. The shards of threads that exited are
+    folded into a single retired shard, so thread churn doesn't grow the shards.
+
+    Tracking is disabled by default. Once enabled, exporters can periodically call
+    `snapshot(reset=True)` to collect and clear the aggregated usage.
+
+    Example:
+
+    ```python
+    from mirascope.core import openai
+    from mirascope.core.base import usage_tracker
+
+    usage_tracker.enable()
+
+
+    @openai.call("gpt-4o-mini")
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+
+    recommend_book("fantasy")
+    for key, stats in usage_tracker.snapshot(reset=True).items():
+        print(key.fn_name, key.model, stats.output_tokens, stats.cost)
+    ```
+    """
+
+    def __init__(self) -> None:
+        """Initializes a disabled instance of `UsageTracker`."""
+        self.enabled = False
+        self._local = threading.local()
+        self._retired = _Shard()
+        self._shards: list[_Shard] = [self._retired]
+        self._shards_lock = threading.Lock()
+
+    def enable(self) -> None:
+        """Starts recording usage."""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stops recording usage. Already recorded usage is kept."""
+        self.enabled = False
+
+    def _shard(self) -> _Shard:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = _Shard(threading.current_thread())
+            with self._shards_lock:
+                self._retire_shards()
+                self._shards.append(shard)
+            return shard
+
+    def _retire_shards(self) -> None:
+        """Folds the shards of threads that exited into the retired shard.
+
+        A thread that exited never records again, so its counters can be moved without
+        losing usage. Must be called with `_shards_lock` held.
+        """
+        shards: list[_Shard] = []
+        for shard in self._shards:
+            if shard.thread is None or shard.thread.is_alive():
+                shards.append(shard)
+                continue
+            with shard.lock, self._retired.lock:
+                _add_counters(self._retired.counters, shard.counters)
+        self._shards = shards
+
+    def record(
+        self,
+        fn_name: str,
+        provider: str,
+        model: str,
+        *,
+        input_tokens: int | float | None = None,
+        cached_tokens: int | float | None = None,
+        output_tokens: int | float | None = None,
+        cost: float | None = None,
+        latency_ms: float | None = None,
+        error: bool = False,
+    ) -> None:
+        """Records the usage of a single completed call.
+
+        Args:
+            fn_name: The name of the decorated function.
+            provider: The provider of the call.
+            model: The model of the call.
+            input_tokens: The number of input tokens.
+            cached_tokens: The number of cached input tokens.
+            output_tokens: The number of output tokens.
+            cost: The cost of the call in dollars.
+            latency_ms: The latency of the call in milliseconds.
+            error: Whether the call raised an error.
+        """
+        shard = self._shard()
+        key = UsageKey(fn_name, provider, model)
+        with shard.lock:
+            counters = shard.counters.get(key)
+            if counters is None:
+                counters = shard.counters[key] = [0, 0, 0, 0, 0, 0.0, 0.0]
+            if error:
+                counters[_ERRORS] += 1
+                return
+            counters[_CALLS] += 1
+            if input_tokens:
+                counters[_INPUT] += input_tokens
+            if cached_tokens:
+                counters[_CACHED] += cached_tokens
+            if output_tokens:
+                counters[_OUTPUT] += output_tokens
+            if cost:
+                counters[_COST] += cost
+            if latency_ms:
+                counters[_LATENCY] += latency_ms
+
+    def record_call(
+        self,
+        fn_name: str,
+        call: BaseCallResponse | BaseStream,
+        latency_ms: float | None = None,
+    ) -> None:
+        """Records the usage of a completed call response or stream.
+
+        Args:
+            fn_name: The name of the decorated function.
+            call: The completed call response or stream.
+            latency_ms: The latency of the call in milliseconds. Defaults to the time
+                between the call's `start_time` and `end_time`.
+        """
+        self.record(
+            fn_name,
+            call._provider,
+            str(call.model),
+            input_tokens=call.input_tokens,
+            cached_tokens=call.cached_tokens,
+            output_tokens=call.output_tokens,
+            cost=call.cost,
+            latency_ms=call.end_time - call.start_time
+            if latency_ms is None
+            else latency_ms,
+        )
+
+    def snapshot(self, reset: bool = False) -> dict[UsageKey, UsageStats]:
+        """Returns the usage aggregated across all threads.
+
+        Args:
+            reset: Whether to clear the recorded usage after taking the snapshot. Usage
+                recorded concurrently is never lost; it lands in either this snapshot or
+                the next one.
+        """
+        with self._shards_lock:
+            self._retire_shards()
+            shards = list(self._shards)
+        totals: dict[UsageKey, list[int | float]] = {}
+        for shard in shards:
+            with shard.lock:
+                _add_counters(totals, shard.counters)
+                if reset:
+                    shard.counters = {}
+        return {
+            key: UsageStats(
+                calls=int(values[_CALLS]),
+                errors=int(values[_ERRORS]),
+                input_tokens=values[_INPUT],
+                cached_tokens=values[_CACHED],
+                output_tokens=values[_OUTPUT],
+                cost=values[_COST],
+                latency_ms=values[_LATENCY],
+            )
+            for key, values in totals.items()
+        }
+
+    def reset(self) -> None:
+        """Clears all recorded usage."""
+        self.snapshot(reset=True)
+
+
+usage_tracker = UsageTracker()
+"""The shared usage tracker that records the usage of all decorated calls."""
@@ -4,13 +4,14 @@ from typing import cast
 
 from ...base import BaseMessageParam
 from ...base._utils import get_image_type
-from ...base._utils._parse_content_template import _load_media
+from ...base._utils._parse_content_template import _load_media, prefetch_media_urls
 from .._types import ConversationRoleType, InternalBedrockMessageParam
 
 
 def convert_message_params(
     message_params: list[BaseMessageParam | InternalBedrockMessageParam],
 ) -> list[InternalBedrockMessageParam]:
+    prefetch_media_urls(message_params, ("image_url",))
     converted_message_params = []
     for message_param in message_params:
         if not isinstance(message_param, BaseMessageParam):
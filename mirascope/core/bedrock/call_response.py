@@ -141,7 +141,7 @@ class BedrockCallResponse(
         return self.usage["outputTokens"] if self.usage else None
 
     @computed_field
-    @property
+    @cached_property
     def cost(self) -> float | None:
         """Returns the cost of the call."""
         return calculate_cost(
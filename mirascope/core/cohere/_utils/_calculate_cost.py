@@ -1,5 +1,20 @@
 """Calculate the cost of a completion using the Cohere API."""
 
+from ...base.pricing import pricing_registry
+
+_PRICING = {
+    "command-r": {
+        "prompt": 0.000_000_5,
+        "completion": 0.000_001_5,
+    },
+    "command-r-plus": {
+        "prompt": 0.000_003,
+        "completion": 0.000_015,
+    },
+}
+
+pricing_registry.register("cohere", _PRICING, required_keys=("prompt", "completion"))
+
 
 def calculate_cost(
     input_tokens: int | float | None,
@@ -15,22 +30,11 @@ def calculate_cost(
     command-r          $0.5 / 1M tokens	              $1.5 / 1M tokens
     command-r-plus     $3 / 1M tokens	              $15 / 1M tokens
     """
-    pricing = {
-        "command-r": {
-            "prompt": 0.000_000_5,
-            "completion": 0.000_001_5,
-        },
-        "command-r-plus": {
-            "prompt": 0.000_003,
-            "completion": 0.000_015,
-        },
-    }
     if input_tokens is None or output_tokens is None:
         return None
 
-    try:
-        model_pricing = pricing[model]
-    except KeyError:
+    model_pricing = pricing_registry.lookup("cohere", model)
+    if model_pricing is None:
         return None
 
     prompt_cost = input_tokens * model_pricing["prompt"]
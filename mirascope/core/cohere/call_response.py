@@ -120,7 +120,7 @@ class CohereCallResponse(
         return None
 
     @computed_field
-    @property
+    @cached_property
     def cost(self) -> float | None:
         """Returns the cost of the response."""
         return calculate_cost(
@@ -1,5 +1,45 @@
 """Calculate the cost of a Gemini API call."""
 
+from ...base.pricing import pricing_registry
+
+_PRICING = {
+    "gemini-1.5-flash": {
+        "prompt_short": 0.000_000_075,
+        "completion_short": 0.000_000_3,
+        "prompt_long": 0.000_000_15,
+        "completion_long": 0.000_000_6,
+    },
+    "gemini-1.5-flash-8b": {
+        "prompt_short": 0.000_000_037_5,
+        "completion_short": 0.000_000_15,
+        "prompt_long": 0.000_000_075,
+        "completion_long": 0.000_000_3,
+    },
+    "gemini-1.5-pro": {
+        "prompt_short": 0.000_001_25,
+        "completion_short": 0.000_005,
+        "prompt_long": 0.000_002_5,
+        "completion_long": 0.000_01,
+    },
+    "gemini-1.0-pro": {
+        "prompt_short": 0.000_000_5,
+        "completion_short": 0.000_001_5,
+        "prompt_long": 0.000_000_5,
+        "completion_long": 0.000_001_5,
+    },
+}
+
+pricing_registry.register(
+    "gemini",
+    _PRICING,
+    required_keys=(
+        "prompt_short",
+        "prompt_long",
+        "completion_short",
+        "completion_long",
+    ),
+)
+
 
 def calculate_cost(
     input_tokens: int | float | None,
@@ -17,39 +57,11 @@ def calculate_cost(
     gemini-1.5-pro        $1.25 / 1M         $5.0 / 1M          $2.5 / 1M          $10.0 / 1M
     gemini-1.0-pro        $0.50 / 1M         $1.5 / 1M          $0.5 / 1M          $1.5 / 1M
     """
-    pricing = {
-        "gemini-1.5-flash": {
-            "prompt_short": 0.000_000_075,
-            "completion_short": 0.000_000_3,
-            "prompt_long": 0.000_000_15,
-            "completion_long": 0.000_000_6,
-        },
-        "gemini-1.5-flash-8b": {
-            "prompt_short": 0.000_000_037_5,
-            "completion_short": 0.000_000_15,
-            "prompt_long": 0.000_000_075,
-            "completion_long": 0.000_000_3,
-        },
-        "gemini-1.5-pro": {
-            "prompt_short": 0.000_001_25,
-            "completion_short": 0.000_005,
-            "prompt_long": 0.000_002_5,
-            "completion_long": 0.000_01,
-        },
-        "gemini-1.0-pro": {
-            "prompt_short": 0.000_000_5,
-            "completion_short": 0.000_001_5,
-            "prompt_long": 0.000_000_5,
-            "completion_long": 0.000_001_5,
-        },
-    }
-
     if input_tokens is None or output_tokens is None:
         return None
 
-    try:
-        model_pricing = pricing[model]
-    except KeyError:
+    model_pricing = pricing_registry.lookup("gemini", model)
+    if model_pricing is None:
         return None
 
     # Determine if we're using long context pricing
@@ -8,12 +8,13 @@ from google.generativeai.types import ContentDict
 
 from ...base import BaseMessageParam
 from ...base._utils import get_audio_type
-from ...base._utils._parse_content_template import _load_media
+from ...base._utils._parse_content_template import _load_media, prefetch_media_urls
 
 
 def convert_message_params(
     message_params: list[BaseMessageParam | ContentDict],
 ) -> list[ContentDict]:
+    prefetch_media_urls(message_params)
     converted_message_params = []
     for message_param in message_params:
         if not isinstance(message_param, BaseMessageParam):
@@ -135,7 +135,7 @@ class GeminiCallResponse(
         return None
 
     @computed_field
-    @property
+    @cached_property
     def cost(self) -> float | None:
         """Returns the cost of the call."""
         return calculate_cost(
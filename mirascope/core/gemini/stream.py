@@ -69,9 +69,7 @@ class GeminiStream(
     @property
     def cost(self) -> float | None:
         """Returns the cost of the call."""
-        return calculate_cost(
-            self.input_tokens, self.cached_tokens, self.output_tokens, self.model
-        )
+        return self._cached_cost(calculate_cost)
 
     def _construct_message_param(
         self, tool_calls: list[FunctionCall] | None = None, content: str | None = None
@@ -1,5 +1,162 @@
 """Calculate the cost of a Gemini API call."""
 
+from ...base.pricing import pricing_registry
+
+_PRICING = {
+    "gemini-2.0-pro": {
+        "prompt_short": 0.000_001_25,
+        "completion_short": 0.000_005,
+        "prompt_long": 0.000_002_5,
+        "completion_long": 0.000_01,
+        "cached": 0.000_000_625,
+    },
+    "gemini-2.0-pro-preview-1206": {
+        "prompt_short": 0.000_001_25,
+        "completion_short": 0.000_005,
+        "prompt_long": 0.000_002_5,
+        "completion_long": 0.000_01,
+        "cached": 0.000_000_625,
+    },
+    "gemini-2.0-flash": {
+        "prompt_short": 0.000_000_10,
+        "completion_short": 0.000_000_40,
+        "prompt_long": 0.000_000_10,
+        "completion_long": 0.000_000_40,
+        "cached": 0.000_000_037_5,
+    },
+    "gemini-2.0-flash-latest": {
+        "prompt_short": 0.000_000_10,
+        "completion_short": 0.000_000_40,
+        "prompt_long": 0.000_000_10,
+        "completion_long": 0.000_000_40,
+        "cached": 0.000_000_037_5,
+    },
+    "gemini-2.0-flash-001": {
+        "prompt_short": 0.000_000_10,
+        "completion_short": 0.000_000_40,
+        "prompt_long": 0.000_000_10,
+        "completion_long": 0.000_000_40,
+        "cached": 0.000_000_037_5,
+    },
+    "gemini-2.0-flash-lite": {
+        "prompt_short": 0.000_000_075,
+        "completion_short": 0.000_000_30,
+        "prompt_long": 0.000_000_075,
+        "completion_long": 0.000_000_30,
+        "cached": 0.000_000_037_5,
+    },
+    "gemini-2.0-flash-lite-preview-02-05": {
+        "prompt_short": 0.000_000_075,
+        "completion_short": 0.000_000_30,
+        "prompt_long": 0.000_000_075,
+        "completion_long": 0.000_000_30,
+        "cached": 0.000_000_037_5,
+    },
+    "gemini-1.5-pro": {
+        "prompt_short": 0.000_001_25,
+        "completion_short": 0.000_005,
+        "prompt_long": 0.000_002_5,
+        "completion_long": 0.000_01,
+        "cached": 0.000_000_625,
+    },
+    "gemini-1.5-pro-latest": {
+        "prompt_short": 0.000_001_25,
+        "completion_short": 0.000_005,
+        "prompt_long": 0.000_002_5,
+        "completion_long": 0.000_01,
+        "cached": 0.000_000_625,
+    },
+    "gemini-1.5-pro-001": {
+        "prompt_short": 0.000_001_25,
+        "completion_short": 0.000_005,
+        "prompt_long": 0.000_002_5,
+        "completion_long": 0.000_01,
+        "cached": 0.000_000_625,
+    },
+    "gemini-1.5-pro-002": {
+        "prompt_short": 0.000_001_25,
+        "completion_short": 0.000_005,
+        "prompt_long": 0.000_002_5,
+        "completion_long": 0.000_01,
+        "cached": 0.000_000_625,
+    },
+    "gemini-1.5-flash": {
+        "prompt_short": 0.000_000_075,
+        "completion_short": 0.000_000_30,
+        "prompt_long": 0.000_000_15,
+        "completion_long": 0.000_000_60,
+        "cached": 0.000_000_037_5,
+    },
+    "gemini-1.5-flash-latest": {
+        "prompt_short": 0.000_000_075,
+        "completion_short": 0.000_000_30,
+        "prompt_long": 0.000_000_15,
+        "completion_long": 0.000_000_60,
+        "cached": 0.000_000_037_5,
+    },
+    "gemini-1.5-flash-001": {
+        "prompt_short": 0.000_000_075,
+        "completion_short": 0.000_000_30,
+        "prompt_long": 0.000_000_15,
+        "completion_long": 0.000_000_60,
+        "cached": 0.000_000_037_5,
+    },
+    "gemini-1.5-flash-002": {
+        "prompt_short": 0.000_000_075,
+        "completion_short": 0.000_000_30,
+        "prompt_long": 0.000_000_15,
+        "completion_long": 0.000_000_60,
+        "cached": 0.000_000_037_5,
+    },
+    "gemini-1.5-flash-8b": {
+        "prompt_short": 0.000_000_037_5,
+        "completion_short": 0.000_000_15,
+        "prompt_long": 0.000_000_075,
+        "completion_long": 0.000_000_30,
+        "cached": 0.000_000_025,
+    },
+    "gemini-1.5-flash-8b-latest": {
+        "prompt_short": 0.000_000_037_5,
+        "completion_short": 0.000_000_15,
+        "prompt_long": 0.000_000_075,
+        "completion_long": 0.000_000_30,
+        "cached": 0.000_000_025,
+    },
+    "gemini-1.5-flash-8b-001": {
+        "prompt_short": 0.000_000_037_5,
+        "completion_short": 0.000_000_15,
+        "prompt_long": 0.000_000_075,
+        "completion_long": 0.000_000_30,
+        "cached": 0.000_000_025,
+    },
+    "gemini-1.5-flash-8b-002": {
+        "prompt_short": 0.000_000_037_5,
+        "completion_short": 0.000_000_15,
+        "prompt_long": 0.000_000_075,
+        "completion_long": 0.000_000_30,
+        "cached": 0.000_000_025,
+    },
+    "gemini-1.0-pro": {
+        "prompt_short": 0.000_000_5,
+        "completion_short": 0.000_001_5,
+        "prompt_long": 0.000_000_5,
+        "completion_long": 0.000_001_5,
+        "cached": 0.000_000,
+    },
+}
+
+pricing_registry.register(
+    "google",
+    _PRICING,
+    required_keys=(
+        "prompt_short",
+        "prompt_long",
+        "cached",
+        "completion_short",
+        "completion_long",
+    ),
+)
+
 
 def calculate_cost(
     input_tokens: int | float | None,
@@ -44,158 +201,14 @@ def calculate_cost(
     Returns:
         Total cost in USD or None if invalid input
     """
-    pricing = {
-        "gemini-2.0-pro": {
-            "prompt_short": 0.000_001_25,
-            "completion_short": 0.000_005,
-            "prompt_long": 0.000_002_5,
-            "completion_long": 0.000_01,
-            "cached": 0.000_000_625,
-        },
-        "gemini-2.0-pro-preview-1206": {
-            "prompt_short": 0.000_001_25,
-            "completion_short": 0.000_005,
-            "prompt_long": 0.000_002_5,
-            "completion_long": 0.000_01,
-            "cached": 0.000_000_625,
-        },
-        "gemini-2.0-flash": {
-            "prompt_short": 0.000_000_10,
-            "completion_short": 0.000_000_40,
-            "prompt_long": 0.000_000_10,
-            "completion_long": 0.000_000_40,
-            "cached": 0.000_000_037_5,
-        },
-        "gemini-2.0-flash-latest": {
-            "prompt_short": 0.000_000_10,
-            "completion_short": 0.000_000_40,
-            "prompt_long": 0.000_000_10,
-            "completion_long": 0.000_000_40,
-            "cached": 0.000_000_037_5,
-        },
-        "gemini-2.0-flash-001": {
-            "prompt_short": 0.000_000_10,
-            "completion_short": 0.000_000_40,
-            "prompt_long": 0.000_000_10,
-            "completion_long": 0.000_000_40,
-            "cached": 0.000_000_037_5,
-        },
-        "gemini-2.0-flash-lite": {
-            "prompt_short": 0.000_000_075,
-            "completion_short": 0.000_000_30,
-            "prompt_long": 0.000_000_075,
-            "completion_long": 0.000_000_30,
-            "cached": 0.000_000_037_5,
-        },
-        "gemini-2.0-flash-lite-preview-02-05": {
-            "prompt_short": 0.000_000_075,
-            "completion_short": 0.000_000_30,
-            "prompt_long": 0.000_000_075,
-            "completion_long": 0.000_000_30,
-            "cached": 0.000_000_037_5,
-        },
-        "gemini-1.5-pro": {
-            "prompt_short": 0.000_001_25,
-            "completion_short": 0.000_005,
-            "prompt_long": 0.000_002_5,
-            "completion_long": 0.000_01,
-            "cached": 0.000_000_625,
-        },
-        "gemini-1.5-pro-latest": {
-            "prompt_short": 0.000_001_25,
-            "completion_short": 0.000_005,
-            "prompt_long": 0.000_002_5,
-            "completion_long": 0.000_01,
-            "cached": 0.000_000_625,
-        },
-        "gemini-1.5-pro-001": {
-            "prompt_short": 0.000_001_25,
-            "completion_short": 0.000_005,
-            "prompt_long": 0.000_002_5,
-            "completion_long": 0.000_01,
-            "cached": 0.000_000_625,
-        },
-        "gemini-1.5-pro-002": {
-            "prompt_short": 0.000_001_25,
-            "completion_short": 0.000_005,
-            "prompt_long": 0.000_002_5,
-            "completion_long": 0.000_01,
-            "cached": 0.000_000_625,
-        },
-        "gemini-1.5-flash": {
-            "prompt_short": 0.000_000_075,
-            "completion_short": 0.000_000_30,
-            "prompt_long": 0.000_000_15,
-            "completion_long": 0.000_000_60,
-            "cached": 0.000_000_037_5,
-        },
-        "gemini-1.5-flash-latest": {
-            "prompt_short": 0.000_000_075,
-            "completion_short": 0.000_000_30,
-            "prompt_long": 0.000_000_15,
-            "completion_long": 0.000_000_60,
-            "cached": 0.000_000_037_5,
-        },
-        "gemini-1.5-flash-001": {
-            "prompt_short": 0.000_000_075,
-            "completion_short": 0.000_000_30,
-            "prompt_long": 0.000_000_15,
-            "completion_long": 0.000_000_60,
-            "cached": 0.000_000_037_5,
-        },
-        "gemini-1.5-flash-002": {
-            "prompt_short": 0.000_000_075,
-            "completion_short": 0.000_000_30,
-            "prompt_long": 0.000_000_15,
-            "completion_long": 0.000_000_60,
-            "cached": 0.000_000_037_5,
-        },
-        "gemini-1.5-flash-8b": {
-            "prompt_short": 0.000_000_037_5,
-            "completion_short": 0.000_000_15,
-            "prompt_long": 0.000_000_075,
-            "completion_long": 0.000_000_30,
-            "cached": 0.000_000_025,
-        },
-        "gemini-1.5-flash-8b-latest": {
-            "prompt_short": 0.000_000_037_5,
-            "completion_short": 0.000_000_15,
-            "prompt_long": 0.000_000_075,
-            "completion_long": 0.000_000_30,
-            "cached": 0.000_000_025,
-        },
-        "gemini-1.5-flash-8b-001": {
-            "prompt_short": 0.000_000_037_5,
-            "completion_short": 0.000_000_15,
-            "prompt_long": 0.000_000_075,
-            "completion_long": 0.000_000_30,
-            "cached": 0.000_000_025,
-        },
-        "gemini-1.5-flash-8b-002": {
-            "prompt_short": 0.000_000_037_5,
-            "completion_short": 0.000_000_15,
-            "prompt_long": 0.000_000_075,
-            "completion_long": 0.000_000_30,
-            "cached": 0.000_000_025,
-        },
-        "gemini-1.0-pro": {
-            "prompt_short": 0.000_000_5,
-            "completion_short": 0.000_001_5,
-            "prompt_long": 0.000_000_5,
-            "completion_long": 0.000_001_5,
-            "cached": 0.000_000,
-        },
-    }
-
     if input_tokens is None or output_tokens is None:
         return None
 
     if cached_tokens is None:
         cached_tokens = 0
 
-    try:
-        model_pricing = pricing[model]
-    except KeyError:
+    model_pricing = pricing_registry.lookup("google", model)
+    if model_pricing is None:
         return None
 
     # Determine if we're using long context pricing
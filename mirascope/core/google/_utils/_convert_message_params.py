@@ -2,8 +2,12 @@
 
 import asyncio
 import base64
+import hashlib
 import io
+import threading
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 
 from google.genai import Client
 from google.genai.types import (
@@ -15,7 +19,7 @@ from google.genai.types import (
 
 from ...base import BaseMessageParam
 from ...base._utils import get_audio_type, get_image_type
-from ...base._utils._parse_content_template import _load_media
+from ...base._utils._parse_content_template import _load_media, prefetch_media_urls
 from ._validate_media_type import _check_audio_media_type, _check_image_media_type
 
 
@@ -27,11 +31,90 @@ def _over_file_size_limit(size: int) -> bool:
     return size > 10 * 1024 * 1024  # 10MB
 
 
+# Uploaded files expire after 48 hours, and we stop reusing them an hour before that.
+_FILE_TTL = timedelta(hours=47)
+_FILE_EXPIRY_MARGIN = timedelta(hours=1)
+_MAX_UPLOADED_FILES = 1024
+_uploaded_files: OrderedDict[tuple, tuple[FileDataDict, datetime]] = OrderedDict()
+_uploaded_files_lock = threading.Lock()
+
+
+def _upload_key(client: Client, blob_dict: BlobDict) -> tuple:
+    """Returns the key of the blob's uploaded file for the client's API key."""
+    api_key = getattr(getattr(client, "_api_client", None), "api_key", None)
+    return (
+        api_key or id(client),
+        hashlib.sha256(blob_dict["data"]).hexdigest(),  # pyright: ignore [reportTypedDictNotRequiredAccess, reportArgumentType]
+        blob_dict.get("mime_type"),
+    )
+
+
+def _get_uploaded_file(key: tuple) -> FileDataDict | None:
+    with _uploaded_files_lock:
+        if (uploaded := _uploaded_files.get(key)) is None:
+            return None
+        file_data, expiration_time = uploaded
+        if expiration_time - _FILE_EXPIRY_MARGIN <= datetime.now(timezone.utc):
+            del _uploaded_files[key]
+            return None
+        _uploaded_files.move_to_end(key)
+        return file_data
+
+
+async def _upload_file(client: Client, key: tuple, blob_dict: BlobDict) -> FileDataDict:
+    file_ref = await client.aio.files.upload(
+        file=io.BytesIO(blob_dict["data"]),  # pyright: ignore [reportTypedDictNotRequiredAccess, reportArgumentType]
+        config={"mime_type": blob_dict.get("mime_type", None)},
+    )
+    file_data = FileDataDict(file_uri=file_ref.uri, mime_type=file_ref.mime_type)
+    expiration_time = file_ref.expiration_time
+    if not isinstance(expiration_time, datetime):
+        expiration_time = datetime.now(timezone.utc) + _FILE_TTL
+    with _uploaded_files_lock:
+        _uploaded_files[key] = (file_data, expiration_time)
+        while len(_uploaded_files) > _MAX_UPLOADED_FILES:
+            _uploaded_files.popitem(last=False)
+    return file_data
+
+
+async def _upload_files(
+    must_upload: list[tuple[list[PartDict], int, BlobDict]], client: Client
+) -> None:
+    """Replaces the parts that are too large to send inline with uploaded files.
+
+    Files that were already uploaded for the same content (e.g. on a previous turn of
+    the conversation) are reused until they are about to expire. The rest are uploaded
+    concurrently, uploading identical content only once.
+    """
+    keys = [_upload_key(client, blob_dict) for _, _, blob_dict in must_upload]
+    file_data: dict[tuple, FileDataDict] = {}
+    to_upload: dict[tuple, BlobDict] = {}
+    for key, (_, _, blob_dict) in zip(keys, must_upload, strict=True):
+        if (uploaded := _get_uploaded_file(key)) is not None:
+            file_data[key] = uploaded
+        else:
+            to_upload.setdefault(key, blob_dict)
+    uploaded_files = await asyncio.gather(
+        *(_upload_file(client, key, blob_dict) for key, blob_dict in to_upload.items())
+    )
+    file_data |= dict(zip(to_upload, uploaded_files, strict=True))
+    for key, (converted_content, index, _) in zip(keys, must_upload, strict=True):
+        converted_content[index] = PartDict(file_data=file_data[key])
+
+
 async def _convert_message_params_async(
     message_params: list[BaseMessageParam | ContentDict], client: Client
 ) -> list[ContentDict]:
+    if not client.vertexai:
+        # Files of the Gemini API are passed by URI rather than downloaded
+        await asyncio.to_thread(
+            prefetch_media_urls,
+            message_params,
+            include=lambda url: "generativelanguage.googleapis.com" not in url,
+        )
     converted_message_params = []
     total_payload_size = 0
+    must_upload: list[tuple[list[PartDict], int, BlobDict]] = []
     for message_param in message_params:
         if not isinstance(message_param, BaseMessageParam):
             converted_message_params.append(message_param)
@@ -54,8 +137,7 @@ async def _convert_message_params_async(
                 }
             )
         else:
-            converted_content = []
-            must_upload: dict[int, BlobDict] = {}
+            converted_content: list[PartDict] = []
             for index, part in enumerate(content):
                 if part.type == "text":
                     converted_content.append(PartDict(text=part.text))
@@ -66,7 +148,7 @@ async def _convert_message_params_async(
                     image_size = len(part.image)
                     total_payload_size += image_size
                     if _over_file_size_limit(total_payload_size):
-                        must_upload[index] = blob_dict
+                        must_upload.append((converted_content, index, blob_dict))
                         total_payload_size -= image_size
                 elif part.type == "image_url":
                     if (
@@ -92,7 +174,7 @@ async def _convert_message_params_async(
                         image_size = len(downloaded_image)
                         total_payload_size += image_size
                         if _over_file_size_limit(total_payload_size):
-                            must_upload[index] = blob_dict
+                            must_upload.append((converted_content, index, blob_dict))
                             total_payload_size -= image_size
                 elif part.type == "audio":
                     _check_audio_media_type(part.media_type)
@@ -106,7 +188,7 @@ async def _convert_message_params_async(
                     audio_size = len(audio_data)
                     total_payload_size += audio_size
                     if _over_file_size_limit(total_payload_size):
-                        must_upload[index] = blob_dict
+                        must_upload.append((converted_content, index, blob_dict))
                         total_payload_size -= audio_size
                 elif part.type == "audio_url":
                     if (
@@ -132,7 +214,7 @@ async def _convert_message_params_async(
                         audio_size = len(downloaded_audio)
                         total_payload_size += audio_size
                         if _over_file_size_limit(total_payload_size):
-                            must_upload[index] = blob_dict
+                            must_upload.append((converted_content, index, blob_dict))
                             total_payload_size -= audio_size
                 else:
                     raise ValueError(
@@ -140,29 +222,14 @@ async def _convert_message_params_async(
                         f"Part provided: {part.type}"
                     )
 
-            if must_upload:
-                indices, blob_dicts = zip(*must_upload.items(), strict=True)
-                upload_tasks = [
-                    client.aio.files.upload(
-                        file=io.BytesIO(blob_dict["data"]),
-                        config={"mime_type": blob_dict.get("mime_type", None)},
-                    )
-                    for blob_dict in blob_dicts
-                ]
-                file_refs = await asyncio.gather(*upload_tasks)
-                for index, file_ref in zip(indices, file_refs, strict=True):
-                    converted_content[index] = PartDict(
-                        file_data=FileDataDict(
-                            file_uri=file_ref.uri, mime_type=file_ref.mime_type
-                        )
-                    )
-
             converted_message_params.append(
                 {
                     "role": role if role == "user" else "model",
                     "parts": converted_content,
                 }
             )
+    if must_upload:
+        await _upload_files(must_upload, client)
     return converted_message_params
 
 
@@ -146,7 +146,7 @@ class GoogleCallResponse(
         )
 
     @computed_field
-    @property
+    @cached_property
     def cost(self) -> float | None:
         """Returns the cost of the call."""
         return calculate_cost(
@@ -1,5 +1,40 @@
 """Calculate the cost of a completion using the Groq API."""
 
+from ...base.pricing import pricing_registry
+
+_PRICING = {
+    "llama3-groq-70b-8192-tool-use-preview": {
+        "prompt": 0.000_000_89,
+        "completion": 0.000_000_89,
+    },
+    "llama3-groq-8b-8192-tool-use-preview": {
+        "prompt": 0.000_000_19,
+        "completion": 0.000_000_19,
+    },
+    "llama3-70b-8192": {
+        "prompt": 0.000_000_59,
+        "completion": 0.000_000_79,
+    },
+    "llama3-8b-8192": {
+        "prompt": 0.000_000_05,
+        "completion": 0.000_000_08,
+    },
+    "mixtral-8x7b-32768": {
+        "prompt": 0.000_000_24,
+        "completion": 0.000_000_24,
+    },
+    "gemma-7b-it": {
+        "prompt": 0.000_000_07,
+        "completion": 0.000_000_07,
+    },
+    "gemma2-9b-it": {
+        "prompt": 0.000_000_2,
+        "completion": 0.000_000_2,
+    },
+}
+
+pricing_registry.register("groq", _PRICING, required_keys=("prompt", "completion"))
+
 
 def calculate_cost(
     input_tokens: int | float | None,
@@ -23,43 +58,11 @@ def calculate_cost(
     gemma-7b-it                            $0.07 / 1M tokens               $0.07 / 1M tokens
     gemma2-9b-it                           $0.20 / 1M tokens               $0.20 / 1M tokens
     """
-    pricing = {
-        "llama3-groq-70b-8192-tool-use-preview": {
-            "prompt": 0.000_000_89,
-            "completion": 0.000_000_89,
-        },
-        "llama3-groq-8b-8192-tool-use-preview": {
-            "prompt": 0.000_000_19,
-            "completion": 0.000_000_19,
-        },
-        "llama3-70b-8192": {
-            "prompt": 0.000_000_59,
-            "completion": 0.000_000_79,
-        },
-        "llama3-8b-8192": {
-            "prompt": 0.000_000_05,
-            "completion": 0.000_000_08,
-        },
-        "mixtral-8x7b-32768": {
-            "prompt": 0.000_000_24,
-            "completion": 0.000_000_24,
-        },
-        "gemma-7b-it": {
-            "prompt": 0.000_000_07,
-            "completion": 0.000_000_07,
-        },
-        "gemma2-9b-it": {
-            "prompt": 0.000_000_2,
-            "completion": 0.000_000_2,
-        },
-    }
-
     if input_tokens is None or output_tokens is None:
         return None
 
-    try:
-        model_pricing = pricing[model]
-    except KeyError:
+    model_pricing = pricing_registry.lookup("groq", model)
+    if model_pricing is None:
         return None
 
     prompt_cost = input_tokens * model_pricing["prompt"]
@@ -1,6 +1,5 @@
 """Utility for converting `BaseMessageParam` to `ChatCompletionMessageParam`"""
 
-import base64
 import json
 
 from groq.types.chat import (
@@ -8,6 +7,7 @@ from groq.types.chat import (
 )
 
 from ...base import BaseMessageParam
+from ...base._utils import encode_base64
 
 
 def convert_message_params(
@@ -35,7 +35,7 @@ def convert_message_params(
                             f"Unsupported image media type: {part.media_type}. Groq"
                             " currently only supports JPEG, PNG, GIF, and WebP images."
                         )
-                    data = base64.b64encode(part.image).decode("utf-8")
+                    data = encode_base64(part.image)
                     converted_content.append(
                         {
                             "type": "image_url",
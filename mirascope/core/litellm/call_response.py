@@ -3,6 +3,8 @@
 usage docs: learn/calls.md#handling-responses
 """
 
+from functools import cached_property
+
 from litellm.cost_calculator import completion_cost
 from pydantic import computed_field
 
@@ -19,7 +21,7 @@ class LiteLLMCallResponse(OpenAICallResponse):
     _provider = "litellm"
 
     @computed_field
-    @property
+    @cached_property
     def cost(self) -> float | None:
         """Returns the cost of the call."""
         return completion_cost(self.response)
@@ -36,8 +36,7 @@ class LiteLLMStream(OpenAIStream):
     @property
     def cost(self) -> float | None:
         """Returns the cost of the call."""
-        response = self.construct_call_response()
-        return response.cost
+        return self._cached_cost(lambda *_: self.construct_call_response().cost)
 
     def construct_call_response(self) -> LiteLLMCallResponse:
         openai_call_response = super().construct_call_response()
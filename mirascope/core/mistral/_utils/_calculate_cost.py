@@ -1,5 +1,21 @@
 """Calculate the cost of a completion using the Mistral API."""
 
+from ...base.pricing import pricing_registry
+
+_PRICING = {
+    "open-mistral-nemo": {"prompt": 0.000_000_3, "completion": 0.000_000_3},
+    "open-mistral-nemo-2407": {"prompt": 0.000_000_3, "completion": 0.000_000_3},
+    "mistral-large-latest": {"prompt": 0.000_003, "completion": 0.000_009},
+    "mistral-large-2407": {"prompt": 0.000_003, "completion": 0.000_009},
+    "open-mistral-7b": {"prompt": 0.000_000_25, "completion": 0.000_000_25},
+    "open-mixtral-8x7b": {"prompt": 0.000_000_7, "completion": 0.000_000_7},
+    "open-mixtral-8x22b": {"prompt": 0.000_002, "completion": 0.000_006},
+    "mistral-small-latest": {"prompt": 0.000_002, "completion": 0.000_006},
+    "mistral-medium-latest": {"prompt": 0.000_002_75, "completion": 0.000_008_1},
+}
+
+pricing_registry.register("mistral", _PRICING, required_keys=("prompt", "completion"))
+
 
 def calculate_cost(
     input_tokens: int | float | None,
@@ -21,24 +37,11 @@ def calculate_cost(
     mistral-small-latest	  $2/1M tokens	                 $6/1M tokens
     mistral-medium-latest     $2.75/1M tokens	             $8.1/1M tokens
     """
-    pricing = {
-        "open-mistral-nemo": {"prompt": 0.000_000_3, "completion": 0.000_000_3},
-        "open-mistral-nemo-2407": {"prompt": 0.000_000_3, "completion": 0.000_000_3},
-        "mistral-large-latest": {"prompt": 0.000_003, "completion": 0.000_009},
-        "mistral-large-2407": {"prompt": 0.000_003, "completion": 0.000_009},
-        "open-mistral-7b": {"prompt": 0.000_000_25, "completion": 0.000_000_25},
-        "open-mixtral-8x7b": {"prompt": 0.000_000_7, "completion": 0.000_000_7},
-        "open-mixtral-8x22b": {"prompt": 0.000_002, "completion": 0.000_006},
-        "mistral-small-latest": {"prompt": 0.000_002, "completion": 0.000_006},
-        "mistral-medium-latest": {"prompt": 0.000_002_75, "completion": 0.000_008_1},
-    }
-
     if input_tokens is None or output_tokens is None:
         return None
 
-    try:
-        model_pricing = pricing[model]
-    except KeyError:
+    model_pricing = pricing_registry.lookup("mistral", model)
+    if model_pricing is None:
         return None
 
     prompt_cost = input_tokens * model_pricing["prompt"]
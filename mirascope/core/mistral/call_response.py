@@ -120,7 +120,7 @@ class MistralCallResponse(
         return self.usage.completion_tokens
 
     @computed_field
-    @property
+    @cached_property
     def cost(self) -> float | None:
         """Returns the cost of the call."""
         return calculate_cost(
@@ -1,5 +1,194 @@
 """Calculate the cost of a completion using the OpenAI API."""
 
+from ...base.pricing import pricing_registry
+
+_PRICING = {
+    "gpt-4o": {
+        "prompt": 0.000_002_5,
+        "cached": 0.000_001_25,
+        "completion": 0.000_01,
+    },
+    "gpt-4o-2024-11-20": {
+        "prompt": 0.000_002_5,
+        "cached": 0.000_001_25,
+        "completion": 0.000_01,
+    },
+    "gpt-4o-2024-08-06": {
+        "prompt": 0.000_002_5,
+        "cached": 0.000_001_25,
+        "completion": 0.000_01,
+    },
+    "gpt-4o-2024-05-13": {
+        "prompt": 0.000_005,
+        "cached": 0.000_002_5,
+        "completion": 0.000_015,
+    },
+    "gpt-4o-audio-preview": {
+        "prompt": 0.000_002_5,
+        "cached": 0.000_001_25,
+        "completion": 0.000_01,
+    },
+    "gpt-4o-audio-preview-2024-12-17": {
+        "prompt": 0.000_002_5,
+        "cached": 0.000_001_25,
+        "completion": 0.000_01,
+    },
+    "gpt-4o-audio-preview-2024-10-01": {
+        "prompt": 0.000_002_5,
+        "cached": 0.000_001_25,
+        "completion": 0.000_01,
+    },
+    "gpt-4o-realtime-preview": {
+        "prompt": 0.000_005,
+        "cached": 0.000_002_5,
+        "completion": 0.000_02,
+    },
+    "gpt-4o-realtime-preview-2024-12-17": {
+        "prompt": 0.000_005,
+        "cached": 0.000_002_5,
+        "completion": 0.000_02,
+    },
+    "gpt-4o-realtime-preview-2024-10-01": {
+        "prompt": 0.000_005,
+        "cached": 0.000_002_5,
+        "completion": 0.000_02,
+    },
+    "gpt-4o-mini": {
+        "prompt": 0.000_000_15,
+        "cached": 0.000_000_08,
+        "completion": 0.000_000_6,
+    },
+    "gpt-4o-mini-2024-07-18": {
+        "prompt": 0.000_000_15,
+        "cached": 0.000_000_08,
+        "completion": 0.000_000_6,
+    },
+    "gpt-4o-mini-audio-preview": {
+        "prompt": 0.000_000_15,
+        "cached": 0.000_000_08,
+        "completion": 0.000_000_6,
+    },
+    "gpt-4o-mini-audio-preview-2024-12-17": {
+        "prompt": 0.000_000_15,
+        "cached": 0.000_000_08,
+        "completion": 0.000_000_6,
+    },
+    "gpt-4o-mini-realtime-preview": {
+        "prompt": 0.000_000_6,
+        "cached": 0.000_000_3,
+        "completion": 0.000_002_4,
+    },
+    "gpt-4o-mini-realtime-preview-2024-12-17": {
+        "prompt": 0.000_000_6,
+        "cached": 0.000_000_3,
+        "completion": 0.000_002_4,
+    },
+    "o1": {
+        "prompt": 0.000_015,
+        "cached": 0.000_007_5,
+        "completion": 0.000_06,
+    },
+    "o1-2024-12-17": {
+        "prompt": 0.000_015,
+        "cached": 0.000_007_5,
+        "completion": 0.000_06,
+    },
+    "o1-preview-2024-09-12": {
+        "prompt": 0.000_015,
+        "cached": 0.000_007_5,
+        "completion": 0.000_06,
+    },
+    "o3-mini": {
+        "prompt": 0.000_001_1,
+        "cached": 0.000_000_55,
+        "completion": 0.000_004_4,
+    },
+    "o3-mini-2025-01-31": {
+        "prompt": 0.000_001_1,
+        "cached": 0.000_000_55,
+        "completion": 0.000_004_4,
+    },
+    "o1-mini": {
+        "prompt": 0.000_001_1,
+        "cached": 0.000_000_55,
+        "completion": 0.000_004_4,
+    },
+    "o1-mini-2024-09-12": {
+        "prompt": 0.000_001_1,
+        "cached": 0.000_000_55,
+        "completion": 0.000_004_4,
+    },
+    "gpt-4-turbo": {
+        "prompt": 0.000_01,
+        "cached": 0,
+        "completion": 0.000_03,
+    },
+    "gpt-4-turbo-2024-04-09": {
+        "prompt": 0.000_01,
+        "cached": 0,
+        "completion": 0.000_03,
+    },
+    "gpt-3.5-turbo-0125": {
+        "prompt": 0.000_000_5,
+        "cached": 0,
+        "completion": 0.000_001_5,
+    },
+    "gpt-3.5-turbo-1106": {
+        "prompt": 0.000_001,
+        "cached": 0,
+        "completion": 0.000_002,
+    },
+    "gpt-4-1106-preview": {
+        "prompt": 0.000_01,
+        "cached": 0,
+        "completion": 0.000_03,
+    },
+    "gpt-4": {
+        "prompt": 0.000_003,
+        "cached": 0,
+        "completion": 0.000_006,
+    },
+    "gpt-3.5-turbo-4k": {
+        "prompt": 0.000_015,
+        "cached": 0,
+        "completion": 0.000_02,
+    },
+    "gpt-3.5-turbo-16k": {
+        "prompt": 0.000_003,
+        "cached": 0,
+        "completion": 0.000_004,
+    },
+    "gpt-4-8k": {
+        "prompt": 0.000_003,
+        "cached": 0,
+        "completion": 0.000_006,
+    },
+    "gpt-4-32k": {
+        "prompt": 0.000_006,
+        "cached": 0,
+        "completion": 0.000_012,
+    },
+    "text-embedding-3-small": {
+        "prompt": 0.000_000_02,
+        "cached": 0,
+        "completion": 0,
+    },
+    "text-embedding-ada-002": {
+        "prompt": 0.000_000_1,
+        "cached": 0,
+        "completion": 0,
+    },
+    "text-embedding-3-large": {
+        "prompt": 0.000_000_13,
+        "cached": 0,
+        "completion": 0,
+    },
+}
+
+pricing_registry.register(
+    "openai", _PRICING, required_keys=("prompt", "cached", "completion")
+)
+
 
 def calculate_cost(
     input_tokens: int | float | None,
@@ -45,197 +234,14 @@ def calculate_cost(
     text-embedding-3-large	                  $0.13  / 1M tokens
     text-embedding-ada-0002	                  $0.10  / 1M tokens
     """
-    pricing = {
-        "gpt-4o": {
-            "prompt": 0.000_002_5,
-            "cached": 0.000_001_25,
-            "completion": 0.000_01,
-        },
-        "gpt-4o-2024-11-20": {
-            "prompt": 0.000_002_5,
-            "cached": 0.000_001_25,
-            "completion": 0.000_01,
-        },
-        "gpt-4o-2024-08-06": {
-            "prompt": 0.000_002_5,
-            "cached": 0.000_001_25,
-            "completion": 0.000_01,
-        },
-        "gpt-4o-2024-05-13": {
-            "prompt": 0.000_005,
-            "cached": 0.000_002_5,
-            "completion": 0.000_015,
-        },
-        "gpt-4o-audio-preview": {
-            "prompt": 0.000_002_5,
-            "cached": 0.000_001_25,
-            "completion": 0.000_01,
-        },
-        "gpt-4o-audio-preview-2024-12-17": {
-            "prompt": 0.000_002_5,
-            "cached": 0.000_001_25,
-            "completion": 0.000_01,
-        },
-        "gpt-4o-audio-preview-2024-10-01": {
-            "prompt": 0.000_002_5,
-            "cached": 0.000_001_25,
-            "completion": 0.000_01,
-        },
-        "gpt-4o-realtime-preview": {
-            "prompt": 0.000_005,
-            "cached": 0.000_002_5,
-            "completion": 0.000_02,
-        },
-        "gpt-4o-realtime-preview-2024-12-17": {
-            "prompt": 0.000_005,
-            "cached": 0.000_002_5,
-            "completion": 0.000_02,
-        },
-        "gpt-4o-realtime-preview-2024-10-01": {
-            "prompt": 0.000_005,
-            "cached": 0.000_002_5,
-            "completion": 0.000_02,
-        },
-        "gpt-4o-mini": {
-            "prompt": 0.000_000_15,
-            "cached": 0.000_000_08,
-            "completion": 0.000_000_6,
-        },
-        "gpt-4o-mini-2024-07-18": {
-            "prompt": 0.000_000_15,
-            "cached": 0.000_000_08,
-            "completion": 0.000_000_6,
-        },
-        "gpt-4o-mini-audio-preview": {
-            "prompt": 0.000_000_15,
-            "cached": 0.000_000_08,
-            "completion": 0.000_000_6,
-        },
-        "gpt-4o-mini-audio-preview-2024-12-17": {
-            "prompt": 0.000_000_15,
-            "cached": 0.000_000_08,
-            "completion": 0.000_000_6,
-        },
-        "gpt-4o-mini-realtime-preview": {
-            "prompt": 0.000_000_6,
-            "cached": 0.000_000_3,
-            "completion": 0.000_002_4,
-        },
-        "gpt-4o-mini-realtime-preview-2024-12-17": {
-            "prompt": 0.000_000_6,
-            "cached": 0.000_000_3,
-            "completion": 0.000_002_4,
-        },
-        "o1": {
-            "prompt": 0.000_015,
-            "cached": 0.000_007_5,
-            "completion": 0.000_06,
-        },
-        "o1-2024-12-17": {
-            "prompt": 0.000_015,
-            "cached": 0.000_007_5,
-            "completion": 0.000_06,
-        },
-        "o1-preview-2024-09-12": {
-            "prompt": 0.000_015,
-            "cached": 0.000_007_5,
-            "completion": 0.000_06,
-        },
-        "o3-mini": {
-            "prompt": 0.000_001_1,
-            "cached": 0.000_000_55,
-            "completion": 0.000_004_4,
-        },
-        "o3-mini-2025-01-31": {
-            "prompt": 0.000_001_1,
-            "cached": 0.000_000_55,
-            "completion": 0.000_004_4,
-        },
-        "o1-mini": {
-            "prompt": 0.000_001_1,
-            "cached": 0.000_000_55,
-            "completion": 0.000_004_4,
-        },
-        "o1-mini-2024-09-12": {
-            "prompt": 0.000_001_1,
-            "cached": 0.000_000_55,
-            "completion": 0.000_004_4,
-        },
-        "gpt-4-turbo": {
-            "prompt": 0.000_01,
-            "cached": 0,
-            "completion": 0.000_03,
-        },
-        "gpt-4-turbo-2024-04-09": {
-            "prompt": 0.000_01,
-            "cached": 0,
-            "completion": 0.000_03,
-        },
-        "gpt-3.5-turbo-0125": {
-            "prompt": 0.000_000_5,
-            "cached": 0,
-            "completion": 0.000_001_5,
-        },
-        "gpt-3.5-turbo-1106": {
-            "prompt": 0.000_001,
-            "cached": 0,
-            "completion": 0.000_002,
-        },
-        "gpt-4-1106-preview": {
-            "prompt": 0.000_01,
-            "cached": 0,
-            "completion": 0.000_03,
-        },
-        "gpt-4": {
-            "prompt": 0.000_003,
-            "cached": 0,
-            "completion": 0.000_006,
-        },
-        "gpt-3.5-turbo-4k": {
-            "prompt": 0.000_015,
-            "cached": 0,
-            "completion": 0.000_02,
-        },
-        "gpt-3.5-turbo-16k": {
-            "prompt": 0.000_003,
-            "cached": 0,
-            "completion": 0.000_004,
-        },
-        "gpt-4-8k": {
-            "prompt": 0.000_003,
-            "cached": 0,
-            "completion": 0.000_006,
-        },
-        "gpt-4-32k": {
-            "prompt": 0.000_006,
-            "cached": 0,
-            "completion": 0.000_012,
-        },
-        "text-embedding-3-small": {
-            "prompt": 0.000_000_02,
-            "cached": 0,
-            "completion": 0,
-        },
-        "text-embedding-ada-002": {
-            "prompt": 0.000_000_1,
-            "cached": 0,
-            "completion": 0,
-        },
-        "text-embedding-3-large": {
-            "prompt": 0.000_000_13,
-            "cached": 0,
-            "completion": 0,
-        },
-    }
     if input_tokens is None or output_tokens is None:
         return None
 
     if cached_tokens is None:
         cached_tokens = 0
 
-    try:
-        model_pricing = pricing[model]
-    except KeyError:
+    model_pricing = pricing_registry.lookup("openai", model)
+    if model_pricing is None:
         return None
 
     prompt_cost = input_tokens * model_pricing["prompt"]
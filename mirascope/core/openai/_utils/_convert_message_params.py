@@ -1,18 +1,18 @@
 """Utility for converting `BaseMessageParam` to `ChatCompletionMessageParam`."""
 
-import base64
 import json
 
 from openai.types.chat import ChatCompletionMessageParam
 
 from ...base import BaseMessageParam
-from ...base._utils import get_audio_type
-from ...base._utils._parse_content_template import _load_media
+from ...base._utils import encode_base64, get_audio_type
+from ...base._utils._parse_content_template import _load_media, prefetch_media_urls
 
 
 def convert_message_params(
     message_params: list[BaseMessageParam | ChatCompletionMessageParam],
 ) -> list[ChatCompletionMessageParam]:
+    prefetch_media_urls(message_params, ("audio_url",))
     converted_message_params = []
     for message_param in message_params:
         if not isinstance(message_param, BaseMessageParam):
@@ -36,7 +36,7 @@ def convert_message_params(
                             f"Unsupported image media type: {part.media_type}. OpenAI"
                             " currently only supports JPEG, PNG, GIF, and WebP images."
                         )
-                    data = base64.b64encode(part.image).decode("utf-8")
+                    data = encode_base64(part.image)
                     converted_content.append(
                         {
                             "type": "image_url",
@@ -68,7 +68,7 @@ def convert_message_params(
                     data = (
                         part.audio
                         if isinstance(part.audio, str)
-                        else base64.b64encode(part.audio).decode("utf-8")
+                        else encode_base64(part.audio)
                     )
                     converted_content.append(
                         {
@@ -94,7 +94,7 @@ def convert_message_params(
                         {
                             "input_audio": {
                                 "format": audio_type.split("/")[-1],
-                                "data": base64.b64encode(audio).decode("utf-8"),
+                                "data": encode_base64(audio),
                             },
                             "type": "input_audio",
                         }
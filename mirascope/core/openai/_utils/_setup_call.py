@@ -21,6 +21,7 @@ from ...base._utils import (
     CreateFn,
     get_async_create_fn,
     get_create_fn,
+    get_model_json_schema,
 )
 from ...base.call_params import CommonCallParams
 from ...base.stream_config import StreamConfig
@@ -117,8 +118,9 @@ def setup_call(
                     "name": response_model.__name__,
                     "description": response_model.__doc__ or DEFAULT_TOOL_DOCSTRING,
                     "strict": True,
-                    "schema": response_model.model_json_schema(
-                        schema_generator=GenerateOpenAIStrictToolJsonSchema
+                    "schema": get_model_json_schema(
+                        response_model,
+                        schema_generator=GenerateOpenAIStrictToolJsonSchema,
                     ),
                 },
             }
@@ -1,5 +1,39 @@
 """Calculate the cost of a completion using the Vertex AI Gemini API, considering context window size."""
 
+from ...base.pricing import pricing_registry
+
+_PRICING = {
+    "gemini-1.5-flash": {
+        "prompt_short": 0.000_018_75,
+        "completion_short": 0.000_075,
+        "prompt_long": 0.000_037_5,
+        "completion_long": 0.000_15,
+    },
+    "gemini-1.5-pro": {
+        "prompt_short": 0.001_25,
+        "completion_short": 0.003_75,
+        "prompt_long": 0.002_5,
+        "completion_long": 0.007_5,
+    },
+    "gemini-1.0-pro": {
+        "prompt_short": 0.000_125,
+        "completion_short": 0.000_375,
+        "prompt_long": None,
+        "completion_long": None,
+    },
+}
+
+pricing_registry.register(
+    "vertex",
+    _PRICING,
+    required_keys=(
+        "prompt_short",
+        "prompt_long",
+        "completion_short",
+        "completion_long",
+    ),
+)
+
 
 def calculate_cost(
     input_chars: int | float | None,
@@ -19,33 +53,11 @@ def calculate_cost(
 
     Note: Prices are per 1k characters. Gemini 1.0 Pro only supports up to 32K context window.
     """
-    pricing = {
-        "gemini-1.5-flash": {
-            "prompt_short": 0.000_018_75,
-            "completion_short": 0.000_075,
-            "prompt_long": 0.000_037_5,
-            "completion_long": 0.000_15,
-        },
-        "gemini-1.5-pro": {
-            "prompt_short": 0.001_25,
-            "completion_short": 0.003_75,
-            "prompt_long": 0.002_5,
-            "completion_long": 0.007_5,
-        },
-        "gemini-1.0-pro": {
-            "prompt_short": 0.000_125,
-            "completion_short": 0.000_375,
-            "prompt_long": None,
-            "completion_long": None,
-        },
-    }
-
     if input_chars is None or output_chars is None:
         return None
 
-    try:
-        model_pricing = pricing[model]
-    except KeyError:
+    model_pricing = pricing_registry.lookup("vertex", model)
+    if model_pricing is None:
         return None
 
     # Determine if we're using long context pricing
@@ -10,12 +10,13 @@ from vertexai.generative_models import Content, Image, Part
 
 from ...base import BaseMessageParam
 from ...base._utils import get_audio_type
-from ...base._utils._parse_content_template import _load_media
+from ...base._utils._parse_content_template import _load_media, prefetch_media_urls
 
 
 def convert_message_params(
     message_params: list[BaseMessageParam | Content],
 ) -> list[Content]:
+    prefetch_media_urls(message_params)
     converted_message_params = []
     for message_param in message_params:
         if isinstance(message_param, Content):
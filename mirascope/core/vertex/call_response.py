@@ -125,7 +125,7 @@ class VertexCallResponse(
         return self.usage.candidates_token_count
 
     @computed_field
-    @property
+    @cached_property
     def cost(self) -> float | None:
         """Returns the cost of the call."""
         return calculate_cost(
@@ -1,5 +1,59 @@
 """Calculate the cost of a Grok API call."""
 
+from ...base.pricing import pricing_registry
+
+_PRICING = {
+    "grok-3": {
+        "prompt": 0.000_003_5,
+        "cached": 0.000_000_875,
+        "completion": 0.000_010_5,
+    },
+    "grok-3-latest": {
+        "prompt": 0.000_003_5,
+        "cached": 0.000_000_875,
+        "completion": 0.000_010_5,
+    },
+    "grok-2": {
+        "prompt": 0.000_002,
+        "cached": 0.000_000_5,
+        "completion": 0.000_006,
+    },
+    "grok-latest": {
+        "prompt": 0.000_002,
+        "cached": 0.000_000_5,
+        "completion": 0.000_006,
+    },
+    "grok-2-1212": {
+        "prompt": 0.000_002,
+        "cached": 0.000_000_5,
+        "completion": 0.000_006,
+    },
+    "grok-2-mini": {
+        "prompt": 0.000_000_33,
+        "cached": 0.000_000_083,
+        "completion": 0.000_001,
+    },
+    "grok-2-vision-1212": {
+        "prompt": 0.000_002,
+        "cached": 0.000_000_5,
+        "completion": 0.000_006,
+    },
+    "grok-vision-beta": {
+        "prompt": 0.000_005,
+        "cached": 0.000_001_25,
+        "completion": 0.000_015,
+    },
+    "grok-beta": {
+        "prompt": 0.000_005,
+        "cached": 0.000_001_25,
+        "completion": 0.000_015,
+    },
+}
+
+pricing_registry.register(
+    "xai", _PRICING, required_keys=("prompt", "cached", "completion")
+)
+
 
 def calculate_cost(
     input_tokens: int | float | None,
@@ -33,63 +87,14 @@ def calculate_cost(
     Returns:
         Total cost in USD or None if invalid input
     """
-    pricing = {
-        "grok-3": {
-            "prompt": 0.000_003_5,
-            "cached": 0.000_000_875,
-            "completion": 0.000_010_5,
-        },
-        "grok-3-latest": {
-            "prompt": 0.000_003_5,
-            "cached": 0.000_000_875,
-            "completion": 0.000_010_5,
-        },
-        "grok-2": {
-            "prompt": 0.000_002,
-            "cached": 0.000_000_5,
-            "completion": 0.000_006,
-        },
-        "grok-latest": {
-            "prompt": 0.000_002,
-            "cached": 0.000_000_5,
-            "completion": 0.000_006,
-        },
-        "grok-2-1212": {
-            "prompt": 0.000_002,
-            "cached": 0.000_000_5,
-            "completion": 0.000_006,
-        },
-        "grok-2-mini": {
-            "prompt": 0.000_000_33,
-            "cached": 0.000_000_083,
-            "completion": 0.000_001,
-        },
-        "grok-2-vision-1212": {
-            "prompt": 0.000_002,
-            "cached": 0.000_000_5,
-            "completion": 0.000_006,
-        },
-        "grok-vision-beta": {
-            "prompt": 0.000_005,
-            "cached": 0.000_001_25,
-            "completion": 0.000_015,
-        },
-        "grok-beta": {
-            "prompt": 0.000_005,
-            "cached": 0.000_001_25,
-            "completion": 0.000_015,
-        },
-    }
-
     if input_tokens is None or output_tokens is None:
         return None
 
     if cached_tokens is None:
         cached_tokens = 0
 
-    try:
-        model_pricing = pricing[model]
-    except KeyError:
+    model_pricing = pricing_registry.lookup("xai", model)
+    if model_pricing is None:
         return None
 
     prompt_price = model_pricing["prompt"]
@@ -3,6 +3,8 @@
 usage docs: learn/calls.md#handling-responses
 """
 
+from functools import cached_property
+
 from pydantic import computed_field
 
 from ..openai import OpenAICallResponse
@@ -19,7 +21,7 @@ class XAICallResponse(OpenAICallResponse):
     _provider = "xai"
 
     @computed_field
-    @property
+    @cached_property
     def cost(self) -> float | None:
         """Returns the cost of the call."""
         return calculate_cost(
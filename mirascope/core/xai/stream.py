@@ -6,6 +6,7 @@ usage docs: learn/streams.md
 from collections.abc import AsyncGenerator, Generator
 
 from ..openai import OpenAIStream
+from ._utils import calculate_cost
 from .call_response import XAICallResponse
 from .call_response_chunk import XAICallResponseChunk
 from .tool import XAITool
@@ -34,8 +35,7 @@ class XAIStream(OpenAIStream):
     @property
     def cost(self) -> float | None:
         """Returns the cost of the call."""
-        response = self.construct_call_response()
-        return response.cost
+        return self._cached_cost(calculate_cost)
 
     def construct_call_response(self) -> XAICallResponse:
         openai_call_response = super().construct_call_response()
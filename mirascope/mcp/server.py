@@ -21,7 +21,7 @@ from mcp.types import (
 from pydantic import AnyUrl, BaseModel
 
 from mirascope.core import BaseDynamicConfig, BaseMessageParam, BaseTool
-from mirascope.core.base import ImagePart, TextPart
+from mirascope.core.base import ImagePart, TextPart, ToolExecutor
 from mirascope.core.base._utils import (
     MessagesDecorator,
     convert_base_model_to_base_tool,
@@ -133,10 +133,13 @@ class MCPServer:
             ]
         ]
         | None = None,
+        tool_executor: ToolExecutor | None = None,
     ) -> None:
         self.name: str = name
         self.version: str = version
         self.server: Server = Server(name)
+        # Sync tools run in a thread pool by default so they don't block the event loop
+        self.tool_executor: ToolExecutor = tool_executor or ToolExecutor("thread")
         self._tools: dict[str, tuple[Tool, type[MCPTool]]] = {}
         self._resources: dict[str, tuple[Resource, Callable]] = {}
         self._prompts: dict[
@@ -293,10 +296,7 @@ class MCPServer:
             tool = tool_type.from_tool_call(
                 tool_call=ToolUseBlock(id=name, name=name, input=arguments)
             )
-            if fn_is_async(tool.call):
-                result = await tool.call()
-            else:
-                result = tool.call()
+            result = await self.tool_executor.call_async(tool)
             return [TextContent(type="text", text=result)]
 
         @self.server.list_prompts()
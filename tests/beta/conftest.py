@@ -0,0 +1,8 @@
+"""Configuration for the beta module tests."""
+
+try:
+    import mirascope.beta  # noqa: F401
+except OSError:  # pragma: no cover
+    # `mirascope.beta` imports the realtime module, whose `sounddevice` dependency
+    # raises when the PortAudio system library isn't installed
+    collect_ignore = ["rag"]
@@ -0,0 +1,24 @@
+"""Tests for the `TextChunker` class."""
+
+from pathlib import Path
+
+import pytest
+
+from mirascope.beta.rag.base import TextChunker
+
+
+@pytest.mark.parametrize(
+    ("chunk_size", "chunk_overlap", "length"),
+    [(10, 0, 0), (10, 0, 25), (10, 3, 25), (7, 6, 100), (70_000, 100, 200_000)],
+)
+def test_text_chunker_chunk_file(
+    tmp_path: Path, chunk_size: int, chunk_overlap: int, length: int
+) -> None:
+    """Tests that chunking a file in pieces gives the chunks of the whole text."""
+    text = "".join(chr(ord("a") + i % 26) for i in range(length)) + "é"
+    path = tmp_path / "text.txt"
+    path.write_text(text, encoding="utf-8")
+    chunker = TextChunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+    assert [document.text for document in chunker.chunk_file(path)] == [
+        document.text for document in chunker.chunk(text)
+    ]
@@ -0,0 +1,71 @@
+"""Tests for the `embedders` module."""
+
+import asyncio
+import threading
+import time
+
+from ..conftest import FakeEmbedder
+
+
+def test_base_embedder_batches() -> None:
+    """Tests splitting the inputs into batches of `embed_batch_size`."""
+    inputs = [str(i) for i in range(5)]
+    assert FakeEmbedder()._batches(inputs) == [inputs]
+    assert FakeEmbedder(embed_batch_size=2)._batches(inputs) == [
+        ["0", "1"],
+        ["2", "3"],
+        ["4"],
+    ]
+
+
+def test_base_embedder_map_batches_is_bounded() -> None:
+    """Tests that at most `max_workers` batches are embedded at once."""
+    embedder = FakeEmbedder(embed_batch_size=1, max_workers=2)
+    lock, running, most = threading.Lock(), [0], [0]
+
+    def embed(batch: list[str]) -> str:
+        with lock:
+            running[0] += 1
+            most[0] = max(most[0], running[0])
+        time.sleep(0.01)
+        with lock:
+            running[0] -= 1
+        return batch[0]
+
+    inputs = [str(i) for i in range(8)]
+    assert embedder._map_batches(embed, inputs) == inputs
+    assert most[0] == 2
+    executor = embedder._get_executor()
+    embedder._map_batches(embed, inputs)
+    assert embedder._get_executor() is executor
+
+    embedder.close()
+    assert embedder._executor is None
+    assert embedder._map_batches(embed, inputs) == inputs
+    assert embedder._get_executor() is not executor
+    embedder.close()
+
+
+def test_base_embedder_map_batches_async_is_bounded() -> None:
+    """Tests that at most `max_workers` batches are awaited at once per event loop."""
+    embedder = FakeEmbedder(embed_batch_size=1, max_workers=3)
+    running, most = [0], [0]
+
+    async def embed(batch: list[str]) -> str:
+        running[0] += 1
+        most[0] = max(most[0], running[0])
+        await asyncio.sleep(0.01)
+        running[0] -= 1
+        return batch[0]
+
+    async def map_batches() -> tuple[list[str], asyncio.Semaphore]:
+        inputs = [str(i) for i in range(10)]
+        return await embedder._map_batches_async(
+            embed, inputs
+        ), embedder._get_semaphore()
+
+    results, semaphore = asyncio.run(map_batches())
+    assert results == [str(i) for i in range(10)]
+    assert most[0] == 3
+    # A semaphore is bound to its event loop, so each loop gets its own
+    assert asyncio.run(map_batches())[1] is not semaphore
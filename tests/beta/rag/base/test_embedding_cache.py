@@ -0,0 +1,105 @@
+"""Tests for the `embedding_cache` module."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from mirascope.beta.rag.base.embedding_cache import (
+    CachedEmbedder,
+    CachedEmbeddingResponse,
+    EmbeddingCache,
+)
+
+from ..conftest import FakeEmbedder, embed_text
+
+
+def test_embedding_cache_get_put(tmp_path: Path) -> None:
+    """Tests storing and reading vectors by namespace and text."""
+    cache = EmbeddingCache(tmp_path)
+    assert cache.get("a", ["x", "y"]) == [None, None]
+    cache.put("a", ["x", "y"], np.array([[1, 2], [3, 4]], dtype=np.float32))
+    cache.put("a", ["x"], np.array([[5, 6]], dtype=np.float32))
+    cache.put("b", ["x"], np.array([[7, 8, 9]], dtype=np.float32))
+    x, y, z = cache.get("a", ["x", "y", "z"])
+    assert x is not None and x.tolist() == [1, 2]
+    assert y is not None and y.tolist() == [3, 4]
+    assert z is None
+    (x,) = cache.get("b", ["x"])
+    assert x is not None and x.tolist() == [7, 8, 9]
+    cache.close()
+
+    reopened = EmbeddingCache(tmp_path)
+    assert [v.tolist() for v in reopened.get("a", ["y", "x"]) if v is not None] == [
+        [3, 4],
+        [1, 2],
+    ]
+    reopened.close()
+
+
+def test_embedding_cache_put_checks_shape(tmp_path: Path) -> None:
+    """Tests that `put` rejects a vector count that doesn't match the texts."""
+    cache = EmbeddingCache(tmp_path)
+    with pytest.raises(ValueError, match="Expected 2 vectors"):
+        cache.put("a", ["x", "y"], np.zeros((1, 4)))
+    cache.close()
+
+
+def test_cached_embedder_hits_and_misses(
+    tmp_path: Path, embedder: FakeEmbedder
+) -> None:
+    """Tests that only the unique misses are sent to the wrapped embedder."""
+    cache = EmbeddingCache(tmp_path)
+    cached_embedder = CachedEmbedder(embedder=embedder, cache=cache)
+    assert cached_embedder.dimensions == embedder.dimensions
+
+    response = cached_embedder.embed(["a", "b", "a"])
+    assert isinstance(response, CachedEmbeddingResponse)
+    assert response.cache_hits == 0
+    assert embedder.calls == [["a", "b"]]
+    np.testing.assert_allclose(
+        response.embeddings_array, [embed_text(t) for t in ["a", "b", "a"]], rtol=1e-6
+    )
+
+    response = cached_embedder.embed(["b", "c", "a"])
+    assert response.cache_hits == 2
+    assert embedder.calls[-1] == ["c"]
+    np.testing.assert_allclose(
+        response.embeddings, [embed_text(t) for t in ["b", "c", "a"]], rtol=1e-6
+    )
+
+    response = cached_embedder.embed(["c"])
+    assert response.cache_hits == 1 and response.response is None
+    assert len(embedder.calls) == 2
+    assert cached_embedder.embed([]).embeddings_array.shape == (0, 16)
+    cache.close()
+
+
+def test_cached_embedder_namespace(tmp_path: Path) -> None:
+    """Tests that embedders with different dimensions don't share vectors."""
+    cache = EmbeddingCache(tmp_path)
+    small, large = FakeEmbedder(dimensions=8), FakeEmbedder(dimensions=16)
+    small_cached = CachedEmbedder(embedder=small, cache=cache)
+    large_cached = CachedEmbedder(embedder=large, cache=cache)
+    assert small_cached.namespace != large_cached.namespace
+    assert small_cached.namespace.startswith("fake:text-embedding-ada-002:8:float:")
+
+    assert small_cached.embed(["a"]).embeddings_array.shape == (1, 8)
+    response = large_cached.embed(["a"])
+    assert response.cache_hits == 0 and response.embeddings_array.shape == (1, 16)
+    assert CachedEmbedder(embedder=small, cache=cache).embed(["a"]).cache_hits == 1
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_cached_embedder_embed_async(
+    tmp_path: Path, embedder: FakeEmbedder
+) -> None:
+    """Tests that asynchronous calls read and write the same cache."""
+    cache = EmbeddingCache(tmp_path)
+    cached_embedder = CachedEmbedder(embedder=embedder, cache=cache)
+    assert (await cached_embedder.embed_async(["a", "b"])).cache_hits == 0
+    assert (await cached_embedder.embed_async(["a", "b"])).cache_hits == 2
+    assert cached_embedder.embed(["b"]).cache_hits == 1
+    assert embedder.calls == [["a", "b"]]
+    cache.close()
@@ -0,0 +1,116 @@
+"""Tests for the `ingestion` module."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from mirascope.beta.rag.base import (
+    Document,
+    IngestionProgress,
+    TextChunker,
+    ingest,
+)
+from mirascope.beta.rag.base.embedding_response import BaseEmbeddingResponse
+from mirascope.beta.rag.local import LocalVectorStore
+
+from ..conftest import FakeEmbedder
+
+
+def _store(embedder: FakeEmbedder, upsert_errors: list[Exception] | None = None):
+    errors = upsert_errors or []
+
+    class Store(LocalVectorStore):
+        chunker = TextChunker(chunk_size=4, chunk_overlap=0)
+
+        def _upsert(
+            self,
+            documents: list[Document],
+            embedding_response: BaseEmbeddingResponse | None,
+        ) -> None:
+            if errors:
+                raise errors.pop(0)
+            super()._upsert(documents, embedding_response)
+
+    Store.embedder = embedder
+    return Store()
+
+
+def test_ingest(tmp_path: Path, embedder: FakeEmbedder) -> None:
+    """Tests ingesting texts, documents, and files in batches."""
+    path = tmp_path / "text.txt"
+    path.write_text("0123456789")
+    store = _store(embedder)
+    progresses: list[IngestionProgress] = []
+    progress = store.add_stream(
+        ["abcdefgh", Document(id="doc", text="document"), path],
+        batch_size=2,
+        on_progress=progresses.append,
+    )
+    assert progress == IngestionProgress(
+        sources=3, chunks=6, embedded=6, upserted=6, batches=3, retries=0
+    )
+    assert [p.upserted for p in progresses] == [2, 4, 6]
+    assert [len(batch) for batch in embedder.calls] == [2, 2, 2]
+    assert len(store) == 6
+    assert store.retrieve("document", top_k=1).ids == ["doc"]
+    assert ingest(store, []) == IngestionProgress()
+
+
+def test_ingest_retries_transient_errors(embedder: FakeEmbedder) -> None:
+    """Tests that embedding and upsert errors in `catch` are retried."""
+    embedder.errors = [ConnectionError(), TimeoutError()]
+    store = _store(embedder, upsert_errors=[OSError()])
+    progress = ingest(store, ["abcdefgh"], batch_size=1, backoff=0)
+    assert progress.retries == 3
+    assert progress.upserted == 2 and len(store) == 2
+
+    embedder.errors = [ValueError()]
+    progress = ingest(store, ["ijkl"], backoff=0, catch=(OSError, ValueError))
+    assert progress.retries == 1 and progress.upserted == 1
+
+
+def test_ingest_raises_other_errors(embedder: FakeEmbedder) -> None:
+    """Tests that other errors, and errors after all retries, are raised."""
+    read: list[int] = []
+
+    def sources() -> Iterator[str]:
+        for i in range(100):
+            read.append(i)
+            yield "abcd"
+
+    embedder.errors = [ValueError("bad input")]
+    store = _store(embedder)
+    with pytest.raises(ValueError, match="bad input"):
+        ingest(store, sources(), batch_size=1, backoff=0)
+    # Batches already in flight may still be added, but no more sources are read
+    assert len(read) <= 4 and len(store) < len(read)
+
+    embedder.calls, embedder.errors = [], [OSError()] * 3
+    with pytest.raises(OSError):
+        ingest(store, ["abcd"], max_retries=2, backoff=0)
+    assert len(embedder.calls) == 3
+
+
+def test_ingest_backpressure(embedder: FakeEmbedder) -> None:
+    """Tests that sources are only read a bounded number of batches ahead."""
+    embedder.delay = 0.01
+    upserted: list[int] = [0]
+    leads: list[int] = []
+
+    def sources() -> Iterator[str]:
+        for i in range(20):
+            leads.append(i + 1 - upserted[0])
+            yield "abcd"
+
+    store = _store(embedder)
+    progress = ingest(
+        store,
+        sources(),
+        batch_size=1,
+        max_pending_batches=2,
+        on_progress=lambda progress: upserted.__setitem__(0, progress.upserted),
+    )
+    assert progress.upserted == 20
+    # Besides the source being read, at most `max_pending_batches` batches wait
+    assert max(leads) == 3
@@ -0,0 +1,56 @@
+"""Tests for the `vectorstores` module."""
+
+import threading
+from typing import Any
+
+import pytest
+
+from mirascope.beta.rag.base import BaseQueryResults, BaseVectorStore, Document
+from mirascope.beta.rag.base.vectorstores import MAX_QUERY_WORKERS
+
+
+class ThreadQueryResults(BaseQueryResults):
+    """The text of a query and the thread that ran it."""
+
+    text: str
+    thread: str
+    top_k: int | None = None
+
+
+class ThreadStore(BaseVectorStore[ThreadQueryResults]):
+    """A store that records the threads that add and retrieve."""
+
+    threads: list[str] = []
+
+    def retrieve(self, text: str, **kwargs: Any) -> ThreadQueryResults:  # noqa: ANN401
+        return ThreadQueryResults(
+            text=text, thread=threading.current_thread().name, top_k=kwargs.get("top_k")
+        )
+
+    def add(self, text: str | list[Document], **kwargs: Any) -> None:  # noqa: ANN401
+        self.threads.append(threading.current_thread().name)
+
+
+@pytest.mark.asyncio
+async def test_base_vectorstore_async_runs_in_threads() -> None:
+    """Tests that the default async methods don't block the event loop."""
+    store = ThreadStore()
+    result = await store.retrieve_async("query")
+    assert result.text == "query"
+    assert result.thread != threading.current_thread().name
+    await store.add_async("text")
+    assert store.threads and store.threads[0] != threading.current_thread().name
+
+
+def test_base_vectorstore_retrieve_many() -> None:
+    """Tests that the default `retrieve_many` runs the queries in worker threads."""
+    store = ThreadStore()
+    texts = [f"query {i}" for i in range(MAX_QUERY_WORKERS * 2)]
+    results = store.retrieve_many(texts, top_k=3)
+    assert [result.text for result in results] == texts
+    assert all(result.top_k == 3 for result in results)
+    assert 1 <= len({result.thread for result in results}) <= MAX_QUERY_WORKERS
+    assert threading.current_thread().name not in {result.thread for result in results}
+    (result,) = store.retrieve_many(["query"])
+    assert result.thread == threading.current_thread().name and result.top_k is None
+    assert store.retrieve_many([]) == []
@@ -0,0 +1,61 @@
+"""Shared fixtures for the RAG module tests."""
+
+import hashlib
+import time
+from typing import ClassVar
+
+import numpy as np
+import pytest
+from pydantic import ConfigDict
+
+from mirascope.beta.rag import BaseEmbedder, BaseEmbeddingResponse
+
+DIMENSIONS = 16
+
+
+def embed_text(text: str, dimensions: int = DIMENSIONS) -> list[float]:
+    """Returns a deterministic pseudo-random embedding of the text."""
+    seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "little")
+    return np.random.default_rng(seed).standard_normal(dimensions).tolist()
+
+
+class FakeEmbeddingResponse(BaseEmbeddingResponse[list[list[float]]]):
+    """An embedding response holding the embeddings as lists of floats."""
+
+    @property
+    def embeddings(self) -> list[list[float]]:
+        return self.response
+
+
+class FakeEmbedder(BaseEmbedder[FakeEmbeddingResponse]):
+    """An embedder that records its calls and raises the queued `errors` first."""
+
+    dimensions: int | None = DIMENSIONS
+    calls: list[list[str]] = []
+    errors: list[Exception] = []
+    delay: float = 0.0
+    _provider: ClassVar[str] = "fake"
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    def embed(self, input: list[str]) -> FakeEmbeddingResponse:
+        self.calls.append(list(input))
+        if self.errors:
+            raise self.errors.pop(0)
+        time.sleep(self.delay)
+        return FakeEmbeddingResponse(
+            response=[
+                embed_text(text, self.dimensions or DIMENSIONS) for text in input
+            ],
+            start_time=0,
+            end_time=0,
+        )
+
+    async def embed_async(self, input: list[str]) -> FakeEmbeddingResponse:
+        return self.embed(input)
+
+
+@pytest.fixture()
+def embedder() -> FakeEmbedder:
+    """Returns a fake embedder of `DIMENSIONS` dimensions."""
+    return FakeEmbedder()
@@ -0,0 +1,100 @@
+"""Tests for the `ivf` module of local vectorstores."""
+
+import numpy as np
+
+from mirascope.beta.rag.local import FlatIndex, IVFIndex
+from mirascope.beta.rag.local.ivf import kmeans, nearest_centroids
+
+
+def _clustered_vectors(rows: int, clusters: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, 16)) * 10
+    return centers[rng.integers(clusters, size=rows)] + rng.standard_normal((rows, 16))
+
+
+def _ids(rows: int, start: int = 0) -> list[str]:
+    return [str(i) for i in range(start, start + rows)]
+
+
+def _add(index: FlatIndex, ids: list[str], vectors: np.ndarray) -> None:
+    index.add(ids, vectors, ids, [{"even": int(id) % 2 == 0} for id in ids])
+
+
+def test_kmeans() -> None:
+    """Tests that k-means returns one centroid per cluster, none of them empty."""
+    vectors = _clustered_vectors(300, 4).astype(np.float32)
+    centroids = kmeans(vectors, 8)
+    assert centroids.shape == (8, 16) and centroids.dtype == np.float32
+    assignments = nearest_centroids(vectors, centroids)
+    assert len(np.unique(assignments)) == 8
+    assert nearest_centroids(vectors[:0], centroids).shape == (0,)
+
+
+def test_ivf_index_trains_at_train_size() -> None:
+    """Tests that the index is searched exhaustively until it is trained."""
+    vectors = _clustered_vectors(200, 8)
+    index = IVFIndex(nlist=8, nprobe=1, train_size=100)
+    _add(index, _ids(99), vectors[:99])
+    assert index.centroids is None
+    assert index.search(vectors[:1], 1)[0].ids == ["0"]
+    _add(index, _ids(101, start=99), vectors[99:])
+    assert index.centroids is not None and len(index.centroids) == 8
+    assert len(index) == 200
+
+
+def test_ivf_index_search() -> None:
+    """Tests that probing every cluster is exact and few clusters have high recall."""
+    vectors = _clustered_vectors(1000, 16)
+    index, flat = IVFIndex(nlist=16, nprobe=4, train_size=1000), FlatIndex()
+    for ivf_or_flat in (index, flat):
+        _add(ivf_or_flat, _ids(1000), vectors)
+    queries = vectors[:20] + 0.1
+
+    exact = flat.search(queries, 5)
+    assert [r.ids for r in index.search(queries, 5, nprobe=16)] == [
+        r.ids for r in exact
+    ]
+    approximate = index.search(queries, 5)
+    recall = np.mean(
+        [
+            len(set(found.ids) & set(truth.ids)) / 5
+            for found, truth in zip(approximate, exact, strict=True)
+        ]
+    )
+    assert recall >= 0.9
+    assert [r.ids[0] for r in approximate] == _ids(20)
+
+    filtered = index.search(queries, 5, where={"even": True}, include_embeddings=True)
+    assert all(int(id) % 2 == 0 for r in filtered for id in r.ids)
+    assert filtered[0].embeddings is not None
+
+
+def test_ivf_index_assigns_new_and_readded_vectors() -> None:
+    """Tests that vectors added after training are found in their new cluster."""
+    vectors = _clustered_vectors(600, 8)
+    index = IVFIndex(nlist=8, nprobe=1, train_size=500)
+    _add(index, _ids(500), vectors[:500])
+    _add(index, _ids(100, start=500), vectors[500:])
+    assert len(index) == 600
+    assert index.search(vectors[550:551], 1)[0].ids == ["550"]
+
+    # Moving a vector to another cluster drops it from its old inverted list
+    assert index.centroids is not None
+    clusters = nearest_centroids(index.vectors, index.centroids)
+    other = int(np.flatnonzero(clusters != clusters[0])[0])
+    _add(index, ["0"], vectors[other : other + 1])
+    assert len(index) == 600
+    assert "0" not in index.search(vectors[:1], 600)[0].ids
+    assert set(index.search(vectors[other : other + 1], 2)[0].ids) == {"0", str(other)}
+
+
+def test_ivf_index_benchmark() -> None:
+    """Tests measuring the recall of each `nprobe` against exhaustive search."""
+    vectors = _clustered_vectors(500, 8)
+    index = IVFIndex(nlist=8, train_size=500)
+    _add(index, _ids(500), vectors)
+    results = index.benchmark(vectors[:10], k=5, nprobes=(1, 8))
+    assert [result.nprobe for result in results] == [1, 8]
+    assert results[1].recall == 1.0
+    assert all(0 <= result.recall <= 1 for result in results)
+    assert all(result.latency_ms >= 0 for result in results)
@@ -0,0 +1,89 @@
+"""Tests for the `quantization` module of local vectorstores."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from mirascope.beta.rag.local import Quantization, SegmentedIndex
+from mirascope.beta.rag.local.quantization import approximate_scores, quantize
+
+
+def _vectors(rows: int, dimensions: int = 20) -> np.ndarray:
+    return np.random.default_rng(0).standard_normal((rows, dimensions))
+
+
+def test_quantize_int8() -> None:
+    """Tests that int8 codes scaled back approximate the vectors."""
+    vectors = _vectors(10)
+    vectors[0] = 0
+    codes, scales = quantize(vectors, "int8")
+    assert codes.dtype == np.int8 and codes.shape == (10, 20)
+    assert scales is not None and scales.dtype == np.float32 and scales[0] == 1
+    assert np.abs(codes).max() == 127
+    np.testing.assert_allclose(codes * scales[:, None], vectors, atol=0.02)
+
+
+def test_quantize_binary() -> None:
+    """Tests that binary codes pack the sign of each dimension."""
+    vectors = _vectors(10)
+    codes, scales = quantize(vectors, "binary")
+    assert scales is None
+    assert codes.dtype == np.uint8 and codes.shape == (10, 3)
+    np.testing.assert_array_equal(
+        np.unpackbits(codes, axis=1)[:, :20], (vectors > 0).astype(np.uint8)
+    )
+
+
+@pytest.mark.parametrize("quantization", ["int8", "binary"])
+def test_approximate_scores(quantization: Quantization) -> None:
+    """Tests that the approximate scores rank vectors like the exact scores."""
+    vectors, queries = _vectors(200), _vectors(200)[:5]
+    codes, scales = quantize(vectors, quantization)
+    scores = approximate_scores(queries, codes, scales, quantization)
+    assert scores.shape == (5, 200)
+    exact = queries @ vectors.T
+    if quantization == "int8":
+        np.testing.assert_allclose(scores, exact, atol=0.5)
+    else:
+        np.testing.assert_allclose(
+            scores, queries @ np.where(vectors > 0, 1, -1).T, rtol=1e-5
+        )
+    assert (scores.argmax(axis=1) == exact.argmax(axis=1)).all()
+
+
+@pytest.mark.parametrize("quantization", ["int8", "binary"])
+def test_segmented_index_quantized_search(
+    tmp_path: Path, quantization: Quantization
+) -> None:
+    """Tests that quantized searches rescore candidates at full precision."""
+    vectors = _vectors(300)
+    ids = [str(i) for i in range(300)]
+    exact = SegmentedIndex(tmp_path / "exact")
+    index = SegmentedIndex(tmp_path / "quantized", quantization=quantization)
+    for segmented_index in (exact, index):
+        segmented_index.add(ids[:150], vectors[:150], ids[:150], [None] * 150)
+        segmented_index.add(ids[150:], vectors[150:], ids[150:], [None] * 150)
+    assert all(
+        (segment.path / f"codes-{quantization}.npy").exists()
+        for segment in index.segments
+    )
+
+    queries = vectors[[0, 200]] + 0.01
+    results = index.search(queries, 3)
+    assert [result.ids[0] for result in results] == ["0", "200"]
+    for result, truth in zip(results, exact.search(queries, 3), strict=True):
+        assert result.scores[0] == pytest.approx(truth.scores[0], rel=1e-5)
+
+
+def test_segment_quantizes_segments_without_codes(tmp_path: Path) -> None:
+    """Tests that segments written without codes are quantized when searched."""
+    vectors = _vectors(50)
+    ids = [str(i) for i in range(50)]
+    SegmentedIndex(tmp_path).add(ids, vectors, ids, [None] * 50)
+    index = SegmentedIndex(tmp_path, quantization="int8")
+    assert index.search(vectors[7:8], 1)[0].ids == ["7"]
+    (segment,) = index.segments
+    assert not (segment.path / "codes-int8.npy").exists()
+    codes, scales = segment.codes("int8")
+    assert codes.shape == (50, 20) and scales is not None
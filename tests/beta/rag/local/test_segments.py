@@ -0,0 +1,167 @@
+"""Tests for the `segments` module of local vectorstores."""
+
+import json
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from mirascope.beta.rag.local import SegmentedIndex
+
+
+def _vectors(rows: int, dimensions: int = 16, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).standard_normal((rows, dimensions))
+
+
+def _add(index: SegmentedIndex, ids: list[str], vectors: np.ndarray) -> None:
+    index.add(
+        ids, vectors, [f"document {id}" for id in ids], [{"id": id} for id in ids]
+    )
+
+
+def _segment_names(path: Path) -> list[str]:
+    return json.loads((path / "manifest.json").read_text())["segments"]
+
+
+def test_segmented_index_persists(tmp_path: Path) -> None:
+    """Tests that a reopened index finds the vectors of every segment."""
+    vectors = _vectors(20)
+    index = SegmentedIndex(tmp_path, max_segments=8)
+    _add(index, [str(i) for i in range(10)], vectors[:10])
+    _add(index, [str(i) for i in range(10, 20)], vectors[10:])
+    assert len(index) == 20 and len(index.segments) == 2
+
+    reopened = SegmentedIndex(tmp_path)
+    assert len(reopened) == 20
+    assert [segment.path.name for segment in reopened.segments] == _segment_names(
+        tmp_path
+    )
+    results = reopened.search(vectors[[3, 15]], 2, include_embeddings=True)
+    assert [result.ids[0] for result in results] == ["3", "15"]
+    assert results[0].documents[0] == "document 3"
+    assert results[0].metadatas[0] == {"id": "3"}
+    assert results[0].scores[0] == pytest.approx(1, abs=1e-5)
+    assert results[0].embeddings is not None and len(results[0].embeddings[0]) == 16
+    assert reopened.search(vectors[:1], 5, where={"id": "12"})[0].ids == ["12"]
+
+
+def test_segmented_index_shadows_ids(tmp_path: Path) -> None:
+    """Tests that re-adding an id shadows its row in older segments."""
+    vectors = _vectors(4)
+    index = SegmentedIndex(tmp_path)
+    _add(index, ["a", "b"], vectors[:2])
+    index.add(["a", "a"], vectors[2:], ["first", "second"], [None, None])
+    assert len(index) == 2
+    result = index.search(vectors[3:], 2)[0]
+    assert result.ids == ["a", "b"] and result.documents[0] == "second"
+    assert "a" not in index.search(vectors[:1], 1)[0].ids
+    assert len(SegmentedIndex(tmp_path)) == 2
+
+
+def test_segmented_index_compact(tmp_path: Path) -> None:
+    """Tests that compaction merges the segments and drops shadowed rows."""
+    vectors = _vectors(30)
+    index = SegmentedIndex(tmp_path, max_segments=8)
+    for start in range(0, 30, 10):
+        _add(index, [str(i) for i in range(start, start + 10)], vectors[start:][:10])
+    _add(index, ["0"], vectors[29:])
+    old_paths = [segment.path for segment in index.segments]
+    expected = [result.ids for result in index.search(vectors[:5], 3)]
+
+    index.compact()
+    assert len(index.segments) == 1 and len(index.segments[0]) == 30
+    assert not any(path.exists() for path in old_paths)
+    assert [result.ids for result in index.search(vectors[:5], 3)] == expected
+    assert len(SegmentedIndex(tmp_path)) == 30
+
+
+def test_segmented_index_compacts_in_background(tmp_path: Path) -> None:
+    """Tests that adding more than `max_segments` segments triggers compaction."""
+    vectors = _vectors(5)
+    index = SegmentedIndex(tmp_path, max_segments=2)
+    for i in range(5):
+        _add(index, [str(i)], vectors[i : i + 1])
+    deadline = time.monotonic() + 5
+    while len(index.segments) > 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(index.segments) <= 2
+    assert len(index) == 5
+    assert index.search(vectors[4:], 1)[0].ids == ["4"]
+
+
+def test_segmented_index_read_only(tmp_path: Path) -> None:
+    """Tests that readers pick up the segments of a writer and cannot write."""
+    vectors = _vectors(2)
+    writer = SegmentedIndex(tmp_path)
+    reader = SegmentedIndex(tmp_path, read_only=True)
+    assert len(reader) == 0
+    _add(writer, ["a"], vectors[:1])
+    assert reader.search(vectors[:1], 1)[0].ids == ["a"]
+    _add(writer, ["b"], vectors[1:])
+    writer.compact()
+    assert reader.search(vectors[1:], 1)[0].ids == ["b"]
+    with pytest.raises(ValueError, match="read-only"):
+        _add(reader, ["c"], vectors[:1])
+    with pytest.raises(ValueError, match="read-only"):
+        reader.compact()
+
+
+def test_segmented_index_checks_vectors(tmp_path: Path) -> None:
+    """Tests that vectors are checked before a segment is written."""
+    index = SegmentedIndex(tmp_path)
+    with pytest.raises(ValueError, match=r"Expected 2 vectors, documents"):
+        _add(index, ["a", "b"], _vectors(3))
+    with pytest.raises(ValueError, match=r"Expected 1 vectors, documents"):
+        index.add(["a"], _vectors(1), [], [])
+    _add(index, ["a"], _vectors(1))
+    with pytest.raises(
+        ValueError, match="Expected vectors with 16 dimensions but got 8"
+    ):
+        _add(index, ["b"], _vectors(1, dimensions=8))
+    with pytest.raises(
+        ValueError, match="Expected vectors with 16 dimensions but got 8"
+    ):
+        _add(SegmentedIndex(tmp_path), ["b"], _vectors(1, dimensions=8))
+    index.add([], np.empty((0, 8)), [], [])
+    assert len(index.segments) == 1
+    assert sorted(child.name for child in tmp_path.iterdir() if child.is_dir()) == [
+        segment.path.name for segment in index.segments
+    ]
+
+
+def test_segmented_index_removes_orphans(tmp_path: Path) -> None:
+    """Tests that only old, unlisted segments of the index are removed on open."""
+
+    def make_dir(name: str, files: list[str], age: float) -> Path:
+        path = tmp_path / name
+        path.mkdir()
+        for file in files:
+            (path / file).write_bytes(b"")
+            os.utime(path / file, (time.time() - age, time.time() - age))
+        return path
+
+    segment_files = ["vectors.npy", "ids.json", "records.jsonl", "offsets.npy"]
+    foreign = make_dir("f" * 32, ["vectors.npy", "notes.txt"], age=3600)
+    SegmentedIndex(tmp_path)
+    assert foreign.exists()  # no manifest, so nothing is removed
+
+    index = SegmentedIndex(tmp_path)
+    _add(index, ["a"], _vectors(1))
+    old = make_dir("a" * 32, segment_files, age=3600)
+    young = make_dir("b" * 32, segment_files, age=0)
+    other = make_dir("other", segment_files, age=3600)
+    empty = make_dir("c" * 32, [], age=3600)
+    old_manifest = tmp_path / "manifest.json.0123"
+    old_manifest.write_text("{}")
+    os.utime(old_manifest, (time.time() - 3600, time.time() - 3600))
+
+    reopened = SegmentedIndex(tmp_path)
+    assert not old.exists() and not old_manifest.exists()
+    assert young.exists() and other.exists() and empty.exists() and foreign.exists()
+    assert all(segment.path.exists() for segment in reopened.segments)
+    assert len(reopened) == 1
+    assert _segment_names(tmp_path) == [
+        segment.path.name for segment in reopened.segments
+    ]
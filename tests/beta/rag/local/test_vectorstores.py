@@ -0,0 +1,179 @@
+"""Tests for the `vectorstores` module of local vectorstores."""
+
+import asyncio
+import threading
+from pathlib import Path
+
+import pytest
+
+from mirascope.beta.rag.base import Document, TextChunker
+from mirascope.beta.rag.local import (
+    FlatIndex,
+    IVFIndex,
+    LocalParams,
+    LocalSettings,
+    LocalVectorStore,
+    Quantization,
+    SegmentedIndex,
+)
+
+from ..conftest import FakeEmbedder
+
+DOCUMENTS = [
+    Document(id=str(i), text=f"document {i}", metadata={"parity": i % 2})
+    for i in range(10)
+]
+
+
+def _store(
+    embedder: FakeEmbedder,
+    params: LocalParams | None = None,
+    settings: LocalSettings | None = None,
+) -> LocalVectorStore:
+    class Store(LocalVectorStore):
+        index_name = "store"
+        chunker = TextChunker(chunk_size=10, chunk_overlap=0)
+        vectorstore_params = params or LocalParams()
+        client_settings = settings or LocalSettings()
+
+    Store.embedder = embedder
+    return Store()
+
+
+def test_local_vectorstore_add_and_retrieve(embedder: FakeEmbedder) -> None:
+    """Tests retrieving the closest documents from an in-memory store."""
+    store = _store(embedder, LocalParams(top_k=3))
+    store.add(DOCUMENTS)
+    assert isinstance(store._index, FlatIndex)
+    assert len(store) == 10
+
+    result = store.retrieve("document 4")
+    assert len(result.ids) == 3 and result.embeddings is None
+    assert result.ids[0] == "4" and result.documents[0] == "document 4"
+    assert result.metadatas[0] == {"parity": 0}
+    assert result.scores[0] == pytest.approx(1, abs=1e-5)
+    assert result.scores == sorted(result.scores, reverse=True)
+
+    result = store.retrieve("document 4", top_k=10, where={"parity": 1})
+    assert len(result.ids) == 5 and all(int(id) % 2 for id in result.ids)
+    result = store.retrieve("document 4", top_k=1, include_embeddings=True)
+    assert result.embeddings is not None and len(result.embeddings[0]) == 16
+
+
+def test_local_vectorstore_replaces_ids(embedder: FakeEmbedder) -> None:
+    """Tests that adding an existing id replaces its document."""
+    store = _store(embedder)
+    store.add(DOCUMENTS)
+    store.add([Document(id="4", text="replaced", metadata=None)])
+    assert len(store) == 10
+    result = store.retrieve("replaced", top_k=1)
+    assert result.ids == ["4"] and result.documents == ["replaced"]
+    assert result.metadatas == [None]
+    assert "4" not in store.retrieve("document 4", top_k=1).ids
+
+
+def test_local_vectorstore_add_text(embedder: FakeEmbedder) -> None:
+    """Tests that text is chunked before it is added."""
+    store = _store(embedder)
+    store.add("0123456789abcdefghij")
+    store.add("")
+    assert len(store) == 2
+    assert store.retrieve("abcdefghij", top_k=1).documents == ["abcdefghij"]
+
+
+def test_local_vectorstore_concurrent_retrieve(embedder: FakeEmbedder) -> None:
+    """Tests that searches running alongside adds see consistent results."""
+    store = _store(embedder, LocalParams(top_k=1))
+    store.add(DOCUMENTS[:1])
+    errors: list[BaseException] = []
+
+    def retrieve() -> None:
+        try:
+            for _ in range(50):
+                assert store.retrieve("document 0").ids == ["0"]
+        except BaseException as e:  # pragma: no cover
+            errors.append(e)
+
+    threads = [threading.Thread(target=retrieve) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for document in DOCUMENTS[1:]:
+        store.add([document])
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert len(store) == 10
+
+
+def test_local_vectorstore_retrieve_many(embedder: FakeEmbedder) -> None:
+    """Tests that the texts of `retrieve_many` are embedded in a single call."""
+    store = _store(embedder, LocalParams(top_k=2))
+    store.add(DOCUMENTS)
+    embedder.calls.clear()
+    results = store.retrieve_many(["document 3", "document 8"], where={"parity": 1})
+    assert embedder.calls == [["document 3", "document 8"]]
+    assert results[0].ids[0] == "3"
+    assert all(int(id) % 2 for result in results for id in result.ids)
+    results = store.retrieve_many(["document 1"] * 3, top_k=1)
+    assert [result.ids for result in results] == [["1"]] * 3
+    assert store.retrieve_many([]) == []
+
+
+@pytest.mark.asyncio
+async def test_local_vectorstore_async(embedder: FakeEmbedder) -> None:
+    """Tests adding and retrieving documents asynchronously."""
+    store = _store(embedder, LocalParams(top_k=2))
+    await store.add_async(DOCUMENTS)
+    await store.add_async("")
+    await store.add_async("0123456789")
+    assert len(store) == 11
+    results = await asyncio.gather(
+        store.retrieve_async("document 1"),
+        store.retrieve_async("0123456789", top_k=1),
+        store.retrieve_async("document 2", where={"parity": 1}),
+    )
+    assert results[0].ids[0] == "1"
+    assert results[1].documents == ["0123456789"]
+    assert all(int(id) % 2 for id in results[2].ids)
+
+
+def test_local_vectorstore_persistent(tmp_path: Path, embedder: FakeEmbedder) -> None:
+    """Tests that a store with a `path` persists its documents per index name."""
+    settings = LocalSettings(path=str(tmp_path))
+    store = _store(embedder, settings=settings)
+    store.add(DOCUMENTS)
+    assert isinstance(store._index, SegmentedIndex)
+    assert store._index.path == tmp_path / "store"
+
+    reopened = _store(embedder, settings=settings)
+    assert len(reopened) == 10
+    assert reopened.retrieve("document 7", top_k=1).ids == ["7"]
+
+
+def test_local_vectorstore_ivf(embedder: FakeEmbedder) -> None:
+    """Tests that an `ivf` store passes `nprobe` to its index."""
+    store = _store(embedder, LocalParams(index="ivf", nlist=2, nprobe=1))
+    store.add(DOCUMENTS)
+    assert isinstance(store._index, IVFIndex) and store._index.nlist == 2
+    assert store.retrieve("document 3", top_k=1, nprobe=2).ids == ["3"]
+    with pytest.raises(ValueError, match="cannot be persisted"):
+        len(_store(embedder, LocalParams(index="ivf"), LocalSettings(path="x")))
+
+
+@pytest.mark.parametrize("quantization", ["int8", "binary"])
+def test_local_vectorstore_quantization(
+    tmp_path: Path, embedder: FakeEmbedder, quantization: Quantization
+) -> None:
+    """Tests that a persistent store searches quantized vectors."""
+    store = _store(
+        embedder,
+        LocalParams(quantization=quantization, rescore=2),
+        LocalSettings(path=str(tmp_path)),
+    )
+    store.add(DOCUMENTS)
+    assert isinstance(store._index, SegmentedIndex)
+    assert store._index.quantization == quantization
+    assert store._index.rescore == 2
+    assert store.retrieve("document 5", top_k=1).ids == ["5"]
+    with pytest.raises(ValueError, match="Quantization requires a persistent"):
+        len(_store(embedder, LocalParams(quantization=quantization)))
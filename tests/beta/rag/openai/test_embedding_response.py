@@ -0,0 +1,48 @@
+"""Tests for the `OpenAIEmbeddingResponse` class."""
+
+import base64
+
+import numpy as np
+from openai.types import CreateEmbeddingResponse, Embedding
+from openai.types.create_embedding_response import Usage
+
+from mirascope.beta.rag.openai import OpenAIEmbeddingResponse
+
+
+def _response(embeddings: list[list[float]] | list[str]) -> OpenAIEmbeddingResponse:
+    return OpenAIEmbeddingResponse(
+        response=CreateEmbeddingResponse(
+            data=[
+                Embedding.model_construct(
+                    embedding=embedding, index=i, object="embedding"
+                )
+                for i, embedding in enumerate(embeddings)
+            ],
+            model="text-embedding-3-small",
+            object="list",
+            usage=Usage(prompt_tokens=2, total_tokens=2),
+        ),
+        start_time=0,
+        end_time=0,
+    )
+
+
+def test_openai_embedding_response_floats() -> None:
+    """Tests the embeddings of a response with float embeddings."""
+    response = _response([[1.0, 2.0], [3.0, 4.5]])
+    assert response.embeddings == [[1.0, 2.0], [3.0, 4.5]]
+    array = response.embeddings_array
+    assert array.dtype == np.float32 and array.tolist() == [[1.0, 2.0], [3.0, 4.5]]
+
+
+def test_openai_embedding_response_base64() -> None:
+    """Tests decoding a response with base64 encoded float32 embeddings."""
+    vectors = np.array([[1.0, 2.0, 3.0], [-1.5, 0.0, 0.25]], dtype=np.float32)
+    response = _response(
+        [base64.b64encode(vector.tobytes()).decode("ascii") for vector in vectors]
+    )
+    array = response.embeddings_array
+    assert array.dtype == np.float32 and array.shape == (2, 3)
+    np.testing.assert_array_equal(array, vectors)
+    assert response.embeddings_array is array
+    assert response.embeddings == vectors.tolist()
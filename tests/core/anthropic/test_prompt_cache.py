@@ -0,0 +1,231 @@
+"""Tests the `anthropic.prompt_cache` module."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from anthropic.types import Message, TextBlock, Usage
+
+from mirascope.core.anthropic._utils._setup_call import setup_call
+from mirascope.core.anthropic.prompt_cache import (
+    AnthropicPromptCache,
+    PromptCacheStats,
+)
+
+_LONG = "x" * 5000
+_EPHEMERAL = {"type": "ephemeral"}
+
+
+def _call_kwargs(*user_messages: str) -> dict:
+    messages = []
+    for i, content in enumerate(user_messages):
+        if i:
+            messages.append({"role": "assistant", "content": "ok"})
+        messages.append({"role": "user", "content": content})
+    return {
+        "tools": [{"name": "a", "input_schema": {}}, {"name": "b", "input_schema": {}}],
+        "system": _LONG,
+        "messages": messages,
+    }
+
+
+def _breakpoints(call_kwargs: dict) -> list:
+    locations = [
+        ("tools", i)
+        for i, tool in enumerate(call_kwargs["tools"])
+        if "cache_control" in tool
+    ]
+    system = call_kwargs["system"]
+    if isinstance(system, list):
+        locations += [
+            ("system", i) for i, block in enumerate(system) if "cache_control" in block
+        ]
+    for i, message in enumerate(call_kwargs["messages"]):
+        if isinstance(message["content"], list):
+            locations += [
+                ("messages", i, j)
+                for j, block in enumerate(message["content"])
+                if "cache_control" in block
+            ]
+    return locations
+
+
+def test_place_breakpoints_stable_prefix() -> None:
+    """Tests placing breakpoints on the prefix shared with the previous call."""
+    cache = AnthropicPromptCache()
+    first = _call_kwargs("question 1")
+    assert cache.place_breakpoints("fn", "claude-3-5-sonnet", first) == 0
+    assert _breakpoints(first) == []
+
+    second = _call_kwargs("question 2")
+    assert cache.place_breakpoints("fn", "claude-3-5-sonnet", second) == 3
+    # The tools alone are too short to be cached.
+    assert _breakpoints(second) == [("system", 0)]
+    assert second["system"] == [
+        {"type": "text", "text": _LONG, "cache_control": _EPHEMERAL}
+    ]
+    assert _call_kwargs("question 2")["system"] == _LONG
+
+
+def test_place_breakpoints_conversation() -> None:
+    """Tests caching the shared history and the full request of a conversation."""
+    cache = AnthropicPromptCache()
+    cache.place_breakpoints("fn", "claude-3-5-sonnet", _call_kwargs(_LONG))
+    original_message = {"role": "user", "content": _LONG}
+    call_kwargs = _call_kwargs(_LONG, "follow up")
+    call_kwargs["messages"][0] = original_message
+    messages = call_kwargs["messages"]
+    assert cache.place_breakpoints("fn", "claude-3-5-sonnet", call_kwargs) == 4
+    assert _breakpoints(call_kwargs) == [
+        ("system", 0),
+        ("messages", 0, 0),
+        ("messages", 2, 0),
+    ]
+    assert original_message == {"role": "user", "content": _LONG}
+    assert call_kwargs["messages"] is not messages
+    assert "cache_control" not in repr(messages)
+
+
+def test_place_breakpoints_limits() -> None:
+    """Tests respecting existing breakpoints and the minimum cacheable length."""
+    cache = AnthropicPromptCache()
+    call_kwargs = _call_kwargs(_LONG, "follow up")
+    call_kwargs["tools"][0]["cache_control"] = _EPHEMERAL
+    call_kwargs["messages"][2]["content"] = [
+        {"type": "text", "text": "follow up", "cache_control": _EPHEMERAL}
+    ]
+    cache.place_breakpoints("fn", "claude-3-5-sonnet", _call_kwargs(_LONG))
+    cache.place_breakpoints("fn", "claude-3-5-sonnet", call_kwargs)
+    assert _breakpoints(call_kwargs) == [
+        ("tools", 0),
+        ("system", 0),
+        ("messages", 0, 0),
+        ("messages", 2, 0),
+    ]
+    call_kwargs["messages"][1]["content"] = [
+        {"type": "text", "text": "ok", "cache_control": _EPHEMERAL}
+    ]
+    call_kwargs["system"] = _LONG
+    call_kwargs["messages"][0]["content"] = _LONG
+    cache.place_breakpoints("fn", "claude-3-5-sonnet", call_kwargs)
+    # Only one breakpoint is left since the end of the shared history already has one.
+    assert _breakpoints(call_kwargs) == [
+        ("tools", 0),
+        ("system", 0),
+        ("messages", 1, 0),
+        ("messages", 2, 0),
+    ]
+
+    cache.reset()
+    short = {
+        "tools": [],
+        "system": "short",
+        "messages": [{"role": "user", "content": "hi"}],
+    }
+    cache.place_breakpoints("fn", "claude-3-5-haiku", dict(short))
+    call_kwargs = dict(short)
+    cache.place_breakpoints("fn", "claude-3-5-haiku", call_kwargs)
+    assert call_kwargs["system"] == "short"
+
+
+def test_record_and_stats() -> None:
+    """Tests recording cache usage and computing hit rates."""
+    cache = AnthropicPromptCache()
+    assert PromptCacheStats().hit_rate == 0.0
+    cache.record(
+        "fn",
+        Usage.model_validate(
+            {
+                "input_tokens": 10,
+                "output_tokens": 1,
+                "cache_read_input_tokens": 60,
+                "cache_creation_input_tokens": 30,
+            }
+        ),
+    )
+    cache.record("fn", Usage(input_tokens=100, output_tokens=1))
+    stats = cache.stats()["fn"]
+    assert stats == PromptCacheStats(
+        calls=2, input_tokens=110, cache_read_tokens=60, cache_creation_tokens=30
+    )
+    assert stats.hit_rate == 0.3
+    cache.enable()
+    assert cache.enabled
+    cache.disable()
+    assert not cache.enabled
+
+
+def _message() -> Message:
+    return Message(
+        id="id",
+        content=[TextBlock(type="text", text="hi")],
+        model="claude-3-5-sonnet",
+        role="assistant",
+        stop_reason="end_turn",
+        stop_sequence=None,
+        type="message",
+        usage=Usage.model_validate(
+            {"input_tokens": 1, "output_tokens": 1, "cache_read_input_tokens": 3}
+        ),
+    )
+
+
+def test_wrap_create() -> None:
+    """Tests recording usage from responses and streams."""
+    cache = AnthropicPromptCache()
+    message = _message()
+    create = cache.wrap_create("fn", MagicMock(return_value=message), False)
+    assert create(stream=False) == message
+    events = [MagicMock(type="message_start", message=message), MagicMock(type="ping")]
+    create = cache.wrap_create("fn", MagicMock(return_value=iter(events)), False)
+    assert list(create(stream=True)) == events
+    assert cache.stats()["fn"].cache_read_tokens == 6
+
+
+@pytest.mark.asyncio
+async def test_wrap_create_async() -> None:
+    """Tests recording usage from async responses and streams."""
+    cache = AnthropicPromptCache()
+    message = _message()
+    create = cache.wrap_create("fn", AsyncMock(return_value=message), True)
+    assert await create(stream=False) == message
+
+    async def stream():
+        yield MagicMock(type="message_start", message=message)
+
+    create = cache.wrap_create("fn", AsyncMock(return_value=stream()), True)
+    assert len([event async for event in await create(stream=True)]) == 1
+    assert cache.stats()["fn"].cache_read_tokens == 6
+
+
+@patch("mirascope.core.anthropic._utils._setup_call.prompt_cache")
+@patch("mirascope.core.anthropic._utils._setup_call._utils", new_callable=MagicMock)
+def test_setup_call_places_breakpoints(
+    mock_utils: MagicMock, mock_prompt_cache: MagicMock
+) -> None:
+    """Tests that `setup_call` places breakpoints when the prompt cache is enabled."""
+    mock_utils.setup_call.return_value = [
+        None,
+        [{"role": "user", "content": "hi"}],
+        None,
+        {"max_tokens": 1000},
+    ]
+    mock_prompt_cache.enabled = True
+
+    def fn() -> None: ...
+
+    create, _, _, _, call_kwargs = setup_call(
+        model="claude-3-5-sonnet-20240620",
+        client=None,
+        fn=fn,
+        fn_args={},
+        dynamic_config=None,
+        tools=None,
+        json_mode=False,
+        call_params={"max_tokens": 1000},
+        response_model=None,
+        stream=False,
+    )
+    mock_prompt_cache.place_breakpoints.assert_called_once_with(
+        "fn", "claude-3-5-sonnet-20240620", call_kwargs
+    )
+    assert create == mock_prompt_cache.wrap_create.return_value
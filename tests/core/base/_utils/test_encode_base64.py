@@ -0,0 +1,32 @@
+"""Tests the `_utils.encode_base64` function."""
+
+import base64
+from unittest.mock import patch
+
+from mirascope.core.base._utils import _encode_base64
+from mirascope.core.base._utils._encode_base64 import encode_base64
+
+
+def test_encode_base64() -> None:
+    """Tests that encodings are correct and cached by content."""
+    data = b"image data"
+    expected = base64.b64encode(data).decode("utf-8")
+    assert encode_base64(data) == expected
+    with patch("base64.b64encode") as mock_b64encode:
+        assert encode_base64(b"image " + b"data") == expected
+        mock_b64encode.assert_not_called()
+    assert encode_base64(bytearray(data)) == expected
+    assert encode_base64(memoryview(data)) == expected
+
+
+def test_encode_base64_eviction() -> None:
+    """Tests that the least recently used encodings are evicted."""
+    with patch.object(_encode_base64, "_MAX_CACHE_BYTES", 20):
+        _encode_base64._cache.clear()
+        _encode_base64._cache_bytes = 0
+        encode_base64(b"aaaaaa")  # 6 bytes + 8 encoded
+        encode_base64(b"bbbbbb")
+        assert list(_encode_base64._cache) == [b"bbbbbb"]
+        encode_base64(b"c" * 30)
+        assert list(_encode_base64._cache) == [b"bbbbbb"]
+        assert _encode_base64._cache_bytes == 14
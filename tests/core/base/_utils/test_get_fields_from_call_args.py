@@ -1,10 +1,13 @@
 from typing import Annotated
+from unittest.mock import MagicMock
 
 import pytest
 from pydantic import BaseModel
 
 from mirascope.core.base._utils._get_fields_from_call_args import (
+    check_fields_from_call_args,
     get_fields_from_call_args,
+    get_fields_from_fn_args,
 )
 from mirascope.core.base.from_call_args import FromCallArgs
 
@@ -115,3 +118,34 @@ def test_get_fields_from_call_args_built_in():
 
     result = get_fields_from_call_args(list[str], dummy_fn, (10,), {})
     assert result == {}
+
+
+def test_get_fields_from_fn_args():
+    class ResponseModel(BaseModel):
+        field1: Annotated[int, FromCallArgs()]
+        field2: str
+
+    assert get_fields_from_fn_args(ResponseModel, {"field1": 1, "x": 2}) == {
+        "field1": 1
+    }
+    assert get_fields_from_fn_args(MagicMock, MagicMock()) == {}
+    with pytest.raises(ValueError):
+        get_fields_from_fn_args(ResponseModel, {"x": 2})
+
+
+def test_check_fields_from_call_args():
+    class ResponseModel(BaseModel):
+        field1: Annotated[int, FromCallArgs()]
+        field2: str
+
+    def fn(field1, field2): ...
+
+    def fn_kwargs(**kwargs): ...
+
+    def fn_missing(field2): ...
+
+    check_fields_from_call_args(ResponseModel, fn)
+    check_fields_from_call_args(ResponseModel, fn_kwargs)
+    check_fields_from_call_args(list[str], fn_missing)
+    with pytest.raises(ValueError, match="marked with `FromCallArgs`"):
+        check_fields_from_call_args(ResponseModel, fn_missing)
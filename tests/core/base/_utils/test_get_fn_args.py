@@ -1,6 +1,8 @@
 """Tests the `_utils.get_fn_args` module."""
 
-from mirascope.core.base._utils._get_fn_args import get_fn_args
+import pytest
+
+from mirascope.core.base._utils._get_fn_args import _binders, get_fn_args
 
 
 def test_get_fn_args() -> None:
@@ -45,3 +47,39 @@ def test_get_fn_args() -> None:
         "d": {"5": "6"},
         "e": 7,
     }
+
+
+def test_get_fn_args_parameter_kinds() -> None:
+    """Tests binding defaults, variadic, positional-only and keyword-only params."""
+
+    def fn(a, /, b=2, *args, c, d=4, **kwargs) -> None:
+        """Dummy fn."""
+
+    assert get_fn_args(fn, (1, 3, 5), {"c": 6, "e": 7}) == {
+        "a": 1,
+        "b": 3,
+        "args": (5,),
+        "c": 6,
+        "d": 4,
+        "e": 7,
+    }
+    assert list(get_fn_args(fn, (1,), {})) == ["a", "b", "args", "d"]
+    assert _binders[fn].defaults == {"b": 2, "d": 4}
+
+    def no_kwargs_fn(a, b) -> None:
+        """Dummy fn."""
+
+    with pytest.raises(TypeError):
+        get_fn_args(no_kwargs_fn, (1, 2, 3), {})
+    with pytest.raises(TypeError):
+        get_fn_args(no_kwargs_fn, (1,), {"a": 1})
+    with pytest.raises(TypeError):
+        get_fn_args(no_kwargs_fn, (), {"c": 1})
+
+    class Callable:
+        __hash__ = None  # pyright: ignore [reportAssignmentType]
+
+        def __call__(self, a: int) -> None:
+            """Dummy call."""
+
+    assert get_fn_args(Callable(), (1,), {}) == {"a": 1}
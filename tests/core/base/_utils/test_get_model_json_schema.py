@@ -0,0 +1,50 @@
+"""Tests the `_utils.get_model_json_schema` module."""
+
+from unittest.mock import patch
+
+from pydantic import BaseModel
+from pydantic.json_schema import model_json_schema
+
+from mirascope.core.base._utils._get_model_json_schema import (
+    copy_json,
+    get_model_json_schema,
+)
+from mirascope.core.base.tool import GenerateJsonSchemaNoTitles
+from mirascope.core.openai.tool import GenerateOpenAIStrictToolJsonSchema
+
+
+def test_copy_json() -> None:
+    """Tests that `copy_json` deep copies dicts and lists."""
+    value = {"a": [{"b": 1}], "c": "d"}
+    copy = copy_json(value)
+    assert copy == value
+    assert copy["a"] is not value["a"]
+    assert copy["a"][0] is not value["a"][0]
+
+
+def test_get_model_json_schema() -> None:
+    """Tests that schemas are generated once per model and schema generator."""
+
+    class Book(BaseModel):
+        title: str
+
+    with patch(
+        "mirascope.core.base._utils._get_model_json_schema.model_json_schema",
+        wraps=model_json_schema,
+    ) as mock_model_json_schema:
+        schema = get_model_json_schema(Book, GenerateJsonSchemaNoTitles)
+        assert schema == {
+            "properties": {"title": {"type": "string"}},
+            "required": ["title"],
+            "type": "object",
+        }
+        schema["properties"]["title"]["type"] = "integer"
+        assert get_model_json_schema(Book, GenerateJsonSchemaNoTitles) == {
+            "properties": {"title": {"type": "string"}},
+            "required": ["title"],
+            "type": "object",
+        }
+        assert mock_model_json_schema.call_count == 1
+        strict_schema = get_model_json_schema(Book, GenerateOpenAIStrictToolJsonSchema)
+        assert strict_schema["additionalProperties"] is False
+        assert mock_model_json_schema.call_count == 2
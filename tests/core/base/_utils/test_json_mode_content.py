@@ -1,5 +1,7 @@
 """Tests the `_utils.json_mode_content` module."""
 
+from unittest.mock import patch
+
 from mirascope.core.base._utils._json_mode_content import json_mode_content
 from mirascope.core.base.tool import BaseTool
 
@@ -31,3 +33,15 @@ For your final response, output ONLY a valid JSON dict (NOT THE SCHEMA) from the
   "type": "object"
 }"""
     )
+
+
+def test_json_mode_content_cached() -> None:
+    """Tests that the content is generated once per tool type."""
+
+    class Book(BaseTool):
+        title: str
+
+    content = json_mode_content(Book)
+    with patch.object(Book, "model_json_schema") as mock_model_json_schema:
+        assert json_mode_content(Book) == content
+        mock_model_json_schema.assert_not_called()
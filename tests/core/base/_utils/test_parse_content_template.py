@@ -6,7 +6,12 @@ from unittest.mock import MagicMock, patch
 import pytest
 from PIL import Image
 
-from mirascope.core.base._utils._parse_content_template import parse_content_template
+from mirascope.core.base._utils._parse_content_template import (
+    _cleanup_text_preserve_newlines,
+    parse_content_template,
+    prefetch_media_urls,
+)
+from mirascope.core.base.media_cache import media_cache
 from mirascope.core.base.message_param import (
     AudioPart,
     AudioURLPart,
@@ -38,6 +43,39 @@ def mock_jpeg_bytes() -> bytes:
     return b"\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00\xff\xdb\x00C\x00\x08\x06\x06\x07\x06\x05\x08\x07\x07\x07\t\t\x08\n\x0c\x14\r\x0c\x0b\x0b\x0c\x19\x12\x13\x0f\x14\x1d\x1a\x1f\x1e\x1d\x1a\x1c\x1c $.' \",#\x1c\x1c(7),01444\x1f'9=82<.342\xff\xc0\x00\x0b\x08\x00\x01\x00\x01\x01\x01\x11\x00\xff\xc4\x00\x1f\x00\x00\x01\x05\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\xff\xc4\x00\xb5\x10\x00\x02\x01\x03\x03\x02\x04\x03\x05\x05\x04\x04\x00\x00\x01}\x01\x02\x03\x00\x04\x11\x05\x12!1A\x06\x13Qa\x07\"q\x142\x81\x91\xa1\x08#B\xb1\xc1\x15R\xd1\xf0$3br\x82\t\n\x16\x17\x18\x19\x1a%&'()*456789:CDEFGHIJSTUVWXYZcdefghijstuvwxyz\x83\x84\x85\x86\x87\x88\x89\x8a\x92\x93\x94\x95\x96\x97\x98\x99\x9a\xa2\xa3\xa4\xa5\xa6\xa7\xa8\xa9\xaa\xb2\xb3\xb4\xb5\xb6\xb7\xb8\xb9\xba\xc2\xc3\xc4\xc5\xc6\xc7\xc8\xc9\xca\xd2\xd3\xd4\xd5\xd6\xd7\xd8\xd9\xda\xe1\xe2\xe3\xe4\xe5\xe6\xe7\xe8\xe9\xea\xf1\xf2\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\xff\xda\x00\x08\x01\x01\x00\x00?\x00\xf9\xfe\xbf\xff\xd9"
 
 
+def test_prefetch_media_urls() -> None:
+    """Tests that the remote media URLs of all messages are downloaded at once."""
+    messages = [
+        BaseMessageParam(role="system", content="system"),
+        BaseMessageParam(
+            role="user",
+            content=[
+                ImageURLPart(type="image_url", url="https://a.png", detail=None),
+                AudioURLPart(type="audio_url", url="https://a.wav"),
+                ImageURLPart(type="image_url", url="gs://b.png", detail=None),
+            ],
+        ),
+        BaseMessageParam(
+            role="user",
+            content=[ImageURLPart(type="image_url", url="https://c.png", detail=None)],
+        ),
+    ]
+    with patch.object(media_cache, "load_many") as mock_load_many:
+        prefetch_media_urls(messages)
+        mock_load_many.assert_called_once_with(
+            ["https://a.png", "https://a.wav", "https://c.png"]
+        )
+        mock_load_many.reset_mock()
+        prefetch_media_urls(messages, ("image_url",))
+        mock_load_many.assert_called_once_with(["https://a.png", "https://c.png"])
+        mock_load_many.reset_mock()
+        prefetch_media_urls(messages, include=lambda url: "c.png" not in url)
+        mock_load_many.assert_called_once_with(["https://a.png", "https://a.wav"])
+        mock_load_many.reset_mock()
+        prefetch_media_urls(messages, ("audio_url",))
+        mock_load_many.assert_not_called()
+
+
 @patch(
     "mirascope.core.base._utils._parse_content_template.open", new_callable=MagicMock
 )
@@ -323,7 +361,9 @@ def test_parse_content_template_document(
             ),
         ],
     )
-    assert parse_content_template("user", template, {"url": "https://"}) == expected
+    with patch.object(media_cache, "_fetch", return_value=document_data):
+        assert parse_content_template("user", template, {"url": "https://"}) == expected
+    media_cache.clear()
     assert parse_content_template("user", template, {"url": "./doc.pdf"}) == expected
     assert parse_content_template("user", template, {"url": document_data}) == expected
 
@@ -345,10 +385,15 @@ def test_parse_content_template_document(
             ),
         ],
     )
-    assert (
-        parse_content_template("user", template, {"urls": ["https://", "https://."]})
-        == expected
-    )
+    with patch.object(media_cache, "_fetch", return_value=document_data) as mock_fetch:
+        assert (
+            parse_content_template(
+                "user", template, {"urls": ["https://", "https://."]}
+            )
+            == expected
+        )
+        assert mock_fetch.call_count == 2
+    media_cache.clear()
     assert (
         parse_content_template("user", template, {"urls": ["./doc.pdf", "./doc.pdf"]})
         == expected
@@ -448,3 +493,12 @@ def test_parse_content_template_part(
         match="When using 'part' template, 'content' must be a valid content part.",
     ):
         parse_content_template("user", template, {"content": "not a part"})
+
+
+@pytest.mark.parametrize("repeat", [1, 1000])
+def test_cleanup_text_preserve_newlines(repeat: int) -> None:
+    """Tests cleaning up short (cached) and long template text segments."""
+    text = " \tfirst\u200b line \t\r\n\u3000second\ufeff\n  a \r b  \n" * repeat
+    expected = "first line \t\nsecond\nab  \n" * repeat
+    assert _cleanup_text_preserve_newlines(text) == expected
+    assert _cleanup_text_preserve_newlines(text) == expected
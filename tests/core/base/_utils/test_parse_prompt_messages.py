@@ -5,7 +5,10 @@ from unittest.mock import MagicMock, call, patch
 import pytest
 
 from mirascope.core.base import TextPart
-from mirascope.core.base._utils._parse_prompt_messages import parse_prompt_messages
+from mirascope.core.base._utils._parse_prompt_messages import (
+    _tokenize_roles,
+    parse_prompt_messages,
+)
 
 
 @patch(
@@ -113,3 +116,21 @@ def test_parse_prompt_messages_preserves_internal_newlines() -> None:
     assert user_message.content == expected_text, (
         f"Expected:\n{repr(expected_text)}\nGot:\n{repr(user_message.content)}"
     )
+
+
+@pytest.mark.parametrize(
+    "template,expected",
+    [
+        ("no roles", []),
+        (
+            "ignored SYSTEM: a\nb USER:c ASSISTANT: d",
+            [("system", " a\nb "), ("user", "c "), ("assistant", " d")],
+        ),
+        ("SYSTEM:USER: a", [("system", "USER: a")]),
+        ("SYSTEM: a USER:", [("system", " a ")]),
+        ("XUSER: a MESSAGES: {history}", [("user", " a "), ("messages", " {history}")]),
+    ],
+)
+def test_tokenize_roles(template: str, expected: list[tuple[str, str]]) -> None:
+    """Tests splitting a template into its role sections."""
+    assert list(_tokenize_roles(["system", "user", "assistant"], template)) == expected
@@ -0,0 +1,113 @@
+"""Tests the `_utils.prepare_image` function."""
+
+from io import BytesIO
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+
+from mirascope.core.base._utils import _prepare_image
+from mirascope.core.base._utils._parse_content_template import parse_content_template
+from mirascope.core.base._utils._prepare_image import (
+    ImagePreparationConfig,
+    get_image_preparation_config,
+    prepare_image,
+)
+from mirascope.core.base.message_param import ImagePart, ImageURLPart
+
+
+def _image_bytes(
+    size: tuple[int, int], mode: str = "RGB", format: str = "PNG"
+) -> bytes:
+    image = Image.new(mode, size)
+    output = BytesIO()
+    image.save(output, format=format)
+    return output.getvalue()
+
+
+def test_get_image_preparation_config() -> None:
+    """Tests building the image preparation config from template options."""
+    assert get_image_preparation_config(None) is None
+    assert get_image_preparation_config({"detail": "low"}) is None
+    assert get_image_preparation_config({"resize": "anthropic", "quality": "70"}) == {
+        "max_size": 1568,
+        "max_pixels": 1_150_000,
+        "quality": 70,
+    }
+    assert get_image_preparation_config({"max_size": "512"}) == {"max_size": 512}
+    with pytest.raises(ValueError, match="Unknown image preparation preset: unknown"):
+        get_image_preparation_config({"resize": "unknown"})
+
+
+@pytest.mark.parametrize(
+    "config,size,expected_size",
+    [
+        ({"max_size": 1000}, (4000, 3000), (1000, 750)),
+        ({"max_short_side": 768}, (4000, 3000), (1024, 768)),
+        ({"max_pixels": 10_000}, (400, 100), (200, 50)),
+        ({"max_size": 1000}, (500, 500), (500, 500)),
+    ],
+)
+def test_prepare_image_resize(
+    config: ImagePreparationConfig,
+    size: tuple[int, int],
+    expected_size: tuple[int, int],
+) -> None:
+    """Tests that images are downscaled to fit the configured limits."""
+    prepared, media_type = prepare_image(_image_bytes(size), config)
+    with Image.open(BytesIO(prepared)) as image:
+        assert image.size == expected_size
+        assert media_type == f"image/{image.format.lower()}"  # pyright: ignore [reportOptionalMemberAccess]
+
+
+def test_prepare_image_formats() -> None:
+    """Tests recompressing opaque images as JPEG and transparent ones as PNG."""
+    prepared, media_type = prepare_image(_image_bytes((2000, 2000)), {"max_size": 10})
+    assert media_type == "image/jpeg"
+    prepared, media_type = prepare_image(
+        _image_bytes((2000, 2000), "RGBA"), {"max_size": 10}
+    )
+    assert media_type == "image/png"
+    data = _image_bytes((1, 1))
+    assert prepare_image(data, {"max_size": 10}) == (data, "image/png")
+
+
+def test_prepare_image_cache() -> None:
+    """Tests that prepared images are cached by content and config."""
+    data = _image_bytes((2000, 1000))
+    with patch.object(
+        _prepare_image, "_prepare", wraps=_prepare_image._prepare
+    ) as mock_prepare:
+        first = prepare_image(data, {"max_size": 100})
+        assert prepare_image(bytes(data), {"max_size": 100}) == first
+        prepare_image(data, {"max_size": 50})
+        assert mock_prepare.call_count == 2
+
+
+def test_parse_content_template_prepares_images() -> None:
+    """Tests that image templates opt into preparation through their options."""
+    data = _image_bytes((3000, 2000))
+    message = parse_content_template(
+        "user", "{image:image(resize=openai,detail=high)}", {"image": data}
+    )
+    assert message is not None and isinstance(message.content, list)
+    part = message.content[0]
+    assert isinstance(part, ImagePart)
+    assert (part.media_type, part.detail) == ("image/jpeg", "high")
+    with Image.open(BytesIO(part.image)) as image:
+        assert image.size == (1152, 768)
+
+    with patch(
+        "mirascope.core.base._utils._parse_content_template._load_media",
+        return_value=data,
+    ):
+        message = parse_content_template(
+            "user", "{url:image(max_size=100)}", {"url": "https://example.com/a.png"}
+        )
+    assert message is not None and isinstance(message.content, list)
+    assert isinstance(message.content[0], ImagePart)
+    message = parse_content_template(
+        "user", "{url:image(max_size=100)}", {"url": "gs://bucket/a.png"}
+    )
+    assert message is not None and isinstance(message.content, list)
+    assert isinstance(message.content[0], ImageURLPart)
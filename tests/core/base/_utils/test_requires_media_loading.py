@@ -0,0 +1,38 @@
+"""Tests the `_utils.requires_media_loading` function."""
+
+from mirascope.core.base._utils._requires_media_loading import requires_media_loading
+from mirascope.core.base.message_param import (
+    BaseMessageParam,
+    ImageURLPart,
+    TextPart,
+)
+from mirascope.core.base.prompt import prompt_template
+
+
+def test_requires_media_loading() -> None:
+    """Tests checking whether setting up a call may load media."""
+
+    @prompt_template("Describe {image:image(detail=low)}")
+    def media_fn(image: str) -> None: ...
+
+    @prompt_template("Recommend a {genre} book")
+    def text_fn(genre: str) -> None: ...
+
+    def no_template_fn() -> None: ...
+
+    assert requires_media_loading(media_fn, None)
+    assert not requires_media_loading(text_fn, None)
+    assert not requires_media_loading(no_template_fn, None)
+
+    url_messages = [
+        BaseMessageParam(
+            role="user",
+            content=[ImageURLPart(type="image_url", url="https://", detail=None)],
+        )
+    ]
+    text_messages = [
+        BaseMessageParam(role="user", content="Hi"),
+        BaseMessageParam(role="user", content=[TextPart(type="text", text="Hi")]),
+    ]
+    assert requires_media_loading(text_fn, {"messages": url_messages})
+    assert not requires_media_loading(media_fn, {"messages": text_messages})
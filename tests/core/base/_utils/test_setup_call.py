@@ -307,3 +307,58 @@ def test_setup_call_with_empty_common_params() -> None:
     ]
     assert tool_types is None
     assert call_kwargs == {}
+
+
+def test_setup_call_canonical() -> None:
+    """Tests that `setup_call` orders tools and schemas when canonicalizing."""
+    from mirascope.core.base.canonicalization import request_canonicalizer
+
+    class SchemaTool(BaseTool):
+        @classmethod
+        def tool_schema(cls) -> dict:
+            return {"name": cls._name(), "parameters": cls.model_json_schema()}
+
+    class ZTool(SchemaTool):
+        """Z tool."""
+
+        b: str
+        a: str
+
+    class ATool(SchemaTool):
+        """A tool."""
+
+    @prompt_template("Recommend a {genre} book.")
+    def fn(genre: str) -> None: ...  # pragma: no cover
+
+    def convert_common_call_params(
+        common_params: CommonCallParams,
+    ) -> BaseCallParams: ...
+
+    request_canonicalizer.reset()
+    request_canonicalizer.enable()
+    try:
+        for genre in ["fantasy", "mystery"]:
+            _, _, tool_types, call_kwargs = setup_call(
+                fn,
+                {"genre": genre},
+                None,
+                [ZTool, ATool],
+                SchemaTool,
+                {"arg": "value"},  # type: ignore
+                convert_common_call_params,  # pyright: ignore [reportArgumentType]
+            )
+            assert [tool_type._name() for tool_type in tool_types or []] == [
+                "ZTool",
+                "ATool",
+            ]
+            tools = call_kwargs.get("tools") or []
+            assert [tool["name"] for tool in tools] == ["ATool", "ZTool"]
+            assert tools[1]["parameters"]["required"] == ["a", "b"]
+            assert list(tools[1]["parameters"]["properties"]) == [
+                "a",
+                "b",
+            ]
+        assert (request_canonicalizer.stable_prefix_length("fn") or 0) > 0
+    finally:
+        request_canonicalizer.disable()
+        request_canonicalizer.reset()
@@ -0,0 +1,84 @@
+"""Tests the `canonicalization` module."""
+
+from collections.abc import Generator
+
+import pytest
+
+from mirascope.core.base import BaseMessageParam
+from mirascope.core.base._utils._json_mode_content import json_mode_content
+from mirascope.core.base.canonicalization import (
+    RequestCanonicalizer,
+    _common_prefix_length,
+    canonicalize,
+    request_canonicalizer,
+)
+from mirascope.core.base.tool import BaseTool
+
+
+@pytest.fixture()
+def enabled_canonicalizer() -> Generator[RequestCanonicalizer, None, None]:
+    """Enables the shared canonicalizer for the duration of a test."""
+    request_canonicalizer.reset()
+    request_canonicalizer.enable()
+    yield request_canonicalizer
+    request_canonicalizer.disable()
+    request_canonicalizer.reset()
+
+
+def test_canonicalize() -> None:
+    """Tests that keys and `required` lists are sorted but other lists are not."""
+    schema = {
+        "type": "object",
+        "required": ["b", "a"],
+        "properties": {"b": {"enum": ["z", "y"]}, "a": {"type": "string"}},
+        "anyOf": [{"type": "string"}, {"required": [1, 0]}],
+    }
+    canonical = canonicalize(schema)
+    assert list(canonical) == ["anyOf", "properties", "required", "type"]
+    assert list(canonical["properties"]) == ["a", "b"]
+    assert canonical["required"] == ["a", "b"]
+    assert canonical["properties"]["b"]["enum"] == ["z", "y"]
+    assert canonical["anyOf"][1]["required"] == [1, 0]
+    assert schema["required"] == ["b", "a"]
+
+
+def test_common_prefix_length() -> None:
+    """Tests the common prefix length of two strings."""
+    assert _common_prefix_length("", "abc") == 0
+    assert _common_prefix_length("abc", "abc") == 3
+    assert _common_prefix_length("abcd", "abxd") == 2
+    assert _common_prefix_length("ab", "abcd") == 2
+
+
+def test_request_canonicalizer_record() -> None:
+    """Tests recording the stable prefix length per function."""
+    canonicalizer = RequestCanonicalizer()
+    assert not canonicalizer.enabled
+    canonicalizer.enable()
+    assert canonicalizer.enabled
+    canonicalizer.disable()
+    assert not canonicalizer.enabled
+
+    system = BaseMessageParam(role="system", content="instructions")
+    tools = [{"name": "tool", "parameters": {}}]
+    assert canonicalizer.stable_prefix_length("fn") is None
+    assert canonicalizer.record("fn", tools, [system, {"image": b"\x00"}]) == 0
+    length = canonicalizer.record("fn", tools, [system, {"image": b"\x01"}])
+    assert 0 < length == canonicalizer.stable_prefix_length("fn")
+    assert canonicalizer.record("other", None, []) == 0
+    canonicalizer.reset()
+    assert canonicalizer.stable_prefix_length("fn") is None
+
+
+def test_json_mode_content_canonical(
+    enabled_canonicalizer: RequestCanonicalizer,
+) -> None:
+    """Tests that JSON mode content sorts the schema keys when enabled."""
+
+    class Book(BaseTool):
+        title: str
+        author: str
+
+    content = json_mode_content(Book)
+    assert content.index('"author"') < content.index('"title"')
+    assert content.index('"properties"') < content.index('"required"')
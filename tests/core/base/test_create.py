@@ -1,5 +1,6 @@
 """Tests the internal `_create` module."""
 
+import threading
 from functools import partial
 from typing import TypeVar, cast
 from unittest.mock import MagicMock, patch
@@ -324,3 +325,28 @@ async def test_create_factory_async_dynamic_config_cases(
     )
     # Other asserts as in previous test
     mock_create.assert_called_once_with(stream=False, **mock_call_kwargs)
+
+
+@patch("mirascope.core.base._create.requires_media_loading", return_value=True)
+@pytest.mark.asyncio
+async def test_create_factory_async_media_setup_off_loop(
+    mock_requires_media_loading: MagicMock,
+    mock_setup_call_async: MagicMock,
+    mock_create_decorator_kwargs: dict,
+) -> None:
+    """Tests that async calls that load media are set up off the event loop."""
+    setup_thread_ids = []
+    mock_setup_call_async.side_effect = lambda **kwargs: (
+        setup_thread_ids.append(threading.get_ident())
+        or mock_setup_call_async.return_value
+    )
+    decorator = partial(
+        create_factory(TCallResponse=MagicMock, setup_call=mock_setup_call_async),
+        **mock_create_decorator_kwargs,
+    )
+
+    async def fn(image: str) -> None: ...
+
+    await decorator(fn)("https://example.com/image.png")  # pyright: ignore [reportCallIssue]
+    assert setup_thread_ids
+    assert setup_thread_ids[0] != threading.get_ident()
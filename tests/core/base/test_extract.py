@@ -90,6 +90,8 @@ def test_extract_factory_sync(
         {},
     )
     assert output == mock_extract_tool_return.return_value
+    decorated_fn(genre="mystery", topic="detectives")  # type: ignore
+    mock_create_decorator.assert_called_once()
 
     mock_extract_tool_return.side_effect = ValidationError.from_exception_data(
         title="", line_errors=[], input_type="json"
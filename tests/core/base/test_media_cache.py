@@ -0,0 +1,163 @@
+"""Tests the `media_cache` module."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from mirascope.core.base.media_cache import MediaCache
+
+
+def test_media_cache_load_local(tmp_path: Path) -> None:
+    """Tests that local sources are read directly without being cached."""
+    path = tmp_path / "image.png"
+    path.write_bytes(b"image")
+    cache = MediaCache()
+    with patch.object(cache, "_fetch") as mock_fetch:
+        assert cache.load(b"bytes") == b"bytes"
+        assert cache.load(str(path)) == b"image"
+        assert cache.load(path.as_uri()) == b"image"
+        assert cache.load("data:text/plain;base64,ZGF0YQ==") == b"data"
+        mock_fetch.assert_not_called()
+    assert cache._memory_bytes == 0
+
+
+def test_media_cache_load_remote() -> None:
+    """Tests that remote sources are downloaded once and content-addressed."""
+    cache = MediaCache()
+    with patch.object(cache, "_fetch", return_value=b"image") as mock_fetch:
+        assert cache.load("https://example.com/a.png") == b"image"
+        assert cache.load("https://example.com/a.png") == b"image"
+        assert cache.load("https://example.com/b.png") == b"image"
+        assert mock_fetch.call_count == 2
+    assert len(cache._blobs) == 1
+    assert cache._memory_bytes == len(b"image")
+    cache.clear()
+    assert cache._memory_bytes == 0
+
+
+def test_media_cache_memory_limit() -> None:
+    """Tests that the least recently used media is evicted from memory."""
+    cache = MediaCache(max_memory_bytes=10)
+    with patch.object(cache, "_fetch", side_effect=lambda url: url[-5:].encode()):
+        cache.load("https://example.com/aaaaa")
+        cache.load("https://example.com/bbbbb")
+        cache.load("https://example.com/aaaaa")
+        cache.load("https://example.com/ccccc")
+    assert list(cache._blobs.values()) == [b"aaaaa", b"ccccc"]
+    cache.configure(max_memory_bytes=5)
+    assert list(cache._blobs.values()) == [b"ccccc"]
+    with patch.object(cache, "_fetch", return_value=b"too large"):
+        cache.load("https://example.com/large")
+    assert list(cache._blobs.values()) == [b"ccccc"]
+
+
+def test_media_cache_disk(tmp_path: Path) -> None:
+    """Tests that downloads are persisted to and evicted from disk."""
+    cache = MediaCache(cache_dir=tmp_path, max_disk_bytes=10)
+    with patch.object(cache, "_fetch", side_effect=lambda url: url[-5:].encode()):
+        cache.load("https://example.com/aaaaa")
+        cache.load("https://example.com/bbbbb")
+
+    other_cache = MediaCache(cache_dir=tmp_path)
+    with patch.object(other_cache, "_fetch") as mock_fetch:
+        assert other_cache.load("https://example.com/aaaaa") == b"aaaaa"
+        mock_fetch.assert_not_called()
+
+    with patch.object(cache, "_fetch", return_value=b"ccccc"):
+        cache.load("https://example.com/ccccc")
+    blobs = [path for path in tmp_path.iterdir() if path.is_file()]
+    assert sorted(path.read_bytes() for path in blobs) == [b"aaaaa", b"ccccc"]
+
+
+def test_media_cache_env_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests setting the disk cache directory from the environment."""
+    monkeypatch.setenv("MIRASCOPE_MEDIA_CACHE_DIR", str(tmp_path))
+    assert MediaCache().cache_dir == tmp_path
+
+
+def test_media_cache_fetch() -> None:
+    """Tests that downloads reuse the pooled client."""
+    cache = MediaCache()
+    with patch("httpx.Client.get") as mock_get:
+        mock_get.return_value.content = b"image"
+        assert cache.load("https://example.com/a.png") == b"image"
+        assert cache.load("https://example.com/b.png") == b"image"
+        assert cache._get_client() is cache._get_client()
+        assert mock_get.call_count == 2
+
+
+def test_media_cache_load_many() -> None:
+    """Tests loading many sources concurrently."""
+    cache = MediaCache()
+    with patch.object(
+        cache, "_fetch", side_effect=lambda url: url.encode()
+    ) as mock_fetch:
+        assert cache.load_many(["https://a", b"bytes", "https://b", "https://a"]) == [
+            b"https://a",
+            b"bytes",
+            b"https://b",
+            b"https://a",
+        ]
+        assert mock_fetch.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_media_cache_load_async(tmp_path: Path) -> None:
+    """Tests loading sources without blocking the event loop."""
+    path = tmp_path / "audio.wav"
+    path.write_bytes(b"audio")
+    cache = MediaCache()
+    response = MagicMock(content=b"image")
+    with patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get:
+        mock_get.return_value = response
+        assert await cache.load_many_async(
+            ["https://example.com/a.png", str(path), "https://example.com/a.png"]
+        ) == [b"image", b"audio", b"image"]
+        assert await cache.load_async("https://example.com/a.png") == b"image"
+        assert mock_get.call_count <= 2
+    assert cache._get_async_client() is cache._async_clients[asyncio.get_running_loop()]
+
+
+def test_media_cache_load_many_large() -> None:
+    """Tests that media too large for memory is only downloaded once by `load_many`."""
+    cache = MediaCache(max_memory_bytes=1)
+    with patch.object(
+        cache, "_fetch", side_effect=lambda url: url.encode()
+    ) as mock_fetch:
+        assert cache.load_many(["https://a", "https://b", "https://a"]) == [
+            b"https://a",
+            b"https://b",
+            b"https://a",
+        ]
+        assert mock_fetch.call_count == 2
+
+
+def test_media_cache_disk_concurrent_writes(tmp_path: Path) -> None:
+    """Tests that threads writing the same media don't collide on temporary files."""
+    cache = MediaCache(cache_dir=tmp_path)
+    with patch.object(cache, "_fetch", return_value=b"image"):
+        cache.load_many([f"https://example.com/{i}.png" for i in range(32)])
+    assert [path.read_bytes() for path in tmp_path.iterdir() if path.is_file()] == [
+        b"image"
+    ]
+    assert len(list((tmp_path / "sources").iterdir())) == 32
+
+
+def test_media_cache_disk_eviction(tmp_path: Path) -> None:
+    """Tests that eviction skips in-flight writes and removes evicted sources."""
+    cache = MediaCache(cache_dir=tmp_path, max_disk_bytes=10)
+    in_flight = tmp_path / "digest.in-flight.tmp"
+    in_flight.write_bytes(b"x" * 100)
+    with patch.object(cache, "_fetch", side_effect=lambda url: url[-5:].encode()):
+        for i in range(8):
+            cache.load(f"https://example.com/{i}aaaa")
+    assert in_flight.exists()
+    assert sorted(path.name for path in tmp_path.iterdir() if path.is_file()) == sorted(
+        [
+            in_flight.name,
+            *(path.read_text() for path in (tmp_path / "sources").iterdir()),
+        ]
+    )
+    assert len(list((tmp_path / "sources").iterdir())) <= 2
@@ -0,0 +1,148 @@
+"""Tests for the `pricing` module."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from mirascope.core.base.pricing import PricingRegistry
+
+
+def test_pricing_registry_lookup() -> None:
+    """Tests exact and longest-prefix model lookups."""
+    registry = PricingRegistry()
+    registry.register(
+        "openai",
+        {
+            "gpt-4o": {"prompt": 1, "completion": 2},
+            "gpt-4o-mini": {"prompt": 3, "completion": 4},
+        },
+    )
+    assert registry.lookup("openai", "gpt-4o") == {"prompt": 1, "completion": 2}
+    assert registry.lookup("openai", "gpt-4o-2099-01-01") == {
+        "prompt": 1,
+        "completion": 2,
+    }
+    assert registry.lookup("openai", "gpt-4o-mini-2099-01-01") == {
+        "prompt": 3,
+        "completion": 4,
+    }
+    assert registry.lookup("openai", "gpt-4omni") is None
+    assert registry.lookup("openai", "unknown") is None
+    assert registry.lookup("anthropic", "gpt-4o") is None
+
+
+@pytest.mark.parametrize(
+    "model,prefix",
+    [
+        ("gpt-4o-2024-08-06", "gpt-4o"),
+        ("gpt-4-0613", "gpt-4"),
+        ("gemini-1.5-flash-002", "gemini-1.5-flash"),
+        ("claude-3-5-sonnet-20241022", "claude-3-5-sonnet"),
+        ("claude-3-5-sonnet@20240620", "claude-3-5-sonnet"),
+        ("claude-3-haiku-20240307-v1:0", "claude-3-haiku"),
+        ("claude-3-haiku-v1:0", "claude-3-haiku"),
+        ("mistral-large-latest", "mistral-large"),
+    ],
+)
+def test_pricing_registry_lookup_versioned_variants(model: str, prefix: str) -> None:
+    """Tests that dated and versioned variants resolve to their base model."""
+    registry = PricingRegistry()
+    registry.register("provider", {prefix: {"prompt": 1}})
+    assert registry.lookup("provider", model) == {"prompt": 1}
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        "o1-pro",
+        "o1-mini",
+        "gpt-4o-mini-tts",
+        "gpt-4o-audio-preview",
+        "gemini-2.0-flash-thinking-exp",
+        "gemini-2.0-flash-lite",
+        "gpt-4o-ft",
+    ],
+)
+def test_pricing_registry_lookup_distinct_models(model: str) -> None:
+    """Tests that distinct models sharing a prefix don't get each other's pricing."""
+    registry = PricingRegistry()
+    registry.register(
+        "provider",
+        {
+            "o1": {"prompt": 1},
+            "gpt-4o": {"prompt": 2},
+            "gpt-4o-mini": {"prompt": 3},
+            "gemini-2.0-flash": {"prompt": 4},
+        },
+    )
+    assert registry.lookup("provider", model) is None
+
+
+def test_pricing_registry_register_invalidates_lookups() -> None:
+    """Tests that registering new pricing updates previously cached lookups."""
+    registry = PricingRegistry()
+    registry.register("openai", {"gpt-4o": {"prompt": 1, "completion": 2}})
+    assert registry.lookup("openai", "gpt-4o-2099-01-01") == {
+        "prompt": 1,
+        "completion": 2,
+    }
+    registry.register("openai", {"gpt-4o-2099-01-01": {"prompt": 5}})
+    assert registry.lookup("openai", "gpt-4o-2099-01-01") == {
+        "prompt": 5,
+        "completion": 2,
+    }
+    registry.register("openai", {"gpt-4o": {"completion": 6}})
+    assert registry.lookup("openai", "gpt-4o") == {"prompt": 1, "completion": 6}
+
+
+def test_pricing_registry_required_keys() -> None:
+    """Tests that models missing a provider's required prices are rejected."""
+    registry = PricingRegistry()
+    registry.register(
+        "openai",
+        {"gpt-4o": {"prompt": 1, "cached": 2, "completion": 3}},
+        required_keys=("prompt", "cached", "completion"),
+    )
+    with pytest.raises(ValueError, match="missing the required prices \\['cached'\\]"):
+        registry.register(
+            "openai",
+            {
+                "gpt-4o": {"prompt": 4},
+                "my-model": {"prompt": 1, "completion": 2},
+            },
+        )
+    assert registry.lookup("openai", "gpt-4o") == {
+        "prompt": 1,
+        "cached": 2,
+        "completion": 3,
+    }
+    assert registry.lookup("openai", "my-model") is None
+    registry.register("openai", {"gpt-4o-2099-01-01": {"completion": 5}})
+    assert registry.lookup("openai", "gpt-4o-2099-01-01") == {
+        "prompt": 1,
+        "cached": 2,
+        "completion": 5,
+    }
+    with pytest.raises(ValueError, match="missing the required prices"):
+        registry.register("openai", {"gpt-4o-ft": {"completion": 5}})
+
+
+def test_pricing_registry_load_file(tmp_path: Path) -> None:
+    """Tests loading pricing overrides from a local file."""
+    path = tmp_path / "pricing.json"
+    path.write_text(json.dumps({"openai": {"my-model": {"prompt": 1}}}))
+    registry = PricingRegistry()
+    registry.load_file(path)
+    assert registry.lookup("openai", "my-model") == {"prompt": 1}
+
+
+def test_pricing_registry_env_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Tests loading pricing overrides from the file set in the environment."""
+    path = tmp_path / "pricing.json"
+    path.write_text(json.dumps({"groq": {"my-model": {"prompt": 1}}}))
+    monkeypatch.setenv("MIRASCOPE_PRICING_FILE", str(path))
+    registry = PricingRegistry()
+    assert registry.lookup("groq", "my-model") == {"prompt": 1}
@@ -8,7 +8,7 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 from pydantic import computed_field
 
-from mirascope.core import BaseMessageParam
+from mirascope.core import BaseDynamicConfig, BaseMessageParam
 from mirascope.core.base.prompt import BasePrompt, metadata, prompt_template
 
 
@@ -137,6 +137,37 @@ def test_base_prompt_run() -> None:
     mock_call_fn.assert_called_once_with(genre="fantasy")
 
 
+def test_base_prompt_run_caches_decorated_fn() -> None:
+    """Tests that `BasePrompt.run` decorates once per prompt class and decorator."""
+    mock_decorator = MagicMock()
+    mock_decorator.return_value.return_value = "response"
+
+    @prompt_template("Recommend a {genre} book.")
+    class BookRecommendationPrompt(BasePrompt):
+        genre: str
+
+    assert BookRecommendationPrompt(genre="fantasy").run(mock_decorator) == "response"
+    assert BookRecommendationPrompt(genre="mystery").run(mock_decorator) == "response"
+    mock_decorator.assert_called_once()
+    assert mock_decorator.return_value.call_args_list == [
+        mock.call(genre="fantasy"),
+        mock.call(genre="mystery"),
+    ]
+
+    @prompt_template("Recommend a {genre} book.")
+    class DynamicMetadataPrompt(BasePrompt):
+        genre: str
+
+        def dynamic_config(self) -> BaseDynamicConfig:
+            return {"metadata": {"tags": {self.genre}}}
+
+    mock_decorator.reset_mock()
+    DynamicMetadataPrompt(genre="fantasy").run(mock_decorator)
+    DynamicMetadataPrompt(genre="mystery").run(mock_decorator)
+    assert mock_decorator.call_count == 2
+    assert mock_decorator.call_args[0][0]._metadata == {"tags": {"mystery"}}
+
+
 @pytest.mark.asyncio
 async def test_base_prompt_run_async() -> None:
     mock_decorator = MagicMock()
@@ -0,0 +1,230 @@
+"""Tests for the `tool_executor` module."""
+
+import asyncio
+import os
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from mirascope.core.base import BaseTool, ToolExecutor
+from mirascope.core.base.tool_executor import (
+    ExecutorType,
+    _process_payload,
+    _run_in_worker,
+)
+
+
+def add(a: int, b: int) -> int:
+    """Adds two numbers.
+
+    Args:
+        a: The first number.
+        b: The second number.
+    """
+    return a + b
+
+
+async def add_async(a: int, b: int) -> int:
+    """Adds two numbers.
+
+    Args:
+        a: The first number.
+        b: The second number.
+    """
+    return a + b
+
+
+def get_pid() -> int:
+    """Returns the process id."""
+    return os.getpid()
+
+
+def sleep(seconds: float) -> str:
+    """Sleeps for the given number of seconds.
+
+    Args:
+        seconds: The number of seconds to sleep.
+    """
+    time.sleep(seconds)
+    return "done"
+
+
+def allocate(size: int) -> int:
+    """Allocates `size` bytes.
+
+    Args:
+        size: The number of bytes to allocate.
+    """
+    return len(bytearray(size))
+
+
+def _tool(fn: Callable, **kwargs: Any) -> BaseTool:  # noqa: ANN401
+    return BaseTool.type_from_fn(fn).model_validate(kwargs)
+
+
+class GetThreadName(BaseTool):
+    """Returns the name of the thread running the tool."""
+
+    def call(self) -> str:
+        return threading.current_thread().name
+
+
+class Multiply(BaseTool):
+    """Multiplies two numbers."""
+
+    a: int
+    b: int
+
+    def call(self, factor: int = 1) -> int:
+        return self.a * self.b * factor
+
+
+def test_tool_executor_inline() -> None:
+    """Tests calling a tool inline."""
+    executor = ToolExecutor()
+    tool = _tool(add, a=1, b=2)
+    assert executor.call(tool) == 3
+    assert executor.call(GetThreadName()) == threading.current_thread().name
+
+
+def test_tool_executor_thread() -> None:
+    """Tests calling a tool in the thread pool."""
+    with ToolExecutor("thread") as executor:
+        assert executor.call(GetThreadName()).startswith("mirascope-tool")
+        assert executor.call(Multiply(a=2, b=3), factor=2) == 12
+    assert executor._thread_pool is None
+
+
+def test_tool_executor_process() -> None:
+    """Tests calling function and class tools in the process pool."""
+    with ToolExecutor("process", max_workers=1) as executor:
+        tool = _tool(get_pid)
+        assert executor.call(tool) != os.getpid()
+        add_tool = _tool(add, a=1, b=2)
+        assert executor.call(add_tool) == 3
+        assert executor.call(Multiply(a=2, b=3)) == 6
+        async_tool = _tool(add_async, a=1, b=2)
+        assert executor.call(async_tool) == 3
+
+
+def test_tool_executor_tool_configs() -> None:
+    """Tests that per-tool configurations override the defaults."""
+    executor = ToolExecutor("thread", timeout=1, tool_configs={"add": {"timeout": 2}})
+    executor.configure("get_pid", executor="process", max_memory=1024)
+    add_tool = _tool(add, a=1, b=2)
+    pid_tool = _tool(get_pid)
+    assert executor.config_for(add_tool) == {"executor": "thread", "timeout": 2}
+    assert executor.config_for(pid_tool) == {
+        "executor": "process",
+        "timeout": 1,
+        "max_memory": 1024,
+    }
+    assert executor.config_for(GetThreadName()) == {"executor": "thread", "timeout": 1}
+
+
+def test_tool_executor_max_memory_requires_process() -> None:
+    """Tests that `max_memory` is rejected for non-process executors."""
+    with pytest.raises(ValueError, match="only supported by the `process` executor"):
+        ToolExecutor("thread", max_memory=1024)
+    executor = ToolExecutor("process", max_memory=1024)
+    with pytest.raises(ValueError, match="only supported by the `process` executor"):
+        executor.configure("add", executor="inline")
+
+
+def test_tool_executor_async_tool_requires_call_async() -> None:
+    """Tests that sync calls of async tools are rejected outside of processes."""
+    tool = _tool(add_async, a=1, b=2)
+    with pytest.raises(ValueError, match="Use `call_async`"):
+        ToolExecutor().call(tool)
+
+
+def test_tool_executor_thread_timeout() -> None:
+    """Tests that thread pool calls are bounded by their timeout."""
+    tool = _tool(sleep, seconds=0.5)
+    with (
+        ToolExecutor("thread", timeout=0.05) as executor,
+        pytest.raises(TimeoutError, match="Tool sleep exceeded its timeout"),
+    ):
+        executor.call(tool)
+
+
+def test_tool_executor_process_timeout_interrupts_worker() -> None:
+    """Tests that the worker process interrupts calls that exceed their timeout."""
+    with pytest.raises(TimeoutError):
+        _run_in_worker(sleep, (), {"seconds": 1}, 0.05, None)
+    assert _run_in_worker(add, (1,), {"b": 2}, 1, None) == 3
+
+
+def test_tool_executor_process_memory_limit() -> None:
+    """Tests that the worker process caps memory for the call."""
+    with ToolExecutor("process", max_workers=1, max_memory=256 * 1024**2) as executor:
+        tool = _tool(allocate, size=1024**3)
+        with pytest.raises(MemoryError):
+            executor.call(tool)
+        tool = _tool(allocate, size=1024)
+        assert executor.call(tool) == 1024
+
+
+def test_process_payload() -> None:
+    """Tests building the picklable payload for process execution."""
+    tool = _tool(add, a=1, b=2)
+    assert _process_payload(tool, (), {}) == (add, (), {"a": 1, "b": 2})
+    assert _process_payload(tool, (3,), {"b": 4}) == (add, (), {"a": 1, "b": 2})
+    multiply = Multiply(a=1, b=2)
+    fn, args, kwargs = _process_payload(multiply, (3,), {})
+    assert fn(*args, **kwargs) == 6
+
+
+@pytest.mark.parametrize("executor_type", ["inline", "thread", "process"])
+def test_tool_executor_rejects_function_tool_arguments(
+    executor_type: ExecutorType,
+) -> None:
+    """Tests that extra arguments for function tools are rejected by every executor."""
+    tool = _tool(add, a=1, b=2)
+    with ToolExecutor(executor_type, max_workers=1) as executor:
+        with pytest.raises(ValueError, match="does not accept additional arguments"):
+            executor.call(tool, 3)
+        with pytest.raises(ValueError, match="does not accept additional arguments"):
+            executor.call(tool, b=3)
+        assert executor._thread_pool is None and executor._process_pool is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("executor_type", ["inline", "thread", "process"])
+async def test_tool_executor_call_async_rejects_function_tool_arguments(
+    executor_type: ExecutorType,
+) -> None:
+    """Tests that extra arguments for function tools are rejected by `call_async`."""
+    tool = _tool(add_async, a=1, b=2)
+    with pytest.raises(ValueError, match="does not accept additional arguments"):
+        await ToolExecutor(executor_type).call_async(tool, 3)
+
+
+@pytest.mark.asyncio
+async def test_tool_executor_call_async() -> None:
+    """Tests calling tools without blocking the event loop."""
+    add_tool = _tool(add, a=1, b=2)
+    async_tool = _tool(add_async, a=1, b=2)
+    assert await ToolExecutor().call_async(add_tool) == 3
+    assert await ToolExecutor().call_async(async_tool) == 3
+    with ToolExecutor("thread") as executor:
+        assert (await executor.call_async(GetThreadName())).startswith("mirascope-tool")
+        assert await executor.call_async(async_tool) == 3
+    with ToolExecutor("process", max_workers=1) as executor:
+        assert await executor.call_async(add_tool) == 3
+        assert await executor.call_async(async_tool) == 3
+
+
+@pytest.mark.asyncio
+async def test_tool_executor_call_async_timeout() -> None:
+    """Tests that async calls are bounded by their timeout."""
+
+    class Sleep(BaseTool):
+        async def call(self) -> None:
+            await asyncio.sleep(1)
+
+    with pytest.raises(TimeoutError, match="Tool Sleep exceeded its timeout"):
+        await ToolExecutor(timeout=0.05).call_async(Sleep())
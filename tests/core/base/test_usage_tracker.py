@@ -0,0 +1,195 @@
+"""Tests the `usage_tracker` module."""
+
+import threading
+from functools import partial
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mirascope.core.base._create import create_factory
+from mirascope.core.base.stream import stream_factory
+from mirascope.core.base.usage_tracker import UsageKey, UsageStats, UsageTracker
+
+
+def test_usage_tracker_record_and_snapshot() -> None:
+    """Tests recording usage and aggregating it into a snapshot."""
+    tracker = UsageTracker()
+    tracker.record(
+        "fn",
+        "openai",
+        "gpt-4o-mini",
+        input_tokens=10,
+        cached_tokens=2,
+        output_tokens=5,
+        cost=0.5,
+        latency_ms=100,
+    )
+    tracker.record("fn", "openai", "gpt-4o-mini", input_tokens=1, output_tokens=1)
+    tracker.record("fn", "openai", "gpt-4o-mini", error=True)
+    tracker.record("other", "anthropic", "claude", error=True)
+    assert tracker.snapshot() == {
+        UsageKey("fn", "openai", "gpt-4o-mini"): UsageStats(
+            calls=2,
+            errors=1,
+            input_tokens=11,
+            cached_tokens=2,
+            output_tokens=6,
+            cost=0.5,
+            latency_ms=100,
+        ),
+        UsageKey("other", "anthropic", "claude"): UsageStats(errors=1),
+    }
+    snapshot = tracker.snapshot()
+    assert tracker.snapshot(reset=True) == snapshot
+    assert tracker.snapshot() == {}
+
+
+def test_usage_tracker_threads() -> None:
+    """Tests that usage recorded from many threads is aggregated."""
+    tracker = UsageTracker()
+
+    def record() -> None:
+        for _ in range(100):
+            tracker.record("fn", "openai", "gpt-4o-mini", output_tokens=1)
+
+    threads = [threading.Thread(target=record) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stats = tracker.snapshot()[UsageKey("fn", "openai", "gpt-4o-mini")]
+    assert stats.calls == 800
+    assert stats.output_tokens == 800
+    tracker.reset()
+    assert tracker.snapshot() == {}
+
+
+def test_usage_tracker_retires_shards_of_exited_threads() -> None:
+    """Tests that the shards of exited threads are folded without losing usage."""
+    tracker = UsageTracker()
+    for _ in range(16):
+        thread = threading.Thread(
+            target=tracker.record, args=("fn", "openai", "gpt-4o-mini")
+        )
+        thread.start()
+        thread.join()
+    assert len(tracker._shards) <= 2
+    assert tracker.snapshot()[UsageKey("fn", "openai", "gpt-4o-mini")].calls == 16
+    assert tracker._shards == [tracker._retired]
+    assert (
+        tracker.snapshot(reset=True)[UsageKey("fn", "openai", "gpt-4o-mini")].calls
+        == 16
+    )
+    assert tracker.snapshot() == {}
+
+
+def test_usage_tracker_record_call() -> None:
+    """Tests recording the usage of a call response."""
+    tracker = UsageTracker()
+    call = MagicMock(
+        _provider="openai",
+        model="gpt-4o-mini",
+        input_tokens=3,
+        cached_tokens=None,
+        output_tokens=4,
+        cost=0.25,
+        start_time=100,
+        end_time=150,
+    )
+    tracker.record_call("fn", call)
+    tracker.record_call("fn", call, latency_ms=10)
+    assert tracker.snapshot() == {
+        UsageKey("fn", "openai", "gpt-4o-mini"): UsageStats(
+            calls=2, input_tokens=6, output_tokens=8, cost=0.5, latency_ms=60
+        )
+    }
+
+
+def test_usage_tracker_enable_disable() -> None:
+    """Tests enabling and disabling the tracker."""
+    tracker = UsageTracker()
+    assert not tracker.enabled
+    tracker.enable()
+    assert tracker.enabled
+    tracker.disable()
+    assert not tracker.enabled
+
+
+@pytest.fixture()
+def mock_usage_tracker() -> MagicMock:
+    """Returns a mock enabled usage tracker."""
+    return MagicMock(enabled=True)
+
+
+def test_create_factory_records_usage(
+    mock_setup_call: MagicMock, mock_usage_tracker: MagicMock
+) -> None:
+    """Tests that `create_factory` records the usage of each call and error."""
+    mock_create = mock_setup_call.return_value[0]
+    TCallResponse = MagicMock(_provider="openai")
+    decorator = create_factory(
+        TCallResponse=TCallResponse,  # pyright: ignore [reportArgumentType]
+        setup_call=mock_setup_call,
+    )
+
+    def fn() -> None: ...
+
+    decorated_fn = decorator(
+        fn,
+        model="model",
+        tools=None,
+        response_model=None,
+        output_parser=None,
+        json_mode=False,
+        client=None,
+        call_params={},
+    )
+    with patch("mirascope.core.base._create.usage_tracker", mock_usage_tracker):
+        output = decorated_fn()
+        mock_usage_tracker.record_call.assert_called_once_with("fn", output)
+        mock_create.side_effect = ValueError()
+        with pytest.raises(ValueError):
+            decorated_fn()
+        mock_usage_tracker.record.assert_called_once_with(
+            "fn", "openai", "model", error=True
+        )
+
+
+def test_stream_factory_records_usage(
+    mock_setup_call: MagicMock, mock_usage_tracker: MagicMock
+) -> None:
+    """Tests that `stream_factory` records usage once the stream is exhausted."""
+    mock_handle_stream = MagicMock(return_value=[("chunk", None)])
+    TStream = MagicMock(_provider="openai")
+    decorator = partial(
+        stream_factory(
+            TCallResponse=MagicMock,
+            TStream=TStream,  # pyright: ignore [reportArgumentType]
+            setup_call=mock_setup_call,
+            handle_stream=mock_handle_stream,
+            handle_stream_async=MagicMock(),
+        ),
+        model="model",
+        tools=None,
+        json_mode=False,
+        client=None,
+        call_params={},
+    )
+
+    def fn() -> None: ...
+
+    decorated_fn = decorator(fn)  # pyright: ignore [reportCallIssue]
+    with patch("mirascope.core.base.stream.usage_tracker", mock_usage_tracker):
+        stream = decorated_fn()
+        generator = TStream.call_args.kwargs["stream"]
+        assert list(generator) == [("chunk", None)]
+        mock_usage_tracker.record_call.assert_called_once()
+        assert mock_usage_tracker.record_call.call_args.args[:2] == ("fn", stream)
+
+        mock_handle_stream.side_effect = ValueError()
+        decorated_fn()
+        with pytest.raises(ValueError):
+            list(TStream.call_args.kwargs["stream"])
+        mock_usage_tracker.record.assert_called_once_with(
+            "fn", "openai", "model", error=True
+        )
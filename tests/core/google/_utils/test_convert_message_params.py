@@ -1,6 +1,7 @@
 """Tests the `google._utils.convert_message_params` function."""
 
 import io
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -15,6 +16,7 @@ from mirascope.core.base import (
     ImageURLPart,
     TextPart,
 )
+from mirascope.core.google._utils import _convert_message_params
 from mirascope.core.google._utils._convert_message_params import convert_message_params
 
 
@@ -668,3 +670,49 @@ async def test_convert_message_in_running_loop():
     """Tests convert_message_params in an async context."""
     result = convert_message_params([], MagicMock())
     assert result == []
+
+
+def test_uploaded_files_reused_across_calls() -> None:
+    """Tests that uploaded files are reused across calls until they expire."""
+    large_video = bytes([1] * (16 * 1024 * 1024))  # 16MB
+    messages: list[BaseMessageParam | ContentDict] = [
+        BaseMessageParam(
+            role="user",
+            content=[
+                AudioPart(type="audio", media_type="audio/wav", audio=large_video)
+            ],
+        ),
+        BaseMessageParam(
+            role="user",
+            content=[
+                AudioPart(type="audio", media_type="audio/wav", audio=large_video)
+            ],
+        ),
+    ]
+    mock_client = MagicMock()
+    mock_client.vertexai = False
+    expiration_time = datetime.now(timezone.utc) + timedelta(hours=2)
+    mock_client.aio.files.upload = AsyncMock(
+        return_value=MagicMock(
+            uri="file://uploaded/audio",
+            mime_type="audio/wav",
+            expiration_time=expiration_time,
+        )
+    )
+    file_part = {
+        "file_data": {"file_uri": "file://uploaded/audio", "mime_type": "audio/wav"}
+    }
+
+    result = convert_message_params(messages, mock_client)
+    assert [message.get("parts") for message in result] == [[file_part], [file_part]]
+    mock_client.aio.files.upload.assert_called_once()
+
+    convert_message_params(messages, mock_client)
+    mock_client.aio.files.upload.assert_called_once()
+
+    expired = datetime.now(timezone.utc) + timedelta(minutes=30)
+    uploaded_files = _convert_message_params._uploaded_files
+    for key, (file_data, _) in list(uploaded_files.items()):
+        uploaded_files[key] = (file_data, expired)
+    convert_message_params(messages, mock_client)
+    assert mock_client.aio.files.upload.call_count == 2
@@ -8,3 +8,4 @@ def test_calculate_cost() -> None:
     assert calculate_cost(None, None, None, model="gpt-4o-mini") is None
     assert calculate_cost(1, None, 1, model="unknown") is None
     assert calculate_cost(1, None, 1, model="gpt-4o-mini") == 0.00000075
+    assert calculate_cost(1, None, 1, model="gpt-4o-mini-2099-01-01") == 0.00000075
@@ -1,5 +1,7 @@
 """Tests the `openai.stream` module."""
 
+from unittest.mock import patch
+
 import pytest
 from openai.types.chat import ChatCompletion, ChatCompletionChunk
 from openai.types.chat.chat_completion import Choice
@@ -117,6 +119,9 @@ def test_openai_stream() -> None:
     for _ in stream:
         pass
     assert stream.cost == 1.25e-05
+    with patch("mirascope.core.openai.stream.calculate_cost") as mock_calculate_cost:
+        assert stream.cost == 1.25e-05
+        mock_calculate_cost.assert_not_called()
 
     format_book = FormatBook.from_tool_call(
         ChatCompletionMessageToolCall(
@@ -53,7 +53,7 @@ class ConcreteResponse(BaseCallResponse[Any, Any, Any, Any, Any, Any, Any]):
     @property
     def output_tokens(self): ...
 
-    @property
+    @cached_property
     def cost(self): ...
 
     @computed_field
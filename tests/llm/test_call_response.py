@@ -76,7 +76,7 @@ class DummyProviderCallResponse(
     @property
     def output_tokens(self) -> int | float | None: ...
 
-    @property
+    @cached_property
     def cost(self) -> float | None: ...
 
     @computed_field
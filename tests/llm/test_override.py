@@ -1,3 +1,4 @@
+from functools import cached_property
 from unittest.mock import patch
 
 import pytest
@@ -33,7 +34,7 @@ class ConcreteMockResponse(BaseCallResponse):
     @property
     def output_tokens(self): ...
 
-    @property
+    @cached_property
     def cost(self): ...
 
     @property
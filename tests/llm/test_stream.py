@@ -69,7 +69,7 @@ class DummyProviderResponse(
     @property
     def output_tokens(self) -> int | float | None: ...
 
-    @property
+    @cached_property
     def cost(self) -> float | None: ...
 
     @computed_field